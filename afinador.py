@@ -0,0 +1,234 @@
+import os
+import re
+import json
+import threading
+
+TUNING_PROFILES_FILE = "tuning_profiles.json"
+
+MIN_HEAP_MB = 1024
+# Memoria que se deja libre para el sistema operativo y el resto de programas
+SYSTEM_RESERVE_MB = 2048
+HEAP_STEP_MB = 256
+MB_PER_MOD = 48
+# Heap = lo que queda vivo después del GC por este factor, para que el GC no trabaje con el heap
+# lleno. Se aprende del live set y no del pico ni del RSS, que crecen con el -Xmx que ya se aplicó.
+LIVE_HEADROOM = 2.0
+
+_GC_FLAG = re.compile(r"^-XX:[+]Use\w*GC$")
+
+
+def system_memory_mb():
+    """Memoria física total en MB, o None si no se puede averiguar."""
+    if os.name == "nt":
+        import ctypes
+
+        class MEMORYSTATUSEX(ctypes.Structure):
+            _fields_ = [
+                ("dwLength", ctypes.c_ulong),
+                ("dwMemoryLoad", ctypes.c_ulong),
+                ("ullTotalPhys", ctypes.c_ulonglong),
+                ("ullAvailPhys", ctypes.c_ulonglong),
+                ("ullTotalPageFile", ctypes.c_ulonglong),
+                ("ullAvailPageFile", ctypes.c_ulonglong),
+                ("ullTotalVirtual", ctypes.c_ulonglong),
+                ("ullAvailVirtual", ctypes.c_ulonglong),
+                ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+            ]
+
+        status = MEMORYSTATUSEX()
+        status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return status.ullTotalPhys // (1024 * 1024)
+
+        return None
+
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // (1024 * 1024)
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def required_java_major(version_id, minecraft_directory):
+    """Versión mayor de Java que pide la versión (o alguna de la que hereda). 8 si no lo dice."""
+    vistos = set()
+
+    while version_id and version_id not in vistos:
+        vistos.add(version_id)
+        json_path = os.path.join(minecraft_directory, "versions", version_id, f"{version_id}.json")
+
+        try:
+            with open(json_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+        except (OSError, json.JSONDecodeError):
+            break
+
+        if "javaVersion" in data:
+            return data["javaVersion"].get("majorVersion", 8)
+
+        version_id = data.get("inheritsFrom")
+
+    return 8
+
+
+def count_mods(minecraft_directory):
+    try:
+        return sum(1 for name in os.listdir(os.path.join(minecraft_directory, "mods")) if name.endswith(".jar"))
+    except OSError:
+        return 0
+
+
+def default_gcs():
+    """
+    Recolectores que se pueden usar sin haber probado el binario: solo G1.
+
+    ZGC y Shenandoah dependen de la plataforma y del build, así que solo se eligen si
+    runtimes_java confirmó que el java arranca con ellos.
+    """
+    return {"G1"}
+
+
+def gc_flags(gc, java_major, experimental=False):
+    """
+    Flags con los que se lanza un recolector. runtimes_java prueba el java con esta misma lista.
+
+    experimental agrega -XX:+UnlockExperimentalVMOptions, que hace falta donde el recolector
+    todavía es experimental (p. ej. ZGC antes de Java 15).
+    """
+    if gc == "ZGC":
+        flags = ["-XX:+UseZGC"]
+
+        if java_major < 23:
+            flags.append("-XX:+ZGenerational")
+
+    elif gc == "Shenandoah":
+        flags = ["-XX:+UseShenandoahGC"]
+
+    else:
+        flags = [
+            "-XX:+UseG1GC",
+            "-XX:+ParallelRefProcEnabled",
+            "-XX:MaxGCPauseMillis=50",
+            "-XX:+DisableExplicitGC",
+        ]
+
+    return (["-XX:+UnlockExperimentalVMOptions"] if experimental else []) + flags
+
+
+def user_sets_gc(jvm_args):
+    return any(_GC_FLAG.match(arg) for arg in jvm_args)
+
+
+def _round_up(mb):
+    return -(-mb // HEAP_STEP_MB) * HEAP_STEP_MB
+
+
+def recommend(total_mb, cores, java_major, mods=0, telemetry=None, supported_gcs=None, max_mb=None, experimental_gcs=None):
+    """
+    Calcula heap, recolector y flags para una versión.
+
+    telemetry es el resumen de telemetria.TelemetryStore.summary(); si hay un live set
+    medido (ocupación después del GC), manda sobre la estimación por cantidad de mods.
+    max_mb es un tope configurado por el usuario, además del que impone la memoria física.
+    experimental_gcs son los recolectores que ese java solo arranca desbloqueando las opciones experimentales.
+    """
+    supported_gcs = supported_gcs if supported_gcs is not None else default_gcs()
+
+    # Estimación inicial: las versiones modernas (Java 17+) usan bastante más memoria
+    heap = (2048 if java_major >= 17 else 1536) + mods * MB_PER_MOD
+    source = "estimate"
+
+    if telemetry and telemetry.get("live_heap_mb"):
+        heap = telemetry["live_heap_mb"] * LIVE_HEADROOM
+        source = "measured_live_set"
+
+    heap = max(MIN_HEAP_MB, _round_up(int(heap)))
+
+    if total_mb:
+        limit = max(MIN_HEAP_MB, min(total_mb // 2, total_mb - SYSTEM_RESERVE_MB))
+        heap = min(heap, limit // HEAP_STEP_MB * HEAP_STEP_MB)
+
+    if max_mb:
+        heap = min(heap, max(MIN_HEAP_MB, int(max_mb)))
+
+    # Los recolectores concurrentes solo compensan con heaps grandes y núcleos de sobra
+    if "ZGC" in supported_gcs and java_major >= 21 and heap >= 6144 and cores >= 8:
+        gc = "ZGC"
+    elif "Shenandoah" in supported_gcs and heap >= 4096 and cores >= 4:
+        gc = "Shenandoah"
+    else:
+        gc = "G1"
+
+    flags = gc_flags(gc, java_major, gc in (experimental_gcs or ()))
+
+    return {
+        "ram_mb": heap,
+        "gc": gc,
+        "gc_flags": flags,
+        "source": source,
+        "inputs": {"total_mb": total_mb, "cores": cores, "java_major": java_major, "mods": mods, "max_mb": max_mb},
+    }
+
+
+class TuningProfiles:
+    """Último perfil recomendado por versión (tuning_profiles.json)."""
+    def __init__(self, app_data_dir):
+        self.path = os.path.join(app_data_dir, TUNING_PROFILES_FILE)
+        self._lock = threading.Lock()
+        self.data = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+        except (json.JSONDecodeError, IOError):
+            return {}
+
+        return data if isinstance(data, dict) else {}
+
+    def get(self, version_id):
+        with self._lock:
+            return self.data.get(version_id)
+
+    def update(self, version_id, minecraft_directory, telemetry=None, supported_gcs=None, java_major=None, max_mb=None,
+               experimental_gcs=None):
+        """
+        Recalcula el perfil de la versión con los datos actuales del sistema y lo guarda.
+
+        java_major, supported_gcs y experimental_gcs son los del java con el que se va a lanzar,
+        si se conoce (supported_gcs solo con recolectores confirmados por runtimes_java).
+        """
+        profile = recommend(
+            system_memory_mb(),
+            os.cpu_count() or 1,
+            java_major or required_java_major(version_id, minecraft_directory),
+            count_mods(minecraft_directory),
+            telemetry,
+            supported_gcs,
+            max_mb,
+            experimental_gcs,
+        )
+
+        with self._lock:
+            if self.data.get(version_id) != profile:
+                self.data[version_id] = profile
+                self._save()
+
+        return profile
+
+    def _save(self):
+        tmp_path = self.path + ".tmp"
+
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.data, f)
+
+            os.replace(tmp_path, self.path)
+
+        except OSError as e:
+            print(f"Error al guardar los perfiles de ajuste: {e}")
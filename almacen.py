@@ -0,0 +1,304 @@
+import os
+import sys
+import json
+import stat
+import shutil
+import time
+import hashlib
+import threading
+
+REFS_FILE = "refs.json"
+
+# ioctl de Linux para clonar un archivo con copy-on-write (btrfs, xfs...)
+FICLONE = 0x40049409
+
+# Solo el contenido que el juego nunca reescribe se comparte por hardlink (mismo inodo que el
+# objeto del almacén). Todo lo demás va por reflink o copia, para que una escritura en el
+# lugar no corrompa el objeto ni las demás instancias que lo usan.
+READ_ONLY_DIRS = (os.path.join("assets", "objects"), "libraries")
+HASH_CHUNK = 64 * 1024
+# Un .tmp más nuevo que esto puede ser un adopt() en curso de otro hilo; no se toca
+TMP_GRACE_SECONDS = 3600
+
+
+def _sha1_of_file(path):
+    h = hashlib.sha1()
+
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            h.update(chunk)
+
+    return h.hexdigest()
+
+
+def _hardlink_safe(path):
+    partes = os.path.normcase(os.path.abspath(path))
+    return any(os.sep + os.path.normcase(d) + os.sep in partes for d in READ_ONLY_DIRS)
+
+
+def _remove(path):
+    """os.remove que también funciona con archivos de solo lectura (en Windows no se pueden borrar)."""
+    try:
+        os.remove(path)
+    except PermissionError:
+        os.chmod(path, stat.S_IMODE(os.stat(path).st_mode) | stat.S_IWUSR)
+        os.remove(path)
+
+
+def _make_read_only(path):
+    try:
+        os.chmod(path, stat.S_IMODE(os.stat(path).st_mode) & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+    except OSError:
+        pass
+
+
+def _reflink(src, dst):
+    """Intenta un reflink (copia copy-on-write). Lanza OSError si el sistema no lo soporta."""
+    if not sys.platform.startswith("linux"):
+        raise OSError("reflink not supported on this platform")
+
+    import fcntl
+
+    with open(src, "rb") as f_src, open(dst, "wb") as f_dst:
+        try:
+            fcntl.ioctl(f_dst.fileno(), FICLONE, f_src.fileno())
+
+        except OSError:
+            f_dst.close()
+            os.remove(dst)
+            raise
+
+
+class ContentStore:
+    """Almacén compartido de assets y librerías, direccionado por SHA-1, con conteo de referencias."""
+    def __init__(self, root):
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        self.refs_path = os.path.join(root, REFS_FILE)
+
+        self._lock = threading.Lock()
+        self._dirty = False
+        # Objetos ya comprobados en esta sesión: sha1 -> (tamaño, mtime) cuando se comprobó
+        self._checked = {}
+
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self.refs = self._load_refs()
+
+    def _load_refs(self):
+        if not os.path.exists(self.refs_path):
+            return {}
+
+        try:
+            with open(self.refs_path, "r", encoding="utf-8") as f:
+                return {sha1: set(paths) for sha1, paths in json.load(f).items()}
+
+        except (json.JSONDecodeError, IOError, AttributeError):
+            return {}
+
+    def save(self):
+        """Guarda las referencias si cambiaron desde la última vez."""
+        with self._lock:
+            if not self._dirty:
+                return
+
+            data = {sha1: sorted(paths) for sha1, paths in self.refs.items()}
+            self._dirty = False
+
+        tmp_path = self.refs_path + ".tmp"
+
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+
+            os.replace(tmp_path, self.refs_path)
+
+        except OSError as e:
+            print(f"Error al guardar las referencias del almacén: {e}")
+
+    def object_path(self, sha1):
+        return os.path.join(self.objects_dir, sha1[:2], sha1)
+
+    def has(self, sha1):
+        return os.path.isfile(self.object_path(sha1))
+
+    def _add_ref(self, sha1, path):
+        with self._lock:
+            self.refs.setdefault(sha1, set()).add(os.path.abspath(path))
+            self._dirty = True
+
+    def verify(self, sha1):
+        """
+        Comprueba que el objeto guardado siga teniendo el hash de su nombre. Si no, lo borra.
+
+        Cada objeto se hashea una vez por sesión, salvo que cambie su tamaño o su mtime.
+        """
+        obj = self.object_path(sha1)
+
+        try:
+            st = os.stat(obj)
+        except OSError:
+            return False
+
+        firma = (st.st_size, st.st_mtime_ns)
+
+        if self._checked.get(sha1) == firma:
+            return True
+
+        if _sha1_of_file(obj) == sha1:
+            self._checked[sha1] = firma
+            return True
+
+        print(f"Objeto del almacén corrupto, se descarta: {obj}")
+        self._checked.pop(sha1, None)
+
+        try:
+            _remove(obj)
+        except OSError:
+            pass
+
+        return False
+
+    def link_into(self, sha1, dest):
+        """
+        Crea dest como reflink, hardlink o (último recurso) copia del objeto guardado.
+
+        Devuelve False si el objeto no pasó la verificación (dest no se toca y hay que descargarlo).
+        """
+        if not self.verify(sha1):
+            return False
+
+        src = self.object_path(sha1)
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+
+        if os.path.lexists(dest):
+            _remove(dest)
+
+        try:
+            _reflink(src, dest)
+        except OSError:
+            try:
+                if not _hardlink_safe(dest):
+                    raise OSError("file may be written by the game")
+
+                os.link(src, dest)
+                # Borrar dest pudo haber quitado el solo lectura del inodo compartido
+                _make_read_only(src)
+            except OSError:
+                # Otro disco, sistema de archivos sin enlaces o archivo escribible: copia normal, sin referencia
+                shutil.copy2(src, dest)
+                os.chmod(dest, stat.S_IMODE(os.stat(dest).st_mode) | stat.S_IWUSR)
+                return True
+
+        self._add_ref(sha1, dest)
+        return True
+
+    def adopt(self, path, sha1):
+        """Guarda en el almacén un archivo ya verificado y deja un enlace (o copia) en su lugar."""
+        obj = self.object_path(sha1)
+
+        if self.has(sha1) and self.link_into(sha1, path):
+            return
+
+        os.makedirs(os.path.dirname(obj), exist_ok=True)
+
+        # La referencia va primero para que gc() nunca vea el objeto como huérfano
+        self._add_ref(sha1, path)
+
+        try:
+            if _hardlink_safe(path):
+                os.link(path, obj)
+            else:
+                # El juego puede escribir en path: el almacén se queda con una copia propia
+                tmp_obj = f"{obj}.{threading.get_ident()}.tmp"
+
+                try:
+                    _reflink(path, tmp_obj)
+                except OSError:
+                    shutil.copy2(path, tmp_obj)
+
+                if os.path.exists(obj):
+                    os.remove(tmp_obj)
+                    raise FileExistsError(obj)
+
+                os.replace(tmp_obj, obj)
+
+            # Los objetos son de solo lectura: un hardlink compartido no se puede reescribir en el lugar
+            _make_read_only(obj)
+
+        except FileExistsError:
+            # Otro hilo lo guardó primero
+            with self._lock:
+                self.refs[sha1].discard(os.path.abspath(path))
+
+            self.link_into(sha1, path)
+
+        except OSError:
+            # El almacén está en otro disco: no se puede compartir este archivo
+            with self._lock:
+                self.refs[sha1].discard(os.path.abspath(path))
+
+    def gc(self):
+        """Borra las referencias a archivos que ya no existen y los objetos sin referencias. Devuelve bytes liberados."""
+        liberados = 0
+
+        with self._lock:
+            refs = {sha1: set(paths) for sha1, paths in self.refs.items()}
+
+        for sha1, paths in refs.items():
+            vivos = {p for p in paths if os.path.isfile(p)}
+
+            with self._lock:
+                # Conservar las referencias que se agregaron mientras se revisaba el disco
+                vivos |= self.refs.get(sha1, set()) - paths
+
+                if vivos != paths:
+                    self._dirty = True
+
+                if vivos:
+                    self.refs[sha1] = vivos
+                    continue
+
+                self.refs.pop(sha1, None)
+
+            obj = self.object_path(sha1)
+
+            try:
+                liberados += os.path.getsize(obj)
+                _remove(obj)
+            except OSError:
+                pass
+
+        # Objetos que quedaron sin ninguna referencia registrada (p. ej. de una descarga interrumpida)
+        with self._lock:
+            referenciados = set(self.refs)
+
+        limite_tmp = time.time() - TMP_GRACE_SECONDS
+
+        for prefix in os.listdir(self.objects_dir):
+            prefix_dir = os.path.join(self.objects_dir, prefix)
+
+            for nombre in os.listdir(prefix_dir):
+                if nombre in referenciados:
+                    continue
+
+                obj = os.path.join(prefix_dir, nombre)
+
+                try:
+                    st = os.stat(obj)
+
+                    # copy2 conserva el mtime del original: ctime refleja cuándo se creó la copia
+                    if nombre.endswith(".tmp") and max(st.st_mtime, st.st_ctime) > limite_tmp:
+                        continue
+
+                    # Un adopt() pudo terminar después de la foto de las referencias
+                    with self._lock:
+                        if nombre in self.refs:
+                            continue
+
+                    _remove(obj)
+                    liberados += st.st_size
+                except OSError:
+                    pass
+
+        self.save()
+        return liberados
@@ -0,0 +1,99 @@
+import os
+import json
+import time
+import threading
+import statistics
+
+STARTUP_TIMINGS_FILE = "startup_timings.json"
+MAX_HISTORY = 20
+
+# Una etapa se marca como regresión si tarda más que este factor sobre la mediana histórica
+REGRESSION_FACTOR = 1.5
+REGRESSION_MIN_MS = 50
+
+
+class StartupTimer:
+    """Mide cuánto tarda cada etapa del arranque, en milisegundos desde que se creó el timer."""
+    def __init__(self):
+        self.inicio = time.perf_counter()
+        self.etapas = {}
+        self._lock = threading.Lock()
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.inicio) * 1000
+
+    def mark(self, nombre):
+        """Registra el momento en que terminó una etapa (ms desde el inicio)."""
+        with self._lock:
+            self.etapas[nombre] = round(self.elapsed_ms(), 1)
+
+    def run_stage(self, nombre, funcion, *args):
+        """Ejecuta funcion(*args) y guarda su duración propia como 'nombre'."""
+        inicio = time.perf_counter()
+
+        try:
+            return funcion(*args)
+
+        finally:
+            with self._lock:
+                self.etapas[nombre] = round((time.perf_counter() - inicio) * 1000, 1)
+
+    def report(self):
+        with self._lock:
+            etapas = dict(self.etapas)
+
+        lineas = [f"  {nombre:<20} {ms:>8.1f} ms" for nombre, ms in etapas.items()]
+        return "Startup timings:\n" + "\n".join(lineas)
+
+
+def load_history(app_data_dir):
+    path = os.path.join(app_data_dir, STARTUP_TIMINGS_FILE)
+
+    if not os.path.exists(path):
+        return []
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            history = json.load(f)
+
+    except (json.JSONDecodeError, IOError):
+        return []
+
+    return history if isinstance(history, list) else []
+
+
+def find_regressions(etapas, history):
+    """Devuelve las etapas que tardaron claramente más que la mediana de arranques anteriores."""
+    regresiones = {}
+
+    for nombre, ms in etapas.items():
+        anteriores = [run[nombre] for run in history if nombre in run]
+
+        if len(anteriores) < 3:
+            continue
+
+        mediana = statistics.median(anteriores)
+
+        if ms > mediana * REGRESSION_FACTOR and ms - mediana > REGRESSION_MIN_MS:
+            regresiones[nombre] = (ms, mediana)
+
+    return regresiones
+
+
+def save_report(timer, app_data_dir):
+    """Imprime el reporte, avisa de regresiones y lo agrega al historial en disco."""
+    history = load_history(app_data_dir)
+
+    print(timer.report())
+
+    for nombre, (ms, mediana) in find_regressions(timer.etapas, history).items():
+        print(f"Regresión de arranque en '{nombre}': {ms:.1f} ms (mediana {mediana:.1f} ms)")
+
+    history.append(dict(timer.etapas, timestamp=time.time()))
+
+    try:
+        with open(os.path.join(app_data_dir, STARTUP_TIMINGS_FILE), "w", encoding="utf-8") as f:
+            json.dump(history[-MAX_HISTORY:], f, indent=4)
+
+    except OSError as e:
+        print(f"Error al guardar los tiempos de arranque: {e}")
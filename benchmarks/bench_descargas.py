@@ -0,0 +1,108 @@
+"""
+Compara descargas secuenciales vs paralelas contra un mirror HTTP local.
+
+Uso:
+    python benchmarks/bench_descargas.py --files 500 --latency-ms 20 --workers 16
+"""
+import os
+import sys
+import time
+import shutil
+import hashlib
+import argparse
+import tempfile
+import threading
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import descargas
+
+
+class MirrorHandler(SimpleHTTPRequestHandler):
+    """Sirve archivos con keep-alive y una latencia fija por petición, como un CDN lejano."""
+    protocol_version = "HTTP/1.1"
+    latency = 0.0
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        super().do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+def crear_mirror(directorio, cantidad, tamano):
+    """Genera archivos aleatorios con la misma estructura que assets/objects."""
+    hashes = []
+
+    for _ in range(cantidad):
+        data = os.urandom(tamano)
+        file_hash = hashlib.sha1(data).hexdigest()
+
+        os.makedirs(os.path.join(directorio, file_hash[:2]), exist_ok=True)
+
+        with open(os.path.join(directorio, file_hash[:2], file_hash), "wb") as f:
+            f.write(data)
+
+        hashes.append(file_hash)
+
+    return hashes
+
+
+def medir(base_url, hashes, destino, workers):
+    shutil.rmtree(destino, ignore_errors=True)
+
+    jobs = [
+        descargas.DownloadJob(f"{base_url}/{h[:2]}/{h}", os.path.join(destino, h[:2], h), h, None)
+        for h in hashes
+    ]
+
+    downloader = descargas.ParallelDownloader(workers=workers)
+    inicio = time.perf_counter()
+
+    try:
+        downloader.download_all(jobs)
+    finally:
+        downloader.close()
+
+    return time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--size", type=int, default=8 * 1024, help="tamaño de cada archivo en bytes")
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--workers", type=int, default=descargas.DEFAULT_WORKERS)
+    args = parser.parse_args()
+
+    temp_dir = tempfile.mkdtemp(prefix="mcl_bench_")
+    mirror_dir = os.path.join(temp_dir, "mirror")
+
+    try:
+        hashes = crear_mirror(mirror_dir, args.files, args.size)
+
+        MirrorHandler.latency = args.latency_ms / 1000
+        server = ThreadingHTTPServer(("127.0.0.1", 0), partial(MirrorHandler, directory=mirror_dir))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        base_url = f"http://127.0.0.1:{server.server_port}"
+
+        secuencial = medir(base_url, hashes, os.path.join(temp_dir, "seq"), 1)
+        paralelo = medir(base_url, hashes, os.path.join(temp_dir, "par"), args.workers)
+
+        server.shutdown()
+
+        print(f"{args.files} files x {args.size} B, {args.latency_ms:.0f} ms latency")
+        print(f"  sequential (1 worker):   {secuencial:7.2f} s")
+        print(f"  parallel ({args.workers} workers): {paralelo:7.2f} s")
+        print(f"  speedup:                 {secuencial / paralelo:7.2f}x")
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import os
+import json
+import time
+import hashlib
+import threading
+
+LAUNCH_CACHE_FILE = "launch_command_cache.json"
+MAX_ENTRIES = 32
+
+
+def version_fingerprint(version_id, minecraft_directory):
+    """Hash del version JSON y de toda su cadena de inheritsFrom. Cambia si cambia cualquiera."""
+    h = hashlib.sha1()
+    visitados = set()
+
+    while version_id and version_id not in visitados:
+        visitados.add(version_id)
+        json_path = os.path.join(minecraft_directory, "versions", version_id, f"{version_id}.json")
+
+        with open(json_path, "rb") as f:
+            raw = f.read()
+
+        h.update(raw)
+        version_id = json.loads(raw).get("inheritsFrom")
+
+    return h.hexdigest()
+
+
+class LaunchCommandCache:
+    """Caché persistente de comandos de lanzamiento ya resueltos (classpath, natives, argumentos)."""
+    def __init__(self, cache_dir, max_entries=MAX_ENTRIES):
+        self.path = os.path.join(cache_dir, LAUNCH_CACHE_FILE)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # Hubo aciertos cuyo "used" todavía no está en disco
+        self._dirty = False
+        self.entries = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+
+        except (json.JSONDecodeError, IOError):
+            return {}
+
+        return entries if isinstance(entries, dict) else {}
+
+    def _save(self):
+        self._dirty = False
+        tmp_path = self.path + ".tmp"
+
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f)
+
+            os.replace(tmp_path, self.path)
+
+        except OSError as e:
+            print(f"Error al guardar el caché de comandos: {e}")
+
+    @staticmethod
+    def make_key(version_id, minecraft_directory, fingerprint, options):
+        """La clave cubre versión, hash de sus JSON y todas las opciones (RAM, JVM args, usuario...)."""
+        raw = json.dumps([version_id, os.path.abspath(minecraft_directory), fingerprint, options], sort_keys=True)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def get_command(self, version_id, minecraft_directory, options, build):
+        """Devuelve el comando en caché o lo construye con build(version_id, minecraft_directory, options)."""
+        fingerprint = version_fingerprint(version_id, minecraft_directory)
+        key = self.make_key(version_id, minecraft_directory, fingerprint, options)
+
+        with self._lock:
+            entry = self.entries.get(key)
+
+        # Si el ejecutable de Java guardado ya no existe (p. ej. se borró el runtime), se reconstruye
+        if entry and (not os.path.isabs(entry["command"][0]) or os.path.exists(entry["command"][0])):
+            with self._lock:
+                # Solo en memoria: lanzar no espera al disco. Se guarda con la próxima escritura o con save()
+                entry["used"] = time.time()
+                self._dirty = True
+
+            return list(entry["command"])
+
+        command = build(version_id, minecraft_directory, options)
+
+        with self._lock:
+            # Las entradas de esta versión con otro hash de JSON ya no sirven
+            for old_key, old in list(self.entries.items()):
+                if old["version"] == version_id and old["fingerprint"] != fingerprint:
+                    del self.entries[old_key]
+
+            self.entries[key] = {
+                "version": version_id,
+                "fingerprint": fingerprint,
+                "command": command,
+                "used": time.time(),
+            }
+
+            while len(self.entries) > self.max_entries:
+                oldest = min(self.entries, key=lambda k: self.entries[k]["used"])
+                del self.entries[oldest]
+
+            self._save()
+
+        return list(command)
+
+    def save(self):
+        """Guarda los "used" de los aciertos pendientes, para que el LRU los respete tras reiniciar."""
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    def invalidate(self, version_id=None):
+        """Borra las entradas de una versión (o todas si version_id es None)."""
+        with self._lock:
+            self.entries = {
+                k: v for k, v in self.entries.items()
+                if version_id is not None and v["version"] != version_id
+            }
+            self._save()
@@ -0,0 +1,301 @@
+import os
+import re
+import json
+import sqlite3
+import threading
+
+CATALOG_FILE = "mod_catalog.db"
+SEARCH_LIMIT = 20
+IMPORT_BATCH = 5000
+
+KNOWN_LOADERS = ("neoforge", "forge", "fabric", "quilt")
+# Peso del nombre frente a la descripción en el ranking bm25
+NAME_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 1.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mods (
+    id INTEGER PRIMARY KEY,
+    slug TEXT UNIQUE NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    url TEXT NOT NULL DEFAULT '',
+    downloads INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS mod_compat (
+    loader TEXT NOT NULL,
+    game_version TEXT NOT NULL,
+    mod_id INTEGER NOT NULL,
+    PRIMARY KEY (loader, game_version, mod_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS mod_compat_by_mod ON mod_compat (mod_id);
+CREATE INDEX IF NOT EXISTS mods_by_name ON mods (name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS mods_by_url ON mods (url);
+CREATE VIRTUAL TABLE IF NOT EXISTS mods_fts USING fts5(
+    name, description, content='mods', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+"""
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+_GAME_VERSION = re.compile(r"\b1\.\d+(?:\.\d+)?\b")
+
+
+def loader_and_version_from_id(version_id):
+    """"fabric-loader-0.15.7-1.20.1" -> ("fabric", "1.20.1"); "1.20.1" -> (None, "1.20.1")."""
+    lowered = (version_id or "").lower()
+    loader = next((name for name in KNOWN_LOADERS if name in lowered), None)
+    versions = _GAME_VERSION.findall(lowered)
+    return loader, versions[-1] if versions else None
+
+
+def _version_key(version):
+    """"1.20.1" -> (1, 20, 1), para que "1.20.1" quede por encima de "1.9"."""
+    return tuple(int(n) for n in re.findall(r"\d+", version))
+
+
+def _fts_query(text):
+    """Texto libre del usuario -> consulta FTS5: cada palabra como prefijo, unidas con OR (bm25 ordena)."""
+    words = [w for w in _WORD.findall(text.lower()) if len(w) > 1]
+    return " OR ".join(f'"{w}"*' for w in words)
+
+
+def _normalize_record(record):
+    """Acepta volcados con el formato de Modrinth (slug/title/categories/versions) o el de las sugerencias."""
+    slug = record.get("slug") or record.get("project_id") or record.get("id") or record.get("name")
+    name = record.get("title") or record.get("name")
+
+    if not slug or not name:
+        return None
+
+    loaders = record.get("loaders") or [c for c in record.get("categories", []) if c in KNOWN_LOADERS]
+
+    if isinstance(loaders, str):
+        loaders = [loaders]
+
+    versions = record.get("game_versions") or record.get("versions") or []
+
+    if isinstance(versions, str):
+        versions = [versions]
+
+    url = record.get("url") or f"https://modrinth.com/mod/{slug}"
+
+    return {
+        "slug": str(slug),
+        "name": name,
+        "description": record.get("description", "") or "",
+        "url": url,
+        "downloads": int(record.get("downloads", 0) or 0),
+        "loaders": [l.lower() for l in loaders],
+        "versions": versions,
+    }
+
+
+def _read_dump(path):
+    """Un volcado es un array JSON o un objeto por línea (JSON Lines). Los "hits" de la API de búsqueda también sirven."""
+    with open(path, "r", encoding="utf-8") as f:
+        head = f.read(1)
+        f.seek(0)
+
+        if head and head in "[{":
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError:
+                f.seek(0)
+                data = None
+
+            if data is not None:
+                if isinstance(data, dict):
+                    data = data.get("hits", [data])
+
+                yield from data
+                return
+
+        for line in f:
+            line = line.strip()
+
+            if line:
+                yield json.loads(line)
+
+
+class ModCatalog:
+    """Catálogo local de mods en SQLite con búsqueda de texto completo (FTS5)."""
+    def __init__(self, cache_dir):
+        self.path = os.path.join(cache_dir, CATALOG_FILE)
+        self._lock = threading.Lock()
+        self._import_lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        # Con WAL las búsquedas siguen leyendo mientras otra conexión reconstruye el índice
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM mods").fetchone()[0]
+
+    def import_records(self, records):
+        """
+        Carga (o actualiza) muchos mods de una vez. Devuelve cuántos se importaron.
+
+        La importación usa su propia conexión y confirma cada lote por separado: con WAL
+        las búsquedas de la UI siguen leyendo mientras tanto, sin esperar ningún lock. Los
+        mods nuevos aparecen en las búsquedas cuando termina la reconstrucción del índice.
+        """
+        total = 0
+
+        with self._import_lock:
+            conn = sqlite3.connect(self.path)
+
+            try:
+                lote = []
+
+                for record in records:
+                    normalized = _normalize_record(record)
+
+                    if normalized is not None:
+                        lote.append(normalized)
+
+                    if len(lote) >= IMPORT_BATCH:
+                        with conn:
+                            total += self._insert_batch(conn, lote)
+
+                        lote = []
+
+                if lote:
+                    with conn:
+                        total += self._insert_batch(conn, lote)
+
+                # El índice de texto se reconstruye una sola vez al final: mucho más rápido que fila por fila
+                with conn:
+                    conn.execute("INSERT INTO mods_fts(mods_fts) VALUES ('rebuild')")
+
+                conn.execute("INSERT INTO mods_fts(mods_fts) VALUES ('optimize')")
+                conn.commit()
+
+            finally:
+                conn.close()
+
+        return total
+
+    @staticmethod
+    def _insert_batch(conn, lote):
+        conn.executemany(
+            """
+            INSERT INTO mods (slug, name, description, url, downloads) VALUES (:slug, :name, :description, :url, :downloads)
+            ON CONFLICT(slug) DO UPDATE SET
+                name = excluded.name, description = excluded.description,
+                url = excluded.url, downloads = excluded.downloads
+            """,
+            lote,
+        )
+
+        ids = dict(conn.execute(
+            f"SELECT slug, id FROM mods WHERE slug IN ({','.join('?' * len(lote))})",
+            [m["slug"] for m in lote],
+        ))
+
+        conn.executemany("DELETE FROM mod_compat WHERE mod_id = ?", [(ids[m["slug"]],) for m in lote])
+        conn.executemany(
+            "INSERT OR IGNORE INTO mod_compat (loader, game_version, mod_id) VALUES (?, ?, ?)",
+            [
+                (loader, version, ids[m["slug"]])
+                for m in lote
+                for loader in (m["loaders"] or ["any"])
+                for version in (m["versions"] or ["any"])
+            ],
+        )
+
+        return len(lote)
+
+    def import_dump(self, path):
+        return self.import_records(_read_dump(path))
+
+    def search(self, text, loader=None, game_version=None, limit=SEARCH_LIMIT):
+        """
+        Busca mods por texto, ordenados por relevancia (bm25) y después por descargas.
+
+        Devuelve dicts con las mismas claves que las sugerencias de la IA.
+        """
+        query = _fts_query(text)
+
+        if not query:
+            return []
+
+        filtros = []
+        params = [query]
+
+        if loader:
+            filtros.append("c.loader IN (?, 'any')")
+            params.append(loader)
+
+        if game_version:
+            filtros.append("c.game_version IN (?, 'any')")
+            params.append(game_version)
+
+        compat = ""
+
+        if filtros:
+            compat = f"AND EXISTS (SELECT 1 FROM mod_compat c WHERE c.mod_id = m.id AND {' AND '.join(filtros)})"
+
+        params.append(limit)
+
+        sql = f"""
+            SELECT m.id, m.name, m.description, m.url
+            FROM mods_fts
+            JOIN mods m ON m.id = mods_fts.rowid
+            WHERE mods_fts MATCH ? {compat}
+            ORDER BY bm25(mods_fts, {NAME_WEIGHT}, {DESCRIPTION_WEIGHT}), m.downloads DESC
+            LIMIT ?
+        """
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+            return [
+                {
+                    "name": name,
+                    "description": description,
+                    "url": url,
+                    "loader": loader or self._first_value(mod_id, "loader"),
+                    "version": game_version or self._first_value(mod_id, "game_version"),
+                }
+                for mod_id, name, description, url in rows
+            ]
+
+    def _first_value(self, mod_id, column):
+        """El loader o la versión del juego más nueva de un mod (las versiones se comparan como números)."""
+        values = [
+            row[0]
+            for row in self._conn.execute(
+                f"SELECT DISTINCT {column} FROM mod_compat WHERE mod_id = ? AND {column} != 'any'",
+                (mod_id,),
+            )
+        ]
+
+        if not values:
+            return "N/A"
+
+        if column == "game_version":
+            return max(values, key=_version_key)
+
+        return max(values)
+
+    def verify(self, mod):
+        """
+        Compara una sugerencia de la IA con el catálogo (por URL o por nombre exacto).
+
+        Devuelve una copia con "verified" y, si el mod existe, la URL real del catálogo.
+        """
+        checked = dict(mod)
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url FROM mods WHERE url = ? OR name = ? COLLATE NOCASE ORDER BY downloads DESC LIMIT 1",
+                (mod.get("url") or "", mod.get("name") or ""),
+            ).fetchone()
+
+        checked["verified"] = row is not None
+
+        if row is not None:
+            checked["url"] = row[0]
+
+        return checked
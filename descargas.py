@@ -0,0 +1,558 @@
+import os
+import json
+import time
+import hashlib
+import platform
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+ASSETS_URL = "https://resources.download.minecraft.net"
+
+DEFAULT_WORKERS = 8
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+CHUNK_SIZE = 64 * 1024
+TIMEOUT = 30
+
+# Archivos más chicos que esto se vuelven a bajar enteros en vez de reanudarse
+RESUME_MIN_SIZE = 1024 * 1024
+# El diario se guarda a disco como mucho cada este número de segundos mientras se descarga
+JOURNAL_FLUSH_INTERVAL = 2.0
+
+DownloadJob = namedtuple("DownloadJob", ["url", "path", "sha1", "size"])
+
+
+class ChecksumError(Exception):
+    """El archivo descargado no coincide con el SHA-1 esperado."""
+
+
+def sha1_of_file(path):
+    h = hashlib.sha1()
+
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            h.update(chunk)
+
+    return h.hexdigest()
+
+
+def is_file_valid(path, sha1=None, size=None):
+    """Comprueba si un archivo ya existe con el tamaño y hash esperados."""
+    if not os.path.isfile(path):
+        return False
+
+    if size is not None and os.path.getsize(path) != size:
+        return False
+
+    if sha1 is None:
+        return True
+
+    return sha1_of_file(path) == sha1
+
+
+class DownloadJournal:
+    """
+    Diario persistente de descargas.
+
+    Guarda qué archivos ya se verificaron (para no volver a calcular su hash si no
+    cambiaron), qué descargas grandes quedaron a medias (para reanudarlas con Range)
+    y qué instalaciones empezaron pero no terminaron.
+
+    Los archivos verificados se agrupan por instalación (directorio + versión) y solo
+    sirven para retomar esa instalación: se borran cuando termina.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_flush = 0.0
+
+        data = self._load()
+        self.verified = data.get("verified", {})
+        self.partial = data.get("partial", {})
+        self.installs = data.get("installs", {})
+
+        # Solo se conservan las verificaciones de instalaciones que quedaron a medias
+        pendientes = {
+            self.session_key(version_id, directorio)
+            for directorio, versiones in self.installs.items()
+            for version_id in versiones
+        }
+
+        self.verified = {
+            sesion: archivos
+            for sesion, archivos in self.verified.items()
+            if sesion in pendientes and isinstance(archivos, dict)
+        }
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+        except (json.JSONDecodeError, IOError):
+            return {}
+
+        return data if isinstance(data, dict) else {}
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+
+            data = {
+                "verified": {sesion: dict(archivos) for sesion, archivos in self.verified.items()},
+                "partial": dict(self.partial),
+                "installs": {directorio: list(versiones) for directorio, versiones in self.installs.items()},
+            }
+            self._dirty = False
+            self._last_flush = time.monotonic()
+
+        tmp_path = self.path + ".tmp"
+
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+
+            os.replace(tmp_path, self.path)
+
+        except OSError as e:
+            print(f"Error al guardar el diario de descargas: {e}")
+
+    def _changed(self, flush=False):
+        with self._lock:
+            self._dirty = True
+            due = flush or time.monotonic() - self._last_flush > JOURNAL_FLUSH_INTERVAL
+
+        if due:
+            self.save()
+
+    @staticmethod
+    def session_key(version_id, minecraft_directory):
+        return f"{os.path.abspath(minecraft_directory)}|{version_id}"
+
+    def is_verified(self, job, session):
+        """True si el archivo ya se verificó en esta instalación y no cambió desde entonces (mismo tamaño y mtime)."""
+        path = os.path.abspath(job.path)
+        entry = self.verified.get(session, {}).get(path)
+
+        if entry is None or entry[0] != job.sha1:
+            return False
+
+        try:
+            st = os.stat(job.path)
+        except OSError:
+            # El archivo ya no existe: la entrada no sirve más
+            with self._lock:
+                self.verified.get(session, {}).pop(path, None)
+
+            self._changed()
+            return False
+
+        return [st.st_size, st.st_mtime_ns] == entry[1:]
+
+    def mark_verified(self, job, session):
+        try:
+            st = os.stat(job.path)
+        except OSError:
+            return
+
+        with self._lock:
+            if session is not None:
+                self.verified.setdefault(session, {})[os.path.abspath(job.path)] = [job.sha1, st.st_size, st.st_mtime_ns]
+
+            self.partial.pop(os.path.abspath(job.path), None)
+
+        self._changed()
+
+    def start_partial(self, job):
+        with self._lock:
+            self.partial[os.path.abspath(job.path)] = {"url": job.url, "sha1": job.sha1}
+
+        # Se guarda ya: si el proceso muere, al reiniciar hay que saber qué es este .part
+        self._changed(flush=True)
+
+    def drop_partial(self, job):
+        with self._lock:
+            self.partial.pop(os.path.abspath(job.path), None)
+
+        self._changed()
+
+    def resume_offset(self, job, part_path):
+        """Bytes ya descargados de job que se pueden reanudar, 0 si hay que empezar de nuevo."""
+        entry = self.partial.get(os.path.abspath(job.path))
+
+        if entry != {"url": job.url, "sha1": job.sha1}:
+            return 0
+
+        try:
+            return os.path.getsize(part_path)
+        except OSError:
+            return 0
+
+    def begin_install(self, version_id, minecraft_directory):
+        with self._lock:
+            pendientes = self.installs.setdefault(os.path.abspath(minecraft_directory), [])
+
+            if version_id not in pendientes:
+                pendientes.append(version_id)
+
+        self._changed(flush=True)
+
+    def finish_install(self, version_id, minecraft_directory):
+        with self._lock:
+            pendientes = self.installs.get(os.path.abspath(minecraft_directory), [])
+
+            if version_id in pendientes:
+                pendientes.remove(version_id)
+
+            if not pendientes:
+                self.installs.pop(os.path.abspath(minecraft_directory), None)
+
+            # Terminada la instalación, sus verificaciones ya no hacen falta
+            self.verified.pop(self.session_key(version_id, minecraft_directory), None)
+
+        self._changed(flush=True)
+
+    def incomplete_installs(self, minecraft_directory):
+        """IDs de versiones cuya instalación empezó en este directorio pero nunca terminó."""
+        return set(self.installs.get(os.path.abspath(minecraft_directory), []))
+
+
+class ParallelDownloader:
+    """Descarga muchos archivos en paralelo con un pool de conexiones keep-alive acotado."""
+    def __init__(self, workers=DEFAULT_WORKERS, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF, store=None, journal=None,
+                 journal_session=None):
+        self.workers = max(1, workers)
+        self.retries = retries
+        self.backoff = backoff
+        # Almacén compartido opcional (almacen.ContentStore) para no repetir archivos entre directorios
+        self.store = store
+        # Diario opcional (DownloadJournal) para reanudar descargas y saltar archivos ya verificados
+        self.journal = journal
+        # Instalación a la que pertenecen las verificaciones del diario (DownloadJournal.session_key)
+        self.journal_session = journal_session
+
+        # requests se importa recién acá: cargarlo cuesta y solo hace falta al descargar
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        # Una sola sesión compartida: requests reutiliza las conexiones por host
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.workers)
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+
+    def close(self):
+        self.http.close()
+
+    def _fetch(self, job):
+        """Descarga un archivo verificando el SHA-1 mientras llegan los bytes, reanudando si se puede."""
+        os.makedirs(os.path.dirname(job.path), exist_ok=True)
+        tmp_path = job.path + ".part"
+        h = hashlib.sha1()
+
+        # Sin SHA-1 no hay forma de comprobar un .part reanudado, así que esos no se reanudan
+        resumable = (
+            self.journal is not None
+            and job.sha1 is not None
+            and (job.size is None or job.size >= RESUME_MIN_SIZE)
+        )
+        offset = self.journal.resume_offset(job, tmp_path) if resumable else 0
+
+        if offset:
+            # El hash hay que alimentarlo con lo que ya estaba en disco
+            with open(tmp_path, "rb") as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                    h.update(chunk)
+
+        elif resumable:
+            self.journal.start_partial(job)
+
+        if job.size is None or offset < job.size:
+            headers = {"Range": f"bytes={offset}-"} if offset else {}
+
+            try:
+                with self.http.get(job.url, stream=True, timeout=TIMEOUT, headers=headers) as r:
+                    r.raise_for_status()
+
+                    # El servidor ignoró el Range: se empieza de cero
+                    if offset and r.status_code != 206:
+                        offset = 0
+                        h = hashlib.sha1()
+
+                    with open(tmp_path, "ab" if offset else "wb") as f:
+                        for chunk in r.iter_content(CHUNK_SIZE):
+                            f.write(chunk)
+                            h.update(chunk)
+
+            except BaseException:
+                # Un .part que no se va a reanudar no sirve para nada: no se deja tirado
+                if not resumable and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+                raise
+
+        if job.sha1 is not None and h.hexdigest() != job.sha1:
+            os.remove(tmp_path)
+
+            if resumable:
+                self.journal.drop_partial(job)
+
+            raise ChecksumError(f"{job.url}: expected {job.sha1}, got {h.hexdigest()}")
+
+        os.replace(tmp_path, job.path)
+
+    def download(self, job):
+        """Descarga un trabajo con reintentos y backoff exponencial. Devuelve True si bajó algo."""
+        import requests
+
+        shared = self.store is not None and job.sha1 is not None
+        journaled = self.journal is not None and job.sha1 is not None
+
+        if journaled and self.journal.is_verified(job, self.journal_session):
+            return False
+
+        if is_file_valid(job.path, job.sha1, job.size):
+            if shared and not self.store.has(job.sha1):
+                self.store.adopt(job.path, job.sha1)
+
+            if journaled:
+                self.journal.mark_verified(job, self.journal_session)
+
+            return False
+
+        # link_into vuelve a verificar el objeto; si estaba corrupto se descarta y se descarga de nuevo
+        if shared and self.store.has(job.sha1) and self.store.link_into(job.sha1, job.path):
+            if journaled:
+                self.journal.mark_verified(job, self.journal_session)
+
+            return False
+
+        for intento in range(self.retries + 1):
+            try:
+                self._fetch(job)
+
+                if shared:
+                    self.store.adopt(job.path, job.sha1)
+
+                if journaled:
+                    self.journal.mark_verified(job, self.journal_session)
+
+                return True
+
+            except (requests.RequestException, ChecksumError, OSError):
+                if intento == self.retries:
+                    raise
+
+                time.sleep(self.backoff * (2 ** intento))
+
+        return False
+
+    @staticmethod
+    def _unique_jobs(jobs):
+        """
+        Un trabajo por archivo destino. Dos trabajos con el mismo path (p. ej. una librería que
+        aparece como artifact y como native) escribirían el mismo .part a la vez.
+        """
+        por_path = {}
+
+        for job in jobs:
+            clave = os.path.normcase(os.path.abspath(job.path))
+            anterior = por_path.get(clave)
+
+            # Si uno de los dos trae SHA-1, se queda ese: así el archivo se verifica
+            if anterior is None or (anterior.sha1 is None and job.sha1 is not None):
+                por_path[clave] = job
+
+        return list(por_path.values())
+
+    def download_all(self, jobs, on_progress=None):
+        """Descarga todos los trabajos. on_progress(hechos, total) se llama desde los hilos de trabajo."""
+        jobs = self._unique_jobs(jobs)
+        total = len(jobs)
+        hechos = 0
+        lock = threading.Lock()
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="descarga") as executor:
+            futures = [executor.submit(self.download, job) for job in jobs]
+
+            try:
+                for future in as_completed(futures):
+                    future.result()
+
+                    with lock:
+                        hechos += 1
+
+                    if on_progress:
+                        on_progress(hechos, total)
+
+            except BaseException:
+                # Si algo falla (o se cancela) no seguimos bajando el resto
+                for future in futures:
+                    future.cancel()
+
+                raise
+
+            finally:
+                if self.store is not None:
+                    self.store.save()
+
+                if self.journal is not None:
+                    self.journal.save()
+
+
+def os_name():
+    return {"Windows": "windows", "Darwin": "osx"}.get(platform.system(), "linux")
+
+
+def library_allowed(library):
+    """Evalúa las reglas de sistema operativo de una librería del version JSON."""
+    # Con reglas, una librería solo se permite si alguna regla que aplica lo dice
+    allowed = "rules" not in library
+
+    for rule in library.get("rules", []):
+        os_rule = rule.get("os", {})
+
+        if "name" in os_rule and os_rule["name"] != os_name():
+            continue
+
+        allowed = rule["action"] == "allow"
+
+    return allowed
+
+
+def _library_jobs(version_data, minecraft_directory):
+    libraries_dir = os.path.join(minecraft_directory, "libraries")
+    arch = "32" if platform.architecture()[0] == "32bit" else "64"
+
+    for library in version_data.get("libraries", []):
+        if not library_allowed(library):
+            continue
+
+        downloads = library.get("downloads", {})
+        artifacts = []
+
+        if downloads.get("artifact", {}).get("url"):
+            artifacts.append(downloads["artifact"])
+
+        native = library.get("natives", {}).get(os_name())
+
+        if native:
+            classifier = downloads.get("classifiers", {}).get(native.replace("${arch}", arch))
+
+            if classifier:
+                artifacts.append(classifier)
+
+        for artifact in artifacts:
+            if "path" not in artifact:
+                continue
+
+            yield DownloadJob(
+                artifact["url"],
+                os.path.join(libraries_dir, artifact["path"]),
+                artifact.get("sha1"),
+                artifact.get("size"),
+            )
+
+
+def _asset_jobs(asset_index, minecraft_directory):
+    objects_dir = os.path.join(minecraft_directory, "assets", "objects")
+    seen = set()
+
+    for obj in asset_index.get("objects", {}).values():
+        file_hash = obj["hash"]
+
+        if file_hash in seen:
+            continue
+
+        seen.add(file_hash)
+
+        yield DownloadJob(
+            f"{ASSETS_URL}/{file_hash[:2]}/{file_hash}",
+            os.path.join(objects_dir, file_hash[:2], file_hash),
+            file_hash,
+            obj.get("size"),
+        )
+
+
+def _load_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def collect_version_jobs(downloader, version_id, minecraft_directory, manifest_entry=None):
+    """
+    Descarga el version JSON y el índice de assets de una versión (y de su padre si
+    usa inheritsFrom) y devuelve la lista de librerías, assets y client jar a bajar.
+    """
+    version_path = os.path.join(minecraft_directory, "versions", version_id, f"{version_id}.json")
+
+    if manifest_entry is not None:
+        downloader.download(DownloadJob(manifest_entry["url"], version_path, manifest_entry.get("sha1"), None))
+
+    version_data = _load_json(version_path)
+    jobs = list(_library_jobs(version_data, minecraft_directory))
+
+    if "inheritsFrom" in version_data:
+        parent_id = version_data["inheritsFrom"]
+        parent_path = os.path.join(minecraft_directory, "versions", parent_id, f"{parent_id}.json")
+
+        if os.path.isfile(parent_path):
+            jobs.extend(collect_version_jobs(downloader, parent_id, minecraft_directory))
+
+    if "assetIndex" in version_data:
+        index = version_data["assetIndex"]
+        index_path = os.path.join(minecraft_directory, "assets", "indexes", f"{version_data['assets']}.json")
+
+        downloader.download(DownloadJob(index["url"], index_path, index.get("sha1"), index.get("size")))
+        jobs.extend(_asset_jobs(_load_json(index_path), minecraft_directory))
+
+    client = version_data.get("downloads", {}).get("client")
+
+    if client:
+        jobs.append(DownloadJob(
+            client["url"],
+            os.path.join(minecraft_directory, "versions", version_id, f"{version_id}.jar"),
+            client.get("sha1"),
+            client.get("size"),
+        ))
+
+    return jobs
+
+
+def prefetch_version(version_id, minecraft_directory, manifest_entry=None, workers=DEFAULT_WORKERS, callback=None, store=None,
+                     journal=None):
+    """
+    Baja en paralelo todo lo que install_minecraft_version necesitaría bajar en serie.
+
+    callback usa el mismo formato que minecraft_launcher_lib (setStatus/setMax/setProgress),
+    así que un callback que lance una excepción también corta la descarga.
+    """
+    callback = callback or {}
+    set_status = callback.get("setStatus", lambda _: None)
+    set_max = callback.get("setMax", lambda _: None)
+    set_progress = callback.get("setProgress", lambda _: None)
+
+    downloader = ParallelDownloader(
+        workers=workers,
+        store=store,
+        journal=journal,
+        journal_session=DownloadJournal.session_key(version_id, minecraft_directory),
+    )
+
+    try:
+        set_status("Resolving files")
+        jobs = collect_version_jobs(downloader, version_id, minecraft_directory, manifest_entry)
+
+        set_status(f"Downloading {len(jobs)} files")
+        set_max(len(jobs))
+
+        downloader.download_all(jobs, on_progress=lambda hechos, total: set_progress(hechos))
+
+    finally:
+        downloader.close()
@@ -0,0 +1,85 @@
+import queue
+import threading
+import tkinter
+
+EVENTO_DESPERTAR = "<<DespachadorTrabajo>>"
+
+
+def _tcl_con_hilos(root):
+    """True si el Tcl de este Python se compiló con hilos (event_generate es seguro desde otros hilos)."""
+    try:
+        return root.tk.eval("expr {[info exists tcl_platform(threaded)] && $tcl_platform(threaded)}") == "1"
+    except tkinter.TclError:
+        return False
+
+
+class Despachador:
+    """
+    Punto único por el que los hilos de fondo mandan trabajo al hilo de Tk.
+
+    No hay sondeo: el primer post() sobre una cola vacía despierta al bucle de Tk con
+    un evento virtual y el hilo de la UI vacía la cola por lotes. Sin trabajo, no hay
+    ningún temporizador corriendo.
+    """
+    def __init__(self, root, intervalo_ms=50, max_por_lote=50):
+        self.root = root
+        self.intervalo_ms = intervalo_ms
+        self.max_por_lote = max_por_lote
+        self._cola = queue.Queue()
+        self._lock = threading.Lock()
+        # Hay un despertar pedido (o un lote en curso) que todavía no vació la cola.
+        # Empieza en True: hasta que arranca mainloop() no se puede despertar a Tk desde otros hilos
+        self._pendiente = True
+
+        self._con_hilos = _tcl_con_hilos(root)
+
+        if self._con_hilos:
+            self.root.bind(EVENTO_DESPERTAR, lambda event: self._drenar(), add="+")
+
+    def activar(self):
+        """Llamar justo antes de mainloop(): lo encolado hasta ahora se procesa en cuanto el bucle arranca."""
+        self.root.after_idle(self._drenar)
+
+    def post(self, callback, *args):
+        """Encola callback(*args) para ejecutarlo en el hilo de la UI. Se puede llamar desde cualquier hilo."""
+        self._cola.put((callback, args))
+
+        with self._lock:
+            if self._pendiente:
+                return
+
+            self._pendiente = True
+
+        try:
+            self.root.event_generate(EVENTO_DESPERTAR, when="tail")
+        except (tkinter.TclError, RuntimeError):
+            # La ventana ya se cerró: no hay a quién despertar
+            pass
+
+    def _procesar_lote(self):
+        for _ in range(self.max_por_lote):
+            try:
+                callback, args = self._cola.get_nowait()
+            except queue.Empty:
+                return
+
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"Error en un callback del despachador: {e}")
+
+    def _drenar(self):
+        self._procesar_lote()
+
+        if not self._con_hilos:
+            # Tcl sin hilos: event_generate no es seguro fuera del hilo de Tk, se vuelve al sondeo
+            self.root.after(self.intervalo_ms, self._drenar)
+            return
+
+        with self._lock:
+            if self._cola.empty():
+                self._pendiente = False
+                return
+
+        # Queda trabajo: el siguiente lote va después de que Tk procese sus propios eventos
+        self.root.after(0, self._drenar)
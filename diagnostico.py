@@ -0,0 +1,189 @@
+import os
+import re
+import glob
+import threading
+
+CHUNK_SIZE = 8 * 1024 * 1024
+
+# (clave, anclas, patrón, consejo). Las anclas son textos fijos que siempre aparecen en la
+# línea: se buscan con str.find (muy rápido) y el patrón solo se prueba en esas líneas.
+SIGNATURES = [
+    (
+        "out_of_memory",
+        ("OutOfMemoryError", "Could not reserve enough space"),
+        r"java\.lang\.OutOfMemoryError.*|Could not reserve enough space for .*heap",
+        "The game ran out of memory. Give it more RAM (or enable auto-tune).",
+    ),
+    (
+        "wrong_java",
+        ("UnsupportedClassVersionError", "Unsupported class file major version", "AppClassLoader cannot be cast"),
+        r"UnsupportedClassVersionError.*|Unsupported class file major version \d+"
+        r"|AppClassLoader cannot be cast to class java\.net\.URLClassLoader",
+        "Wrong Java version for this game/modloader. Pick the Java it requires in the version profile.",
+    ),
+    (
+        "missing_dependency",
+        ("which is missing", "Missing or unsupported mandatory dependencies", "Missing mod dependencies"),
+        r"requires (?:version .*? of |any version of )?'?[\w.-]+'?,? which is missing.*"
+        r"|Missing or unsupported mandatory dependencies.*"
+        r"|Missing mod dependencies.*",
+        "A mod is missing a required dependency. Install it or remove the mod.",
+    ),
+    (
+        "duplicate_mods",
+        ("uplicate mods", "DuplicateModsFoundException"),
+        r"(?:Found|Duplicate) (?:duplicate )?mods.*|DuplicateModsFoundException.*",
+        "The same mod is installed twice. Remove one of the copies from the mods folder.",
+    ),
+    (
+        "mixin_failure",
+        ("Mixin apply for mod", "MixinApplyError"),
+        r"Mixin apply for mod [\w.-]+ failed.*|MixinApplyError.*",
+        "A mod failed to patch the game (mixin error). It is probably incompatible with this version or another mod.",
+    ),
+    (
+        "invalid_jvm_option",
+        ("Unrecognized VM option", "Invalid maximum heap size", "Unrecognized option:"),
+        r"Unrecognized VM option '[^']*'|Invalid maximum heap size.*|Unrecognized option: .*",
+        "The JVM rejected one of the JVM arguments. Check the arguments in Settings or the version profile.",
+    ),
+    (
+        "graphics_driver",
+        ("Pixel format not accelerated", "GLFW error 6554", "Could not create context"),
+        r"Pixel format not accelerated|GLFW error 6554[23].*|Could not create context.*",
+        "The graphics driver could not create an OpenGL context. Update your GPU drivers.",
+    ),
+]
+
+_COMPILED = [(key, anchors, re.compile(pattern)) for key, anchors, pattern, _ in SIGNATURES]
+_ADVICE = {key: advice for key, _, _, advice in SIGNATURES}
+
+
+def _first_match(text, anchors, pattern):
+    for anchor in anchors:
+        pos = text.find(anchor)
+
+        while pos != -1:
+            inicio = text.rfind("\n", 0, pos) + 1
+            fin = text.find("\n", pos)
+            fin = len(text) if fin == -1 else fin
+
+            match = pattern.search(text, inicio, fin)
+
+            if match:
+                return match.group(0).strip()
+
+            pos = text.find(anchor, fin)
+
+    return None
+
+
+def scan_text(text, found=None):
+    """Busca las firmas en un bloque de texto. Devuelve {clave: primera línea que coincidió}."""
+    found = {} if found is None else found
+
+    for key, anchors, pattern in _COMPILED:
+        if key in found:
+            continue
+
+        line = _first_match(text, anchors, pattern)
+
+        if line is not None:
+            found[key] = line
+
+    return found
+
+
+def scan_file(path, found=None):
+    """Recorre un archivo (aunque pese decenas de MB) por bloques, sin cortar líneas entre bloques."""
+    found = {} if found is None else found
+    resto = ""
+
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+
+            if not chunk:
+                break
+
+            chunk = resto + chunk
+            corte = chunk.rfind("\n") + 1
+            resto = chunk[corte:]
+
+            scan_text(chunk[:corte], found)
+
+    if resto:
+        scan_text(resto, found)
+
+    return found
+
+
+def _new_files(patterns, since):
+    files = []
+
+    for pattern in patterns:
+        for path in glob.glob(pattern):
+            try:
+                if os.path.getmtime(path) >= since:
+                    files.append(path)
+
+            except OSError:
+                pass
+
+    return sorted(files, key=os.path.getmtime, reverse=True)
+
+
+class CrashAnalyzer:
+    """Mira la salida del juego mientras corre y, al terminar, los crash reports que haya dejado."""
+    def __init__(self, minecraft_directory, since):
+        self.minecraft_directory = minecraft_directory
+        self.since = since
+        self.found = {}
+        # stdout y stderr se leen en hilos distintos y los dos alimentan el mismo analizador
+        self._lock = threading.Lock()
+
+    def feed_lines(self, lines):
+        with self._lock:
+            scan_text("\n".join(lines), self.found)
+
+    def feed_line(self, line):
+        with self._lock:
+            scan_text(line, self.found)
+
+    def finish(self, returncode):
+        """
+        Devuelve (resumen, detalles) si hubo un fallo, o None si el juego cerró normalmente.
+
+        Solo hay fallo si el código de salida no es 0 o si apareció un crash report o un
+        hs_err_pid*.log nuevo (de esta sesión); esos archivos también se analizan. Una firma
+        en una línea normal del log (p. ej. una excepción atrapada) no alcanza sola.
+        """
+        reports = _new_files(
+            [
+                os.path.join(self.minecraft_directory, "crash-reports", "*.txt"),
+                os.path.join(self.minecraft_directory, "hs_err_pid*.log"),
+            ],
+            self.since,
+        )
+
+        for report in reports[:2]:
+            try:
+                scan_file(report, self.found)
+            except OSError:
+                pass
+
+        if returncode == 0 and not reports:
+            return None
+
+        details = [f"{key}: {line}" for key, line in self.found.items()]
+        details += [f"crash report: {report}" for report in reports[:2]]
+
+        if self.found:
+            summary = " ".join(_ADVICE[key] for key in self.found)
+        else:
+            summary = f"The game exited with code {returncode}."
+
+            if reports:
+                summary += f" See {os.path.basename(reports[0])}."
+
+        return summary, details
@@ -2,40 +2,46 @@ import os
 import sys
 import subprocess
 import shutil
+import re
 import json
+import time
 import threading
 import logging
-import queue
-from functools import partial
-
-import minecraft_launcher_lib
-import google.generativeai as genai
-import customtkinter as ctk  
-
-
-def get_app_data_dir():
-    """Obtiene la ruta al directorio de datos de la aplicación de forma multiplataforma."""
-    APP_NAME = "MCLauncher"
-
-    if sys.platform == "win32":
-        app_data_path = os.getenv("APPDATA")
-    elif sys.platform == "darwin":
-        app_data_path = os.path.join(os.path.expanduser("~"), "Library", "Application Support")
-    else:
-        app_data_path = os.path.join(os.path.expanduser("~"), ".config")
-
-    launcher_data_dir = os.path.join(app_data_path, APP_NAME)
-    os.makedirs(launcher_data_dir, exist_ok=True)
-
-    return launcher_data_dir
+import sqlite3
+
+import manifiesto
+import instalador
+import descargas
+import almacen
+import indice_versiones
+import cache_comandos
+import prelanzamiento
+import supervisor
+import telemetria
+import afinador
+import perfiles
+import runtimes_java
+import diagnostico
+import importaciones
+import sugerencias_ia
+import catalogo_mods
+from rutas import get_app_data_dir, get_minecraft_directory
+
+# Las dos dependencias más pesadas se importan recién cuando se usan (o en la precarga de main.py)
+minecraft_launcher_lib = importaciones.lazy_import("minecraft_launcher_lib")
+genai = importaciones.lazy_import("google.generativeai")
 
 
 APP_DATA_DIR = get_app_data_dir()
 CONFIG_FILE = os.path.join(APP_DATA_DIR, "config.json")
 SKIN_PACK_NAME = "MCL_Launcher_Skin"
 
-_mc_dir = minecraft_launcher_lib.utils.get_minecraft_directory()
-MINECRAFT_DIRECTORY = _mc_dir if _mc_dir else ""
+MINECRAFT_DIRECTORY = get_minecraft_directory()
+
+# Assets y librerías compartidos entre todos los directorios de Minecraft, por hash
+SHARED_STORE_DIR = os.path.join(APP_DATA_DIR, "store")
+DOWNLOAD_JOURNAL_FILE = os.path.join(APP_DATA_DIR, "download_journal.json")
+GAME_LOGS_DIR = os.path.join(APP_DATA_DIR, "logs")
 
 def load_configuration():
     """Carga el archivo de configuración si existe, devuelve un dict vacío en error."""
@@ -60,21 +66,106 @@ def save_configuration(config_data):
         print(f"Error al guardar la configuración: {e}")
 
 
-def load_initial_data():
-    """Prepara carpetas y devuelve (all_versions, installed_ids)."""
+def load_version_list(on_versions_updated=None):
+    """
+    Devuelve la lista de versiones disponibles, [] en error.
+
+    La lista sale del caché del manifiesto; si estaba vencido se revalida en segundo
+    plano y on_versions_updated recibe la lista nueva (desde otro hilo).
+    """
+    try:
+        try:
+            return get_manifest_cache().get_versions(on_update=on_versions_updated)
+        except Exception as e:
+            print(f"Error al leer el manifiesto, usando minecraft_launcher_lib: {e}")
+            return minecraft_launcher_lib.utils.get_version_list()
+
+    except Exception as e:
+        print(f"Error al cargar la lista de versiones: {e}")
+        return []
+
+
+def load_installed_ids():
+    """Prepara carpetas y devuelve el set de IDs de versiones instaladas, set() en error."""
     try:
         os.makedirs(os.path.join(MINECRAFT_DIRECTORY, "resourcepacks"), exist_ok=True)
 
-        all_versions = minecraft_launcher_lib.utils.get_version_list()
+        installed_versions = get_installed_index().scan(MINECRAFT_DIRECTORY)
 
-        installed_versions = minecraft_launcher_lib.utils.get_installed_versions(MINECRAFT_DIRECTORY)
-        installed_ids = {v["id"] for v in installed_versions}
+        # Una instalación interrumpida deja el JSON de la versión; no debe figurar como instalada
+        incomplete = get_download_journal().incomplete_installs(MINECRAFT_DIRECTORY)
 
-        return all_versions, installed_ids
+        return {v["id"] for v in installed_versions} - incomplete
 
     except Exception as e:
-        print(f"Error al cargar datos iniciales: {e}")
-        return [], set()
+        print(f"Error al cargar las versiones instaladas: {e}")
+        return set()
+
+
+def load_initial_data(on_versions_updated=None):
+    """Prepara carpetas y devuelve (all_versions, installed_ids)."""
+    return load_version_list(on_versions_updated), load_installed_ids()
+
+
+def _perezoso(fabrica):
+    """
+    Accesor que crea el objeto la primera vez que se lo pide (una sola vez aunque lo pidan
+    varios hilos). Así importar este módulo no abre archivos ni bases de datos.
+    """
+    lock = threading.Lock()
+    creado = []
+
+    def obtener():
+        if not creado:
+            with lock:
+                if not creado:
+                    creado.append(fabrica())
+
+        return creado[0]
+
+    return obtener
+
+
+def _crear_catalogo():
+    """Devuelve el catálogo local de mods, o None si no se pudo abrir (el catálogo queda desactivado)."""
+    try:
+        return catalogo_mods.ModCatalog(APP_DATA_DIR)
+    except (sqlite3.Error, OSError) as e:
+        print(f"Catálogo de mods desactivado, no se pudo abrir: {e}")
+        return None
+
+
+def _crear_sugerencias():
+    """Devuelve el servicio de sugerencias de la IA (caché, cliente de Gemini y límite de pedidos)."""
+    return sugerencias_ia.SuggestionService(
+        sugerencias_ia.SuggestionCache(APP_DATA_DIR),
+        sugerencias_ia.GeminiBackend(genai),
+        sugerencias_ia.RateLimiter(),
+    )
+
+
+get_manifest_cache = _perezoso(lambda: manifiesto.ManifestCache(APP_DATA_DIR))
+get_installed_index = _perezoso(lambda: indice_versiones.InstalledVersionIndex(APP_DATA_DIR))
+get_launch_cache = _perezoso(lambda: cache_comandos.LaunchCommandCache(APP_DATA_DIR))
+get_telemetry = _perezoso(lambda: telemetria.TelemetryStore(APP_DATA_DIR))
+get_tuning_profiles = _perezoso(lambda: afinador.TuningProfiles(APP_DATA_DIR))
+get_java_runtimes = _perezoso(lambda: runtimes_java.JavaRuntimes(APP_DATA_DIR))
+get_mod_catalog = _perezoso(_crear_catalogo)
+get_ai_suggestions = _perezoso(_crear_sugerencias)
+get_shared_store = _perezoso(lambda: almacen.ContentStore(SHARED_STORE_DIR))
+get_download_journal = _perezoso(lambda: descargas.DownloadJournal(DOWNLOAD_JOURNAL_FILE))
+
+
+def collect_store_garbage():
+    """Libera del almacén los objetos que ya no usa ningún directorio de Minecraft."""
+    try:
+        liberados = get_shared_store().gc()
+
+        if liberados:
+            print(f"Almacén compartido: {liberados / (1024 * 1024):.1f} MB liberados")
+
+    except Exception as e:
+        print(f"Error al limpiar el almacén compartido: {e}")
 
 
 def delete_all_user_data():
@@ -254,94 +345,113 @@ def process_skin(skin_path, version_id):
 
     return False, "Error processing skin."
 
-def call_ia_api_in_thread(prompt, api_key, result_queue):
-    """Función para un hilo. Llama a la API de IA y pone el resultado en una cola."""
-    resultados, error = obtener_sugerencias_ia_desde_api(prompt, api_key)
+def _verificador_catalogo():
+    # Con un catálogo importado, cada sugerencia se marca como verificada (o no) y se corrige su URL
+    catalogo = get_mod_catalog()
+    return catalogo.verify if catalogo is not None and catalogo.count() else (lambda mod: mod)
+
+
+def _entregar_resultado(resultados, error, on_result, verificar):
     if error:
-        result_queue.put(("ERROR", error))
+        on_result("ERROR", error)
     else:
-        result_queue.put(("SUCCESS", resultados))
+        on_result("SUCCESS", [verificar(mod) for mod in resultados])
 
 
-def obtener_sugerencias_ia_desde_api(prompt_usuario, api_key):
-    """Se conecta a la API de Google Gemini para obtener sugerencias."""
+def call_ia_api_in_thread(prompt, api_key, on_result, on_item=None):
+    """
+    Función para un hilo. Llama a la API de IA y entrega el resultado con on_result(tipo, datos).
+
+    Si se pasa on_item(mod), cada sugerencia se entrega apenas llega, antes del resultado final.
+    """
     try:
-        if not api_key:
-            return None, "Google API Key not found."
+        verificar = _verificador_catalogo()
 
-        genai.configure(api_key=api_key)
+        if on_item is not None:
+            entregar = on_item
+            on_item = lambda mod: entregar(verificar(mod))
 
-        system_prompt = (
-            "You are a helpful assistant for a Minecraft launcher. "
-            "You must respond ONLY with a valid JSON array of objects. "
-            "Each object must have five keys: 'name', 'description', 'url', 'loader', and 'version'."
-        )
+        resultados, error = obtener_sugerencias_ia_desde_api(prompt, api_key, on_item)
+        _entregar_resultado(resultados, error, on_result, verificar)
 
-        model = genai.GenerativeModel("gemini-pro")
-        response = model.generate_content(system_prompt + "\n\nUser request: " + prompt_usuario)
+    except Exception as e:
+        # Siempre hay un resultado: la UI espera uno para volver a habilitar el botón
+        print(f"Error al pedir sugerencias a la IA: {e}")
+        on_result("ERROR", str(e))
 
-        cleaned_response = (
-            response.text.strip().replace("```json", "").replace("```", "").strip()
-        )
 
-        return json.loads(cleaned_response), None
+def build_batch_prompts(prompt, versions_text=""):
+    """
+    Arma los pedidos de un lote: temas separados por ";" y, si hay versiones objetivo
+    ("1.19.2, 1.20.1"), un pedido por cada tema y versión.
+    """
+    temas = [tema.strip() for tema in prompt.split(";") if tema.strip()]
+    versiones = [version for version in re.split(r"[,;\s]+", versions_text or "") if version]
+
+    if versiones:
+        temas = [f"{tema} for Minecraft {version}" for tema in temas for version in versiones]
+
+    return list(dict.fromkeys(temas))
+
+
+def call_ia_batch_in_thread(prompts, api_key, on_result, on_item=None):
+    """Como call_ia_api_in_thread, pero con varios pedidos en paralelo y una sola lista sin repetidos."""
+    try:
+        verificar = _verificador_catalogo()
 
-    except json.JSONDecodeError:
-        return None, "AI returned an invalid format."
+        if on_item is not None:
+            entregar = on_item
+            on_item = lambda mod: entregar(verificar(mod))
+
+        resultados, error = get_ai_suggestions().suggest_batch(prompts, api_key, on_item)
+        _entregar_resultado(resultados, error, on_result, verificar)
 
     except Exception as e:
-        if "API_KEY_INVALID" in str(e):
-            return None, "The provided API Key is invalid."
-
-        return None, str(e)
-
-
-def _populate_versions_in_batches(scroll_frame, version_variable, versions_to_add, loading_label, index=0):
-    """Agrega versiones por lotes al scroll_frame para no bloquear la UI."""
-    BATCH_SIZE = 10
-    count = 0
-
-    while count < BATCH_SIZE and index < len(versions_to_add):
-        version = versions_to_add[index]
-        ctk.CTkRadioButton(
-            master=scroll_frame, text=version, variable=version_variable, value=version
-        ).pack(fill="x", padx=10, pady=5)
-
-        count += 1
-        index += 1
-
-    if index < len(versions_to_add):
-        scroll_frame.after(
-            10,
-            partial(
-                _populate_versions_in_batches,
-                scroll_frame,
-                version_variable,
-                versions_to_add,
-                loading_label,
-                index,
-            ),
-        )
+        print(f"Error al pedir sugerencias a la IA en lote: {e}")
+        on_result("ERROR", str(e))
+
+
+def obtener_sugerencias_ia_desde_api(prompt_usuario, api_key, on_item=None):
+    """Pide sugerencias a Gemini; las repetidas salen del caché y las simultáneas iguales se juntan."""
+    return get_ai_suggestions().suggest(prompt_usuario, api_key, on_item)
+
+
+def search_mod_catalog(text, version_id):
+    """Busca en el catálogo local, filtrando por el loader y la versión del juego de version_id."""
+    loader, game_version = catalogo_mods.loader_and_version_from_id(version_id)
+    catalogo = get_mod_catalog()
+    return catalogo.search(text, loader, game_version) if catalogo is not None else []
 
-    else:
-        loading_label.destroy()
 
-        if versions_to_add:
-            version_variable.set(versions_to_add[0])
+def import_mod_catalog_in_thread(path, on_done):
+    """Función para un hilo. Importa un volcado de mods y llama a on_done(éxito, mensaje)."""
+    catalogo = get_mod_catalog()
+
+    if catalogo is None:
+        on_done(False, "The mod catalog is unavailable on this system.")
+        return
+
+    try:
+        total = catalogo.import_dump(path)
+    except (OSError, ValueError, AttributeError, sqlite3.Error) as e:
+        print(f"Error al importar el catálogo de mods: {e}")
+        on_done(False, f"Could not import the catalog: {e}")
+        return
+
+    on_done(True, f"Imported {total} mods ({catalogo.count()} in catalog).")
+
+
+def strip_installed_label(display_version):
+    """Quita la marca " (Installed)" de una etiqueta de la lista de versiones."""
+    return display_version.replace(" (Installed)", "")
 
 
 def update_version_list(ui_elements, all_versions, installed_ids):
     """Actualiza la lista de versiones en la UI."""
-    scroll_frame = ui_elements["version_scroll_frame"]
+    version_list = ui_elements["version_list"]
     show_snapshots = ui_elements["show_snapshots_checkbox"].get() == 1
     version_var = ui_elements["version_variable"]
 
-    for widget in scroll_frame.winfo_children():
-        widget.destroy()
-
-    loading_label = ctk.CTkLabel(master=scroll_frame, text="Loading versions...")
-    loading_label.pack(pady=20)
-
     display_versions = [
         f"{v['id']} (Installed)" if v["id"] in installed_ids else v["id"]
         for v in all_versions
@@ -349,10 +459,17 @@ def update_version_list(ui_elements, all_versions, installed_ids):
     ]
 
     if not display_versions:
-        loading_label.configure(text="No versions found.")
+        version_list.set_message("No versions found.")
         return
 
-    _populate_versions_in_batches(scroll_frame, version_var, display_versions, loading_label)
+    # Solo se tocan las filas que cambiaron (altas, bajas o la marca "(Installed)")
+    version_list.reconcile(display_versions)
+
+    # Mantener la selección si la versión sigue en la lista (aunque cambie su etiqueta "(Installed)")
+    selected_id = strip_installed_label(version_var.get())
+    matching = [d for d in display_versions if strip_installed_label(d) == selected_id]
+
+    version_var.set(matching[0] if selected_id and matching else display_versions[0])
 
 
 def bind_version_change(ui_elements, selected_label):
@@ -367,35 +484,175 @@ def bind_version_change(ui_elements, selected_label):
     _on_change()
 
 
-def _launch_game_in_thread(minecraft_command, update_queue, minecraft_directory):
-    """Ejecuta el comando del juego en un hilo separado con el directorio de trabajo correcto."""
+def _prepare_launch_command(version_id, minecraft_directory, options):
+    """Verifica librerías, extrae natives si hace falta y arma el comando, midiendo cada fase."""
+    missing, timer = prelanzamiento.prepare_launch(version_id, minecraft_directory)
+
+    if missing:
+        print(f"Faltan {len(missing)} librerías para {version_id}, por ejemplo: {missing[0]}")
+
+    # Relanzar con las mismas opciones reutiliza el classpath ya resuelto
+    minecraft_command = get_launch_cache().get_command(
+        version_id, minecraft_directory, options, minecraft_launcher_lib.command.get_minecraft_command
+    )
+    timer.lap("command")
+
+    print(f"Prelanzamiento de {version_id}: {timer.report()}")
+    return minecraft_command
+
+
+def build_launch_options(version_id, username, config, minecraft_directory):
+    """Opciones de lanzamiento: perfil de la versión, java elegido y RAM/GC recomendados."""
+    # El perfil de la versión (si tiene) manda sobre los ajustes globales
+    settings, from_profile = perfiles.resolve(config, version_id)
+
+    ram_mb = settings["ram_mb"]
+    jvm_args_extra = settings["jvm_args"].split()
+    gc_flags = []
+
+    java_path = settings["java_path"]
+    java_info = None
+
+    if not java_path:
+        java_path, java_info = get_java_runtimes().find_best(afinador.required_java_major(version_id, minecraft_directory), minecraft_directory)
+
+        if java_path:
+            print(f"Java para {version_id}: {java_path} ({java_info['vendor']} {java_info['version']})")
+
+    if settings["auto_tune"]:
+        profile = get_tuning_profiles().update(
+            version_id,
+            minecraft_directory,
+            get_telemetry().summary(version_id),
+            supported_gcs=set(java_info["gcs"]) if java_info else None,
+            java_major=java_info["major"] if java_info else None,
+            max_mb=config.get("auto_tune_max_ram_mb"),
+            experimental_gcs=set(java_info.get("experimental_gcs", [])) if java_info else None,
+        )
+
+        if "ram_mb" not in from_profile:
+            ram_mb = profile["ram_mb"]
+
+        # Si el usuario eligió un recolector en sus JVM args, se respeta el suyo
+        if not afinador.user_sets_gc(jvm_args_extra):
+            gc_flags = profile["gc_flags"]
+
+    options = {
+        "username": username,
+        "uuid": "",
+        "token": "",
+        "jvmArguments": [f"-Xmx{ram_mb}M", f"-Xms{ram_mb}M"] + gc_flags + jvm_args_extra,
+    }
+
+    # Sin java propio ni encontrado, minecraft_launcher_lib usa el runtime que instaló con la versión
+    if java_path:
+        options["executablePath"] = java_path
+
+    return options
+
+
+def _launch_game_in_thread(version_id, username, config, minecraft_directory, instances, on_event, on_log_lines=None):
+    """Prepara y ejecuta el juego en un hilo separado y lo registra como instancia mientras corre."""
     try:
-        subprocess.run(minecraft_command, cwd=minecraft_directory) 
-        update_queue.put("GAME_CLOSED")
+        options = build_launch_options(version_id, username, config, minecraft_directory)
+        minecraft_command = _prepare_launch_command(version_id, minecraft_directory, options)
+        telemetry_interval = config.get("telemetry_interval_s", telemetria.SAMPLE_INTERVAL)
+        recorder = None
+        analyzer = diagnostico.CrashAnalyzer(minecraft_directory, time.time())
+
+        def _on_line(line):
+            # Desde el hilo lector, antes del buffer de la UI que descarta líneas cuando hay mucha salida
+            # (justo lo que pasa mientras el juego se cae)
+            if recorder is not None:
+                recorder.feed_lines([line])
+
+            analyzer.feed_line(line)
+
+        game = supervisor.GameProcess(
+            minecraft_command,
+            minecraft_directory,
+            os.path.join(GAME_LOGS_DIR, instances.log_name(version_id)),
+            on_lines=on_log_lines,
+            on_line=_on_line,
+        )
+
+        game.start()
+        instances.add(game, version_id)
+
+        try:
+            if telemetry_interval and telemetry_interval > 0:
+                try:
+                    recorder = get_telemetry().start_session(game.pid, version_id, telemetry_interval)
+                except OSError as e:
+                    # Sin telemetría el juego sigue corriendo igual
+                    print(f"No se pudo iniciar la telemetría de {version_id}: {e}")
+
+            returncode = game.wait()
+        finally:
+            instances.remove(game.pid)
+            # Con el juego ya cerrado, guardar el uso del comando en caché no demora nada
+            get_launch_cache().save()
+
+            if recorder is not None:
+                session = get_telemetry().finish_session(recorder)
+                print(f"Telemetría de {version_id}: pico {session['peak_rss_mb']} MB, {session['gc_pauses']} pausas de GC")
+
+        diagnosis = None if game.killed else analyzer.finish(returncode)
+
+        if diagnosis is None:
+            on_event("GAME_CLOSED", version_id)
+            return
+
+        summary, details = diagnosis
+
+        if on_log_lines is not None:
+            on_log_lines([f"[diagnosis] {line}" for line in [summary] + details])
+
+        on_event("CRASH", f"{version_id}: {summary}")
     except Exception as e:
         logging.error(f"Fallo al ejecutar el proceso de Minecraft: {e}")
-        update_queue.put(f"ERROR:{e}")
+        on_event("ERROR", str(e))
 
 
-def process_queue_updates(app, status_label, update_queue):
-    try:
-        message = update_queue.get_nowait()
+def format_telemetry_summary(version_id):
+    """Texto corto con la memoria pico y las pausas de GC medidas para una versión."""
+    if not version_id:
+        return "Select a version to see its telemetry."
+
+    summary = get_telemetry().summary(version_id)
 
-        if message == "GAME_CLOSED":
-            status_label.configure(text="Game closed. Ready to play again!", text_color="green")
+    if summary is None:
+        return f"No telemetry recorded for {version_id} yet."
 
-        elif message.startswith("ERROR:"):
-            status_label.configure(text=f"Error launching: {message.split(':', 1)[1]}", text_color="red")
+    if summary["peak_rss_mb"] is not None:
+        text = f"{version_id}: peak {summary['peak_rss_mb']} MB (median {summary['peak_rss_p50_mb']} MB) over {summary['sessions']} sessions"
+    else:
+        text = f"{version_id}: {summary['sessions']} sessions, memory not sampled on this system"
 
-    except queue.Empty:
-        pass
+    if summary["gc_pauses"]:
+        text += f"\nGC pauses p50/p95/p99: {summary['gc_p50_ms']:.0f}/{summary['gc_p95_ms']:.0f}/{summary['gc_p99_ms']:.0f} ms"
 
-    finally:
-        app.after(100, lambda: process_queue_updates(app, status_label, update_queue))
+    profile = get_tuning_profiles().get(version_id)
+
+    if profile:
+        text += f"\nAuto-tune: {profile['ram_mb']} MB, {profile['gc']} GC ({profile['source']})"
+
+    return text
+
+
+def handle_game_event(status_label, kind, data):
+    """Se ejecuta en el hilo de la UI (vía el despachador) cuando una instancia termina o falla."""
+    if kind == "GAME_CLOSED":
+        status_label.configure(text=f"Game {data} closed. Ready to play again!", text_color="green")
+
+    elif kind == "CRASH":
+        status_label.configure(text=f"Game crashed. {data}", text_color="red")
+
+    elif kind == "ERROR":
+        status_label.configure(text=f"Error launching: {data}", text_color="red")
 
 
 def launch_or_install_minecraft(ui_elements, all_versions, installed_ids):
-    app = ui_elements["app"]
     status_label = ui_elements["status_label"]
 
     version_id = ui_elements["version_variable"].get().replace(" (Installed)", "")
@@ -414,51 +671,121 @@ def launch_or_install_minecraft(ui_elements, all_versions, installed_ids):
     save_configuration(config)
 
     if version_id not in installed_ids:
-        try:
-            status_label.configure(text=f"Installing {version_id}...", text_color="yellow")
-            app.update_idletasks()
+        _start_install(ui_elements, all_versions, installed_ids, version_id, username, config)
+        return
 
-            minecraft_launcher_lib.install.install_minecraft_version(version_id, MINECRAFT_DIRECTORY)
+    _launch_installed_version(ui_elements, version_id, username, config)
 
-            installed_ids.add(version_id)
-            update_version_list(ui_elements, all_versions, installed_ids)
 
-            status_label.configure(text=f"{version_id} installed!", text_color="green")
-            app.update_idletasks()
+def _set_install_progress_visible(ui_elements, visible):
+    """Muestra u oculta la barra de progreso y el botón de cancelar de la instalación."""
+    progress_frame = ui_elements["install_progress_frame"]
 
-        except Exception as e:
-            status_label.configure(text=f"Installation Error: {e}", text_color="red")
+    if visible:
+        ui_elements["install_progress_bar"].set(0)
+        ui_elements["install_cancel_button"].configure(state="normal")
+        progress_frame.pack(side="right", padx=10)
+        ui_elements["launch_button"].configure(state="disabled")
+    else:
+        progress_frame.pack_forget()
+        ui_elements["launch_button"].configure(state="normal")
+
+
+def _start_install(ui_elements, all_versions, installed_ids, version_id, username, config):
+    """Instala la versión en un hilo de fondo y la lanza al terminar."""
+    app = ui_elements["app"]
+    status_label = ui_elements["status_label"]
+
+    def _on_progress(status, progress, maximum):
+        # Se llama desde el hilo de instalación, ya limitado por InstallTask
+        app.despachador.post(_update_install_progress, status, progress, maximum)
+
+    def _update_install_progress(status, progress, maximum):
+        if maximum > 0:
+            ui_elements["install_progress_bar"].set(min(progress / maximum, 1))
+
+        status_label.configure(text=f"Installing {version_id}: {status}", text_color="yellow")
+
+    def _on_done(error):
+        app.despachador.post(_finish_install, error)
+
+    def _finish_install(error):
+        _set_install_progress_visible(ui_elements, False)
+
+        if isinstance(error, instalador.InstalacionCancelada):
+            status_label.configure(text=f"Installation of {version_id} cancelled.", text_color="orange")
             return
 
-    try:
-        ram_mb = config.get("ram_mb", 512)
-        jvm_args_extra = config.get("jvm_args", "")
-
-        options = {
-            "username": username,
-            "uuid": "",
-            "token": "",
-            "jvmArguments": [f"-Xmx{ram_mb}M", f"-Xms{ram_mb}M"],
-        }
+        if error is not None:
+            status_label.configure(text=f"Installation Error: {error}", text_color="red")
+            return
 
-        if jvm_args_extra:
-            options["jvmArguments"].extend(jvm_args_extra.split())
+        installed_ids.add(version_id)
+        get_launch_cache().invalidate(version_id)
+        update_version_list(ui_elements, all_versions, installed_ids)
 
-        minecraft_command = minecraft_launcher_lib.command.get_minecraft_command(
-            version_id, MINECRAFT_DIRECTORY, options
-        )
+        status_label.configure(text=f"{version_id} installed!", text_color="green")
+        _launch_installed_version(ui_elements, version_id, username, config)
 
+    task = instalador.InstallTask(
+        version_id,
+        MINECRAFT_DIRECTORY,
+        _on_progress,
+        _on_done,
+        manifest_entry=get_manifest_cache().find_version(version_id),
+        workers=config.get("download_workers", descargas.DEFAULT_WORKERS),
+        store=get_shared_store() if config.get("shared_store", True) else None,
+        journal=get_download_journal(),
+    )
+
+    ui_elements["install_cancel_button"].configure(command=lambda: _cancel_install(ui_elements, task))
+    _set_install_progress_visible(ui_elements, True)
+    status_label.configure(text=f"Installing {version_id}...", text_color="yellow")
+
+    task.start()
+
+
+def _cancel_install(ui_elements, task):
+    ui_elements["install_cancel_button"].configure(state="disabled")
+    ui_elements["status_label"].configure(text="Cancelling installation...", text_color="orange")
+    task.cancel()
+
+
+def _game_log_poster(ui_elements, version_id):
+    """Devuelve un callback que manda cada lote de líneas del juego al hilo de la UI, marcadas con su versión."""
+    app = ui_elements["app"]
+    append_game_log = ui_elements.get("append_game_log")
+
+    if append_game_log is None:
+        return None
+
+    prefix = f"[{version_id}] "
+    return lambda lines: app.despachador.post(append_game_log, [prefix + line for line in lines])
+
+
+def _launch_installed_version(ui_elements, version_id, username, config):
+    app = ui_elements["app"]
+    status_label = ui_elements["status_label"]
+
+    try:
         status_label.configure(text=f"Launching Minecraft {version_id}...", text_color="green")
 
-        update_queue = queue.Queue()
+        # Todas las instancias comparten el mismo despachador: no hay un bucle de sondeo por lanzamiento
+        on_event = lambda kind, data: app.despachador.post(handle_game_event, status_label, kind, data)
 
         threading.Thread(
             target=_launch_game_in_thread,
-            args=(minecraft_command, update_queue, MINECRAFT_DIRECTORY),
+            args=(
+                version_id,
+                username,
+                config,
+                MINECRAFT_DIRECTORY,
+                ui_elements["instances"],
+                on_event,
+                _game_log_poster(ui_elements, version_id),
+            ),
             daemon=True,
         ).start()
 
-        app.after(100, lambda: process_queue_updates(app, status_label, update_queue))
-
     except Exception as e:
         status_label.configure(text=f"Launch Error: {e}", text_color="red")
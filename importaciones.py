@@ -0,0 +1,195 @@
+import os
+import sys
+import json
+import time
+import threading
+import importlib
+import importlib.abc
+
+IMPORT_REPORT_FILE = "import_report.json"
+REPORT_TOP = 15
+
+
+class LazyModule:
+    """Módulo que se importa la primera vez que se usa uno de sus atributos."""
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._name)
+
+        return self._module
+
+    @property
+    def loaded(self):
+        return self._module is not None
+
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+
+    def __repr__(self):
+        return f"<LazyModule {self._name} ({'loaded' if self.loaded else 'not loaded'})>"
+
+
+def lazy_import(name):
+    return LazyModule(name)
+
+
+def preload(modules):
+    """Importa los módulos en un hilo de fondo, para que el primer uso no frene la UI."""
+    def _run():
+        for module in modules:
+            try:
+                module.load()
+            except Exception as e:
+                print(f"No se pudo precargar {module._name}: {e}")
+
+    thread = threading.Thread(target=_run, daemon=True, name="precarga")
+    thread.start()
+    return thread
+
+
+class _TimingLoader:
+    """Envuelve el loader real y mide cuánto tarda en ejecutarse el módulo, sin contar sus imports."""
+    def __init__(self, loader, fullname, timer):
+        self._loader = loader
+        self._fullname = fullname
+        self._timer = timer
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        stack = self._timer._stack()
+        stack.append(0.0)
+        inicio = time.perf_counter()
+
+        try:
+            self._loader.exec_module(module)
+        finally:
+            total = time.perf_counter() - inicio
+            hijos = stack.pop()
+
+            if stack:
+                stack[-1] += total
+
+            self._timer._record(self._fullname, total - hijos, total)
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+
+class ImportTimer(importlib.abc.MetaPathFinder):
+    """
+    Como python -X importtime, pero agregado: suma el tiempo propio de cada módulo por
+    paquete de primer nivel (google, grpc, minecraft_launcher_lib...).
+    """
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.self_ms = {}
+        self.modules = {}
+        self.roots = {}
+
+    def _stack(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+
+        return self._local.stack
+
+    def _record(self, fullname, self_time, total):
+        package = fullname.partition(".")[0]
+
+        with self._lock:
+            self.self_ms[package] = self.self_ms.get(package, 0.0) + self_time * 1000
+            self.modules[package] = self.modules.get(package, 0) + 1
+
+            # Imports de primer nivel (no hechos desde otro módulo medido): tiempo acumulado
+            if not self._stack():
+                self.roots[fullname] = self.roots.get(fullname, 0.0) + total * 1000
+
+    def find_spec(self, fullname, path, target=None):
+        if getattr(self._local, "buscando", False):
+            return None
+
+        self._local.buscando = True
+
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+
+                spec = finder.find_spec(fullname, path, target)
+
+                if spec is not None:
+                    break
+            else:
+                return None
+
+        finally:
+            self._local.buscando = False
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimingLoader(spec.loader, fullname, self)
+
+        return spec
+
+    def install(self):
+        sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def report(self):
+        with self._lock:
+            packages = sorted(self.self_ms.items(), key=lambda item: item[1], reverse=True)
+            roots = sorted(self.roots.items(), key=lambda item: item[1], reverse=True)
+
+            return {
+                "total_ms": round(sum(self.self_ms.values()), 1),
+                "packages": [
+                    {"package": name, "self_ms": round(ms, 1), "modules": self.modules[name]}
+                    for name, ms in packages
+                ],
+                "top_level_imports": [{"module": name, "cumulative_ms": round(ms, 1)} for name, ms in roots],
+            }
+
+    def save_report(self, app_data_dir):
+        report = self.report()
+
+        print(f"Imports del arranque: {report['total_ms']:.0f} ms")
+
+        for entry in report["packages"][:REPORT_TOP]:
+            print(f"  {entry['package']:<30} {entry['self_ms']:>8.1f} ms  ({entry['modules']} módulos)")
+
+        try:
+            with open(os.path.join(app_data_dir, IMPORT_REPORT_FILE), "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+
+        except OSError as e:
+            print(f"Error al guardar el informe de imports: {e}")
+
+        return report
+
+
+def timer_from_config(config_file):
+    """Instala un ImportTimer si el config tiene "import_report": true. Devuelve el timer o None."""
+    try:
+        with open(config_file, "r", encoding="utf-8") as f:
+            enabled = json.load(f).get("import_report", False)
+
+    except (OSError, json.JSONDecodeError, AttributeError):
+        return None
+
+    if not enabled:
+        return None
+
+    timer = ImportTimer()
+    timer.install()
+    return timer
@@ -0,0 +1,112 @@
+import os
+import json
+import threading
+
+INDEX_FILE = "installed_versions_index.json"
+
+
+def _read_version_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    return {"id": data["id"], "type": data.get("type", "release")}
+
+
+class InstalledVersionIndex:
+    """
+    Índice persistente de las versiones instaladas en cada directorio de Minecraft.
+
+    El listado de versions/ solo se repite si cambió el mtime de la carpeta, y un
+    version JSON solo se vuelve a leer si cambió su mtime o su tamaño. Las carpetas que
+    se saltaron por no tener un JSON válido (p. ej. a mitad de una instalación) se
+    guardan aparte y se vuelven a mirar en cada scan.
+    """
+    def __init__(self, cache_dir):
+        self.path = os.path.join(cache_dir, INDEX_FILE)
+        self._lock = threading.Lock()
+        self.data = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+        except (json.JSONDecodeError, IOError):
+            return {}
+
+        return data if isinstance(data, dict) else {}
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.data, f)
+
+            os.replace(tmp_path, self.path)
+
+        except OSError as e:
+            print(f"Error al guardar el índice de versiones: {e}")
+
+    def scan(self, minecraft_directory):
+        """Actualiza el índice para el directorio y devuelve la lista de versiones instaladas."""
+        versions_dir = os.path.join(minecraft_directory, "versions")
+
+        try:
+            dir_mtime = os.stat(versions_dir).st_mtime_ns
+        except OSError:
+            return []
+
+        with self._lock:
+            key = os.path.abspath(minecraft_directory)
+            entry = self.data.get(key, {})
+            old_versions = entry.get("versions", {})
+            old_skipped = entry.get("skipped", [])
+            changed = False
+
+            if entry.get("dir_mtime") == dir_mtime:
+                # Escribir el JSON dentro de versions/<id>/ no cambia el mtime de versions/
+                names = list(old_versions) + [name for name in old_skipped if name not in old_versions]
+            else:
+                names = os.listdir(versions_dir)
+                changed = True
+
+            versions = {}
+            skipped = []
+
+            for name in names:
+                json_path = os.path.join(versions_dir, name, f"{name}.json")
+
+                try:
+                    st = os.stat(json_path)
+                except OSError:
+                    if os.path.isdir(os.path.join(versions_dir, name)):
+                        skipped.append(name)
+
+                    changed = changed or name in old_versions
+                    continue
+
+                old = old_versions.get(name)
+
+                if old and old["mtime"] == st.st_mtime_ns and old["size"] == st.st_size:
+                    versions[name] = old
+                    continue
+
+                try:
+                    info = _read_version_json(json_path)
+                except (json.JSONDecodeError, IOError, KeyError):
+                    skipped.append(name)
+                    changed = changed or name in old_versions
+                    continue
+
+                versions[name] = {"mtime": st.st_mtime_ns, "size": st.st_size, "info": info}
+                changed = True
+
+            if changed or skipped != old_skipped:
+                self.data[key] = {"dir_mtime": dir_mtime, "versions": versions, "skipped": skipped}
+                self.save()
+
+            return [v["info"] for v in versions.values()]
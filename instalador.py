@@ -0,0 +1,145 @@
+import time
+import threading
+
+import importaciones
+import descargas
+
+minecraft_launcher_lib = importaciones.lazy_import("minecraft_launcher_lib")
+
+# Como mucho una actualización de progreso cada INTERVALO_PROGRESO segundos hacia la UI
+INTERVALO_PROGRESO = 0.1
+
+
+class InstalacionCancelada(Exception):
+    """Se lanza desde los callbacks de instalación cuando el usuario cancela."""
+
+
+class InstallTask:
+    """Instala una versión en un hilo de fondo y reporta el progreso de forma limitada."""
+    def __init__(self, version_id, minecraft_directory, on_progress, on_done, intervalo=INTERVALO_PROGRESO,
+                 manifest_entry=None, workers=descargas.DEFAULT_WORKERS, store=None, journal=None):
+        """
+        on_progress(status, progress, maximum) y on_done(error) se llaman desde el hilo
+        de instalación; quien los pase debe reenviarlos al hilo de la UI.
+        """
+        self.version_id = version_id
+        self.minecraft_directory = minecraft_directory
+        self.manifest_entry = manifest_entry
+        self.workers = workers
+        self.store = store
+        self.journal = journal
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.intervalo = intervalo
+
+        self._cancelado = threading.Event()
+        self._lock = threading.Lock()
+        self._ultimo_envio = 0.0
+
+        self.status = ""
+        self.progress = 0
+        self.maximum = 0
+
+        self._hilo = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._hilo.start()
+
+    def cancel(self):
+        """Pide la cancelación; se hace efectiva en el próximo callback de la librería."""
+        self._cancelado.set()
+
+    @property
+    def cancelled(self):
+        return self._cancelado.is_set()
+
+    def is_alive(self):
+        return self._hilo.is_alive()
+
+    def _callbacks(self):
+        return {
+            "setStatus": self._set_status,
+            "setProgress": self._set_progress,
+            "setMax": self._set_max,
+        }
+
+    def _check_cancel(self):
+        if self._cancelado.is_set():
+            raise InstalacionCancelada(self.version_id)
+
+    def _set_status(self, status):
+        self._check_cancel()
+
+        with self._lock:
+            self.status = status
+
+        self._emit()
+
+    def _set_progress(self, progress):
+        self._check_cancel()
+
+        with self._lock:
+            self.progress = progress
+
+        self._emit()
+
+    def _set_max(self, maximum):
+        self._check_cancel()
+
+        with self._lock:
+            self.maximum = maximum
+            self.progress = 0
+
+        # Un cambio de fase siempre se envía, para que la barra no quede con el máximo viejo
+        self._emit(forzar=True)
+
+    def _emit(self, forzar=False):
+        ahora = time.monotonic()
+
+        with self._lock:
+            if not forzar and ahora - self._ultimo_envio < self.intervalo:
+                return
+
+            self._ultimo_envio = ahora
+            estado = (self.status, self.progress, self.maximum)
+
+        self.on_progress(*estado)
+
+    def _run(self):
+        error = None
+
+        try:
+            # Hasta que termine, la versión no cuenta como instalada aunque su JSON ya esté en disco
+            if self.journal is not None:
+                self.journal.begin_install(self.version_id, self.minecraft_directory)
+
+            # Primero se baja todo en paralelo; la instalación normal luego solo verifica,
+            # extrae natives e instala el runtime de Java
+            try:
+                descargas.prefetch_version(
+                    self.version_id,
+                    self.minecraft_directory,
+                    manifest_entry=self.manifest_entry,
+                    workers=self.workers,
+                    callback=self._callbacks(),
+                    store=self.store,
+                    journal=self.journal,
+                )
+
+            except InstalacionCancelada:
+                raise
+
+            except Exception as e:
+                print(f"Falló la descarga paralela, se sigue con la instalación normal: {e}")
+
+            minecraft_launcher_lib.install.install_minecraft_version(
+                self.version_id, self.minecraft_directory, callback=self._callbacks()
+            )
+
+            if self.journal is not None:
+                self.journal.finish_install(self.version_id, self.minecraft_directory)
+
+        except Exception as e:
+            error = e
+
+        self.on_done(error)
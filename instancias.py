@@ -0,0 +1,67 @@
+import time
+import threading
+
+
+class Instancia:
+    """Una instancia del juego en ejecución."""
+    def __init__(self, game, version_id):
+        self.game = game
+        self.version_id = version_id
+        self.pid = game.pid
+        self.inicio = time.time()
+
+    def uptime(self):
+        return time.time() - self.inicio
+
+
+class InstanceManager:
+    """Registro, seguro entre hilos, de todas las instancias del juego que están corriendo."""
+    def __init__(self, on_change=None):
+        """on_change(instancias) se llama desde el hilo que hizo el cambio."""
+        self.on_change = on_change
+        self._instancias = {}
+        self._lock = threading.Lock()
+
+    def _notify(self):
+        if self.on_change:
+            self.on_change(self.list())
+
+    def add(self, game, version_id):
+        instancia = Instancia(game, version_id)
+
+        with self._lock:
+            self._instancias[instancia.pid] = instancia
+
+        self._notify()
+        return instancia
+
+    def remove(self, pid):
+        with self._lock:
+            instancia = self._instancias.pop(pid, None)
+
+        if instancia is not None:
+            self._notify()
+
+    def kill(self, pid):
+        """Mata la instancia con ese PID. Devuelve False si ya no estaba corriendo."""
+        with self._lock:
+            instancia = self._instancias.get(pid)
+
+        if instancia is None:
+            return False
+
+        instancia.game.kill()
+        return True
+
+    def list(self):
+        with self._lock:
+            return sorted(self._instancias.values(), key=lambda i: i.inicio)
+
+    def running_versions(self):
+        with self._lock:
+            return [i.version_id for i in self._instancias.values()]
+
+    def log_name(self, version_id):
+        """Nombre del archivo de log: uno por versión, con sufijo si esa versión ya está corriendo."""
+        corriendo = self.running_versions().count(version_id)
+        return f"{version_id}.log" if corriendo == 0 else f"{version_id}-{corriendo + 1}.log"
@@ -0,0 +1,194 @@
+import sys
+
+import customtkinter as ctk
+
+# La cantidad de filas del pool sale del alto real del widget (ver _on_configure)
+FILAS_MINIMAS = 5
+ALTO_FILA = 34
+
+
+class ListaVersionesVirtual(ctk.CTkFrame):
+    """Lista virtualizada: un pool fijo de CTkRadioButton que se reciclan al hacer scroll."""
+    def __init__(self, master, variable, clave=None, **kwargs):
+        super().__init__(master, **kwargs)
+
+        self.variable = variable
+        # clave(item) identifica una fila aunque cambie su texto (p. ej. al agregar "(Installed)")
+        self.clave = clave or (lambda item: item)
+        self.items = []
+        self.offset = 0
+
+        self.columnconfigure(0, weight=1)
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, rowspan=FILAS_MINIMAS, sticky="ns")
+
+        self.etiqueta_mensaje = ctk.CTkLabel(self, text="")
+
+        # El número de widgets depende del alto disponible, no de cuántas versiones tenga el manifiesto
+        self.filas = []
+        self._crear_filas(FILAS_MINIMAS)
+
+        self._bind_scroll(self)
+        self.bind("<Configure>", self._on_configure)
+
+    def _crear_filas(self, cantidad):
+        for i in range(len(self.filas), cantidad):
+            fila = ctk.CTkRadioButton(self, text="", variable=self.variable, value=None)
+            fila.grid(row=i, column=0, sticky="ew", padx=10, pady=5)
+            fila.grid_remove()
+
+            self._bind_scroll(fila)
+            self.filas.append(fila)
+
+    def _on_configure(self, event):
+        """Ajusta el pool al alto que le tocó al widget, para que ninguna fila quede cortada."""
+        cantidad = max(FILAS_MINIMAS, event.height // ALTO_FILA)
+
+        if cantidad == len(self.filas):
+            return
+
+        if cantidad > len(self.filas):
+            self._crear_filas(cantidad)
+        else:
+            for fila in self.filas[cantidad:]:
+                fila.destroy()
+
+            del self.filas[cantidad:]
+
+        self.scrollbar.grid_configure(rowspan=cantidad)
+
+        if not self.items:
+            return
+
+        self.scroll_to(self.offset)
+
+    def _bind_scroll(self, widget):
+        if sys.platform.startswith("linux"):
+            widget.bind("<Button-4>", lambda e: self.scroll_by(-1))
+            widget.bind("<Button-5>", lambda e: self.scroll_by(1))
+        else:
+            widget.bind("<MouseWheel>", self._on_mousewheel)
+
+    def set_items(self, items):
+        """Reemplaza los datos que muestra la lista. Solo se reconfiguran las filas visibles."""
+        self.items = items
+        self.etiqueta_mensaje.grid_remove()
+        self.scroll_to(self.offset)
+
+    def reconcile(self, nuevos):
+        """
+        Aplica una nueva lista comparándola por clave con la actual.
+
+        Si solo cambian etiquetas se reconfiguran únicamente esas filas; si hay altas o
+        bajas, la primera fila visible se mantiene en su lugar. Devuelve cuántas filas
+        del pool se reconfiguraron.
+        """
+        viejos = self.items
+
+        if not viejos:
+            self.set_items(nuevos)
+            return len(self.filas)
+
+        if nuevos == viejos:
+            return 0
+
+        claves_viejas = [self.clave(item) for item in viejos]
+        claves_nuevas = [self.clave(item) for item in nuevos]
+
+        if claves_viejas == claves_nuevas:
+            cambiados = [i for i, (viejo, nuevo) in enumerate(zip(viejos, nuevos)) if viejo != nuevo]
+            self.items = nuevos
+            return self._refresh_indices(cambiados)
+
+        posiciones = {clave: i for i, clave in enumerate(claves_nuevas)}
+        nuevo_offset = 0
+
+        # Anclar a la primera fila visible que siga existiendo en la lista nueva
+        for clave in claves_viejas[self.offset:]:
+            if clave in posiciones:
+                nuevo_offset = posiciones[clave]
+                break
+
+        self.items = nuevos
+        self.etiqueta_mensaje.grid_remove()
+
+        max_offset = max(0, len(self.items) - len(self.filas))
+        self.offset = min(nuevo_offset, max_offset)
+
+        return self._render()
+
+    def _refresh_indices(self, indices):
+        reconfiguradas = 0
+
+        for indice in indices:
+            posicion = indice - self.offset
+
+            if 0 <= posicion < len(self.filas):
+                item = self.items[indice]
+                self.filas[posicion].configure(text=item, value=item)
+                reconfiguradas += 1
+
+        return reconfiguradas
+
+    def set_message(self, texto):
+        """Oculta las filas y muestra un mensaje (p. ej. 'Loading versions...')."""
+        self.items = []
+        self.offset = 0
+
+        for fila in self.filas:
+            fila.grid_remove()
+
+        self.etiqueta_mensaje.configure(text=texto)
+        self.etiqueta_mensaje.grid(row=0, column=0, pady=20)
+        self.scrollbar.set(0, 1)
+
+    def scroll_to(self, offset):
+        max_offset = max(0, len(self.items) - len(self.filas))
+        self.offset = min(max(0, int(offset)), max_offset)
+        return self._render()
+
+    def scroll_by(self, filas):
+        self.scroll_to(self.offset + filas)
+
+    def _render(self):
+        """Sincroniza el pool con la ventana visible. Devuelve cuántas filas se reconfiguraron."""
+        reconfiguradas = 0
+
+        for i, fila in enumerate(self.filas):
+            indice = self.offset + i
+
+            if indice < len(self.items):
+                item = self.items[indice]
+
+                if fila.cget("text") != item:
+                    fila.configure(text=item, value=item)
+                    reconfiguradas += 1
+
+                fila.grid()
+            else:
+                fila.grid_remove()
+
+        total = len(self.items)
+
+        if total <= len(self.filas):
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(self.offset / total, (self.offset + len(self.filas)) / total)
+
+        return reconfiguradas
+
+    def _on_scrollbar(self, accion, *args):
+        if accion == "moveto":
+            self.scroll_to(float(args[0]) * len(self.items))
+
+        elif accion == "scroll":
+            cantidad, unidad = int(args[0]), args[1]
+            self.scroll_by(cantidad * len(self.filas) if unidad == "pages" else cantidad)
+
+    def _on_mousewheel(self, event):
+        # En Windows delta viene en múltiplos de 120, en macOS en unidades pequeñas
+        if sys.platform == "darwin":
+            self.scroll_by(-event.delta)
+        else:
+            self.scroll_by(-int(event.delta / 120))
@@ -2,31 +2,46 @@ import os
 import sys
 import subprocess
 import threading
-import queue
-import webbrowser
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import filedialog
 
+import rutas
+import importaciones
+
+# Antes que el resto de los imports, para que el informe (si el config lo pide) los cubra a todos
+IMPORT_TIMER = importaciones.timer_from_config(rutas.get_config_file())
+
 import customtkinter as ctk
 from PIL import Image
 
 import funciones
-
-# Constantes de la UI
-COLOR_ACENTO = "#4caf50"
-COLOR_ACENTO_HOVER = "#45a049"
-COLOR_FONDO_PRINCIPAL = "#3b3b3b"
-
-PADDING_EXTERIOR = 20
-PADDING_SECCION = 8
-PADDING_WIDGET_X = 10
-PADDING_WIDGET_Y = 10
-PADDING_INTERNO = 5
-
-FUENTE_UI = ("Jetbrains Mono", 14)
-FUENTE_TITULO = ("Monocraft", 20)
-FUENTE_ESTADO = ("Monocraft", 16)
-FUENTE_BOTON_LANZAR = ("Monocraft", 20)
-FUENTE_ENCABEZADO = ("Monocraft", 16)
+import arranque
+import despachador
+import instancias
+import perfiles
+from lista_virtual import ListaVersionesVirtual
+from tarjetas_sugerencias import PanelSugerencias
+from tema import (
+    COLOR_ACENTO,
+    COLOR_ACENTO_HOVER,
+    COLOR_FONDO_PRINCIPAL,
+    PADDING_EXTERIOR,
+    PADDING_SECCION,
+    PADDING_WIDGET_X,
+    PADDING_WIDGET_Y,
+    PADDING_INTERNO,
+    FUENTE_UI,
+    FUENTE_TITULO,
+    FUENTE_ESTADO,
+    FUENTE_BOTON_LANZAR,
+    FUENTE_ENCABEZADO,
+    FUENTE_LOG,
+)
+
+# Líneas del juego que se guardan en memoria y las que se muestran en la ventana de log
+LINEAS_LOG_MEMORIA = 2000
+LINEAS_LOG_VENTANA = 500
 
 # Funcion de ayuda para la UI, el menu de ajustes pues
 def _create_skin_preview_image(path, size):
@@ -47,7 +62,7 @@ class PaginaAjustes(ctk.CTkToplevel):
         super().__init__(master)
         self.transient(master)
         self.title("Settings")
-        self.geometry("750x550")
+        self.geometry("750x600")
         self.resizable(False, False)
 
         self.ruta_icono = ruta_icono
@@ -134,13 +149,44 @@ class PaginaAjustes(ctk.CTkToplevel):
 
         self.deslizador_ram.pack(fill="x", padx=PADDING_WIDGET_X, pady=PADDING_WIDGET_Y)
 
+        self.checkbox_auto_tune = ctk.CTkCheckBox(
+            ram_jvm_frame,
+            text="Auto-tune RAM and GC per version",
+            font=FUENTE_UI,
+            command=self._actualizar_estado_ram,
+        )
+
+        self.checkbox_auto_tune.pack(fill="x", padx=PADDING_WIDGET_X, pady=(0, PADDING_INTERNO))
+
+        # Lo que realmente usó la versión seleccionada en sesiones anteriores, para elegir la RAM
+        self.etiqueta_telemetria = ctk.CTkLabel(
+            ram_jvm_frame,
+            text=funciones.format_telemetry_summary(funciones.strip_installed_label(self.master_app.elementos_ui["version_variable"].get())),
+            font=FUENTE_UI,
+            text_color="gray50",
+            anchor="w",
+            justify="left",
+        )
+
+        self.etiqueta_telemetria.pack(fill="x", padx=PADDING_WIDGET_X, pady=(0, PADDING_INTERNO))
+
         self.campo_java = ctk.CTkEntry(
             ram_jvm_frame,
             placeholder_text="e.g., -XX:+UseG1GC",
             font=FUENTE_UI,
         )
 
-        self.campo_java.pack(fill="x", padx=PADDING_WIDGET_X, pady=(0, PADDING_WIDGET_Y))
+        self.campo_java.pack(fill="x", padx=PADDING_WIDGET_X, pady=(0, PADDING_INTERNO))
+
+        self.boton_perfil = ctk.CTkButton(
+            ram_jvm_frame,
+            text="Edit Profile for Selected Version",
+            command=self._abrir_perfil_version,
+            fg_color=COLOR_ACENTO,
+            hover_color=COLOR_ACENTO_HOVER,
+        )
+
+        self.boton_perfil.pack(fill="x", padx=PADDING_WIDGET_X, pady=(0, PADDING_WIDGET_Y))
         
         api_frame = ctk.CTkFrame(right_column)
         api_frame.pack(fill="x", pady=PADDING_SECCION)
@@ -176,6 +222,14 @@ class PaginaAjustes(ctk.CTkToplevel):
         dir_entry.configure(state="disabled")
         dir_entry.pack(fill="x", padx=PADDING_WIDGET_X, pady=PADDING_INTERNO)
 
+        ctk.CTkButton(
+            right_column,
+            text="Import Mod Catalog...",
+            command=self._importar_catalogo,
+            fg_color=COLOR_ACENTO,
+            hover_color=COLOR_ACENTO_HOVER,
+        ).pack(fill="x", pady=(PADDING_SECCION, 0))
+
         delete_button = ctk.CTkButton(
             right_column,
             text="Delete All Stored Data",
@@ -212,6 +266,11 @@ class PaginaAjustes(ctk.CTkToplevel):
 
         self.etiqueta_ram.configure(text=f"RAM Allocation: {self.master_app.ram_guardada} MB")
 
+        if self.master_app.auto_tune_guardado:
+            self.checkbox_auto_tune.select()
+
+        self._actualizar_estado_ram()
+
         if self.master_app.jvm_args_guardados:
             self.campo_java.insert(0, self.master_app.jvm_args_guardados)
 
@@ -253,6 +312,32 @@ class PaginaAjustes(ctk.CTkToplevel):
             funciones.save_configuration(config)
             self.master_app.ultima_ruta_skin = skin_path
 
+    def _importar_catalogo(self):
+        ruta = filedialog.askopenfilename(
+            title="Select mod catalog dump",
+            filetypes=[("JSON / JSON Lines", "*.json *.jsonl"), ("All Files", "*.*")],
+        )
+
+        if not ruta:
+            return
+
+        app = self.master_app
+        app._establecer_estado("Importing mod catalog...", "cyan", persistente=True)
+
+        def _terminado(exito, mensaje):
+            app.despachador.post(app._establecer_estado, mensaje, "green" if exito else "red")
+
+        threading.Thread(target=funciones.import_mod_catalog_in_thread, args=(ruta, _terminado), daemon=True).start()
+
+    def _abrir_perfil_version(self):
+        version_id = funciones.strip_installed_label(self.master_app.elementos_ui["version_variable"].get())
+
+        if not version_id:
+            self.master_app._establecer_estado("Select a version first.", "orange")
+            return
+
+        VentanaPerfil(self, version_id, self.ruta_icono)
+
     def _solicitar_confirmacion_borrado(self):
         dialog = ctk.CTkToplevel(self)
         dialog.title("Confirm Deletion")
@@ -329,40 +414,230 @@ class PaginaAjustes(ctk.CTkToplevel):
     def _actualizar_etiqueta_ram(self, value):
         self.etiqueta_ram.configure(text=f"RAM Allocation: {int(value)} MB")
 
+    def _actualizar_estado_ram(self):
+        # Con el ajuste automático la RAM la decide el perfil de cada versión
+        self.deslizador_ram.configure(state="disabled" if self.checkbox_auto_tune.get() else "normal")
+
     def _guardar_y_cerrar(self):
         config = self.master_app.config
 
         config["ram_mb"] = int(self.deslizador_ram.get())
         config["jvm_args"] = self.campo_java.get()
+        config["auto_tune"] = bool(self.checkbox_auto_tune.get())
         config["google_api_key"] = self.campo_api_key.get().strip()
 
         funciones.save_configuration(config)
 
         self.master_app.ram_guardada = config["ram_mb"]
         self.master_app.jvm_args_guardados = config["jvm_args"]
+        self.master_app.auto_tune_guardado = config["auto_tune"]
         self.master_app.api_key_guardada = config["google_api_key"]
 
         self.master_app._establecer_estado("Settings saved successfully!", "green")
 
         self.destroy()
 
+class VentanaPerfil(ctk.CTkToplevel):
+    """Perfil de lanzamiento de una versión: RAM, JVM args y Java propios. Vacío = usar el global."""
+    def __init__(self, master, version_id, ruta_icono=None):
+        super().__init__(master)
+        self.transient(master)
+        self.grab_set()
+        self.title(f"Profile - {version_id}")
+        self.geometry("500x340")
+        self.resizable(False, False)
+
+        if ruta_icono and os.path.exists(ruta_icono):
+            self.after(250, lambda: self.iconbitmap(ruta_icono))
+
+        self.master_app = master.master_app
+        self.version_id = version_id
+
+        self._crear_widgets()
+        self._poblar_perfil()
+
+    def _crear_widgets(self):
+        ctk.CTkLabel(self, text=f"Launch Profile: {self.version_id}", font=FUENTE_ENCABEZADO).pack(pady=PADDING_WIDGET_Y)
+
+        marco = ctk.CTkFrame(self)
+        marco.pack(fill="both", expand=True, padx=PADDING_EXTERIOR, pady=PADDING_INTERNO)
+
+        self.campo_ram = ctk.CTkEntry(marco, font=FUENTE_UI, placeholder_text="RAM in MB (empty = global / auto-tune)")
+        self.campo_ram.pack(fill="x", padx=PADDING_WIDGET_X, pady=(PADDING_WIDGET_Y, PADDING_INTERNO))
+
+        self.campo_jvm = ctk.CTkEntry(marco, font=FUENTE_UI, placeholder_text="JVM arguments (empty = global)")
+        self.campo_jvm.pack(fill="x", padx=PADDING_WIDGET_X, pady=PADDING_INTERNO)
+
+        marco_java = ctk.CTkFrame(marco, fg_color="transparent")
+        marco_java.pack(fill="x", padx=PADDING_WIDGET_X, pady=PADDING_INTERNO)
+
+        self.campo_java_path = ctk.CTkEntry(marco_java, font=FUENTE_UI, placeholder_text="Java executable (empty = automatic)")
+        self.campo_java_path.pack(side="left", fill="x", expand=True)
+
+        ctk.CTkButton(
+            marco_java,
+            text="Browse",
+            width=80,
+            command=self._elegir_java,
+            fg_color=COLOR_ACENTO,
+            hover_color=COLOR_ACENTO_HOVER,
+        ).pack(side="right", padx=(PADDING_INTERNO, 0))
+
+        self.checkbox_auto_tune = ctk.CTkCheckBox(marco, text="Auto-tune RAM and GC", font=FUENTE_UI)
+        self.checkbox_auto_tune.pack(fill="x", padx=PADDING_WIDGET_X, pady=PADDING_INTERNO)
+
+        btn_frame = ctk.CTkFrame(self, fg_color="transparent")
+        btn_frame.pack(side="bottom", fill="x", padx=PADDING_EXTERIOR, pady=PADDING_WIDGET_Y)
+
+        btn_frame.columnconfigure((0, 1, 2), weight=1)
+
+        ctk.CTkButton(
+            btn_frame,
+            text="Save",
+            command=self._guardar_y_cerrar,
+            fg_color=COLOR_ACENTO,
+            hover_color=COLOR_ACENTO_HOVER,
+        ).grid(row=0, column=0, padx=PADDING_INTERNO, sticky="ew")
+
+        ctk.CTkButton(
+            btn_frame,
+            text="Remove Profile",
+            command=self._borrar_perfil,
+            fg_color="#D32F2F",
+            hover_color="#B71C1C",
+        ).grid(row=0, column=1, padx=PADDING_INTERNO, sticky="ew")
+
+        ctk.CTkButton(
+            btn_frame,
+            text="Cancel",
+            command=self.destroy,
+            fg_color=COLOR_ACENTO,
+            hover_color=COLOR_ACENTO_HOVER,
+        ).grid(row=0, column=2, padx=PADDING_INTERNO, sticky="ew")
+
+    def _poblar_perfil(self):
+        perfil = perfiles.get_profile(self.master_app.config, self.version_id)
+        ajustes, _ = perfiles.resolve(self.master_app.config, self.version_id)
+
+        if "ram_mb" in perfil:
+            self.campo_ram.insert(0, str(perfil["ram_mb"]))
+
+        if "jvm_args" in perfil:
+            self.campo_jvm.insert(0, perfil["jvm_args"])
+
+        if "java_path" in perfil:
+            self.campo_java_path.insert(0, perfil["java_path"])
+
+        if ajustes["auto_tune"]:
+            self.checkbox_auto_tune.select()
+
+        # La casilla siempre muestra un valor; solo se fija en el perfil si ya lo estaba o si el usuario la cambia
+        self._auto_tune_fijado = "auto_tune" in perfil
+        self._auto_tune_inicial = bool(ajustes["auto_tune"])
+
+    def _elegir_java(self):
+        ruta = filedialog.askopenfilename(title="Select Java executable")
+
+        if ruta:
+            self.campo_java_path.delete(0, "end")
+            self.campo_java_path.insert(0, ruta)
+
+    def _guardar_y_cerrar(self):
+        ram = self.campo_ram.get().strip()
+
+        if ram and not ram.isdigit():
+            self.master_app._establecer_estado("Profile RAM must be a number of MB.", "orange")
+            return
+
+        config = self.master_app.config
+        auto_tune = bool(self.checkbox_auto_tune.get())
+
+        perfiles.set_profile(
+            config,
+            self.version_id,
+            ram_mb=int(ram) if ram else None,
+            jvm_args=self.campo_jvm.get().strip() or None,
+            java_path=self.campo_java_path.get().strip() or None,
+            auto_tune=auto_tune if self._auto_tune_fijado or auto_tune != self._auto_tune_inicial else None,
+        )
+
+        funciones.save_configuration(config)
+
+        self.master_app._establecer_estado(f"Profile for {self.version_id} saved!", "green")
+        self.destroy()
+
+    def _borrar_perfil(self):
+        config = self.master_app.config
+
+        perfiles.delete_profile(config, self.version_id)
+        funciones.save_configuration(config)
+
+        self.master_app._establecer_estado(f"Profile for {self.version_id} removed.", "green")
+        self.destroy()
+
+class VentanaLog(ctk.CTkToplevel):
+    """Una ventana que muestra la salida del juego en vivo."""
+    def __init__(self, master, ruta_icono=None):
+        super().__init__(master)
+        self.title("Game Log")
+        self.geometry("900x500")
+
+        if ruta_icono and os.path.exists(ruta_icono):
+            self.after(250, lambda: self.iconbitmap(ruta_icono))
+
+        self.texto = ctk.CTkTextbox(self, font=FUENTE_LOG, wrap="none")
+        self.texto.pack(fill="both", expand=True, padx=PADDING_WIDGET_X, pady=PADDING_WIDGET_Y)
+
+        self.agregar_lineas(list(master.lineas_log))
+
+    def agregar_lineas(self, lineas):
+        if not lineas:
+            return
+
+        # Solo se sigue el final si el usuario no subió a leer algo anterior
+        al_final = self.texto.yview()[1] >= 0.999
+
+        self.texto.insert("end", "\n".join(lineas[-LINEAS_LOG_VENTANA:]) + "\n")
+
+        total = int(self.texto.index("end-1c").split(".")[0])
+
+        if total > LINEAS_LOG_VENTANA:
+            self.texto.delete("1.0", f"{total - LINEAS_LOG_VENTANA}.0")
+
+        if al_final:
+            self.texto.see("end")
+
 class LanzadorMcl(ctk.CTk):
     """Clase principal para la aplicación MCL Launcher (Modo Offline)."""
     def __init__(self):
+        self.tiempos = arranque.StartupTimer()
+
         super().__init__()
 
         self.estado_job_id = None
         self.ventana_ajustes = None
+        self.ventana_log = None
+        self.lineas_log = deque(maxlen=LINEAS_LOG_MEMORIA)
 
         self.ruta_icono = None
-        self.cola_ia = queue.Queue()
+        self.despachador = despachador.Despachador(self)
+        self.instancias = instancias.InstanceManager(
+            on_change=lambda lista: self.despachador.post(self._mostrar_instancias, lista)
+        )
 
+        # Primero se dibuja la ventana vacía, los datos llegan después desde hilos de fondo
         self._configurar_ventana()
-        self._cargar_datos()
+        self._datos_por_defecto()
         self._crear_widgets()
-        self._poblar_datos_iniciales()
         self._vincular_eventos()
-        self._procesar_cola_ia()
+        self.tiempos.mark("skeleton_window")
+
+        self._iniciar_carga_de_datos()
+
+    def mainloop(self, *args, **kwargs):
+        # Lo que los hilos de fondo mandaron antes de que arranque el bucle se procesa en el primer ciclo
+        self.despachador.activar()
+        super().mainloop(*args, **kwargs)
 
     def _configurar_ventana(self):
         self.geometry("1100x700")
@@ -382,18 +657,98 @@ class LanzadorMcl(ctk.CTk):
         except Exception as e:
             print(f"No se pudo cargar el ícono: {e}")
 
-    def _cargar_datos(self):
-        self.config = funciones.load_configuration()
+    def _datos_por_defecto(self):
+        self.config = {}
+
+        self.TODAS_LAS_VERSIONES = []
+        self.IDS_INSTALADAS = set()
+        self._etapas_pendientes = {"config", "installed_versions", "version_manifest"}
+
+        self.ultimo_usuario = ""
+        self.ultima_ruta_skin = ""
+
+        self.ram_guardada = 512
+        self.jvm_args_guardados = ""
+        self.auto_tune_guardado = True
+        self.api_key_guardada = ""
+
+    def _iniciar_carga_de_datos(self):
+        """Lanza en paralelo la carga de config, versiones instaladas y manifiesto."""
+        self.after(0, lambda: self.tiempos.mark("first_frame"))
+
+        # Si el manifiesto en caché estaba vencido, la lista nueva llega después por el despachador
+        def _on_versions_updated(versiones):
+            self.despachador.post(self._aplicar_versiones, versiones)
+
+        tareas = {
+            "config": (funciones.load_configuration, (), self._aplicar_configuracion),
+            "installed_versions": (funciones.load_installed_ids, (), self._aplicar_versiones_instaladas),
+            "version_manifest": (funciones.load_version_list, (_on_versions_updated,), self._aplicar_versiones),
+        }
+
+        executor = ThreadPoolExecutor(max_workers=len(tareas), thread_name_prefix="arranque")
+
+        for nombre, (funcion, args, aplicar) in tareas.items():
+            executor.submit(self._ejecutar_etapa, nombre, funcion, args, aplicar)
 
-        self.TODAS_LAS_VERSIONES, self.IDS_INSTALADAS = funciones.load_initial_data()
+        executor.shutdown(wait=False)
+
+    def _ejecutar_etapa(self, nombre, funcion, args, aplicar):
+        try:
+            resultado = self.tiempos.run_stage(nombre, funcion, *args)
+        except Exception as e:
+            print(f"Error en la etapa de arranque '{nombre}': {e}")
+            resultado = None
+
+        self.despachador.post(self._finalizar_etapa, nombre, aplicar, resultado)
+
+    def _finalizar_etapa(self, nombre, aplicar, resultado):
+        if resultado is not None:
+            aplicar(resultado)
+
+        self._etapas_pendientes.discard(nombre)
+
+        if not self._etapas_pendientes:
+            self.boton_jugar.configure(state="normal")
+            self.tiempos.mark("startup_complete")
+            arranque.save_report(self.tiempos, funciones.APP_DATA_DIR)
+
+            threading.Thread(target=funciones.collect_store_garbage, daemon=True).start()
+            # minecraft_launcher_lib (y la IA, si hay API key) se cargan ahora, con la ventana ya visible
+            precargar = [funciones.minecraft_launcher_lib] + ([funciones.genai] if self.api_key_guardada else [])
+            importaciones.preload(precargar)
+
+            if IMPORT_TIMER is not None:
+                IMPORT_TIMER.save_report(funciones.APP_DATA_DIR)
+                IMPORT_TIMER.uninstall()
+
+            # Se prueban los java nuevos ahora, para que al lanzar ya estén en el caché
+            threading.Thread(target=lambda: funciones.get_java_runtimes().scan(funciones.MINECRAFT_DIRECTORY), daemon=True).start()
+
+    def _aplicar_configuracion(self, config):
+        self.config.update(config)
 
         self.ultimo_usuario = self.config.get("last_username", "")
         self.ultima_ruta_skin = self.config.get("last_skin_path", "")
 
         self.ram_guardada = self.config.get("ram_mb", 512)
         self.jvm_args_guardados = self.config.get("jvm_args", "")
+        self.auto_tune_guardado = perfiles.global_setting(self.config, "auto_tune")
         self.api_key_guardada = self.config.get("google_api_key", "")
 
+        if self.ultimo_usuario and not self.campo_usuario.get():
+            self.campo_usuario.insert(0, self.ultimo_usuario)
+
+    def _aplicar_versiones_instaladas(self, ids_instaladas):
+        self.IDS_INSTALADAS.update(ids_instaladas)
+
+        if "version_manifest" not in self._etapas_pendientes:
+            funciones.update_version_list(self.elementos_ui, self.TODAS_LAS_VERSIONES, self.IDS_INSTALADAS)
+
+    def _aplicar_versiones(self, versiones):
+        self.TODAS_LAS_VERSIONES[:] = versiones
+        funciones.update_version_list(self.elementos_ui, self.TODAS_LAS_VERSIONES, self.IDS_INSTALADAS)
+
     def _crear_widgets(self):
         seccion_principal = ctk.CTkFrame(self, fg_color=COLOR_FONDO_PRINCIPAL)
         seccion_principal.pack(
@@ -429,7 +784,12 @@ class LanzadorMcl(ctk.CTk):
             pady=(PADDING_INTERNO, PADDING_WIDGET_Y),
         )
 
-        self.elementos_ui = {"version_variable": ctk.StringVar(master=self), "app": self}
+        self.elementos_ui = {
+            "version_variable": ctk.StringVar(master=self),
+            "app": self,
+            "append_game_log": self._agregar_lineas_log,
+            "instances": self.instancias,
+        }
 
         self._crear_panel_izquierdo()
         self._crear_panel_derecho()
@@ -467,8 +827,14 @@ class LanzadorMcl(ctk.CTk):
             font=FUENTE_UI,
         ).grid(row=0, column=0, padx=PADDING_WIDGET_X, pady=(PADDING_WIDGET_Y, 0), sticky="w")
 
-        self.elementos_ui["version_scroll_frame"] = ctk.CTkScrollableFrame(marco_version, fg_color="transparent")
-        self.elementos_ui["version_scroll_frame"].grid(
+        self.elementos_ui["version_list"] = ListaVersionesVirtual(
+            marco_version,
+            self.elementos_ui["version_variable"],
+            clave=funciones.strip_installed_label,
+            fg_color="transparent",
+        )
+
+        self.elementos_ui["version_list"].grid(
             row=1,
             column=0,
             padx=PADDING_WIDGET_X,
@@ -476,6 +842,8 @@ class LanzadorMcl(ctk.CTk):
             sticky="nsew",
         )
 
+        self.elementos_ui["version_list"].set_message("Loading versions...")
+
         self.checkbox_snapshots = ctk.CTkCheckBox(marco_version, text="Show Snapshots and other versions")
         self.checkbox_snapshots.grid(row=2, column=0, padx=PADDING_WIDGET_X, pady=PADDING_WIDGET_Y, sticky="w")
 
@@ -533,6 +901,15 @@ class LanzadorMcl(ctk.CTk):
 
         self.campo_entrada_ia.pack(fill="x", padx=PADDING_WIDGET_X, pady=PADDING_INTERNO)
 
+        # Planificar un modpack: un pedido por versión (o por tema separado con ";"), todos a la vez
+        self.campo_versiones_ia = ctk.CTkEntry(
+            marco_input_ia,
+            font=FUENTE_UI,
+            placeholder_text="Target versions (optional), e.g., 1.19.2, 1.20.1",
+        )
+
+        self.campo_versiones_ia.pack(fill="x", padx=PADDING_WIDGET_X, pady=(0, PADDING_INTERNO))
+
         self.boton_ia = ctk.CTkButton(
             marco_input_ia,
             text="Get Suggestions",
@@ -541,17 +918,27 @@ class LanzadorMcl(ctk.CTk):
             hover_color=COLOR_ACENTO_HOVER,
         )
 
-        self.boton_ia.pack(fill="x", padx=PADDING_WIDGET_X, pady=(PADDING_INTERNO, PADDING_WIDGET_Y))
+        self.boton_ia.pack(fill="x", padx=PADDING_WIDGET_X, pady=(PADDING_INTERNO, 0))
 
-        self.marco_sugerencias_ia = ctk.CTkScrollableFrame(self.panel_derecho, label_text="Suggestions")
+        ctk.CTkButton(
+            marco_input_ia,
+            text="Search Local Catalog",
+            command=self._buscar_en_catalogo,
+            fg_color=COLOR_ACENTO,
+            hover_color=COLOR_ACENTO_HOVER,
+        ).pack(fill="x", padx=PADDING_WIDGET_X, pady=(PADDING_INTERNO, PADDING_WIDGET_Y))
+
+        # Instancias del juego en ejecución, oculto mientras no haya ninguna
+        self.marco_instancias = ctk.CTkFrame(self.panel_derecho)
+
+        # Las tarjetas se reciclan entre búsquedas en lugar de destruirse y crearse de nuevo
+        self.marco_sugerencias_ia = PanelSugerencias(self.panel_derecho, label_text="Suggestions")
         self.marco_sugerencias_ia.pack(fill="both", expand=True, padx=PADDING_SECCION, pady=(0, PADDING_SECCION))
 
-        ctk.CTkLabel(
-            self.marco_sugerencias_ia,
-            text="AI suggestions will appear here... \n if you dont set up the API key, nothing will happen. \n so set it up!",
-            font=FUENTE_UI,
-            text_color="gray50",
-        ).pack(pady=50)
+        self.marco_sugerencias_ia.set_message(
+            "AI suggestions will appear here... \n if you dont set up the API key, nothing will happen. \n so set it up!",
+            pady=50,
+        )
 
     def _crear_panel_inferior(self):
         marco_jugar = ctk.CTkFrame(self.panel_inferior)
@@ -574,6 +961,39 @@ class LanzadorMcl(ctk.CTk):
 
         self.boton_ajustes.pack(side="right", padx=PADDING_INTERNO, pady=(PADDING_WIDGET_Y - PADDING_INTERNO))
 
+        self.boton_log = ctk.CTkButton(
+            marco_jugar,
+            text="Log",
+            width=80,
+            height=50,
+            font=FUENTE_BOTON_LANZAR,
+            fg_color=COLOR_ACENTO,
+            hover_color=COLOR_ACENTO_HOVER,
+            command=self._abrir_ventana_log,
+        )
+
+        self.boton_log.pack(side="right", padx=PADDING_INTERNO, pady=(PADDING_WIDGET_Y - PADDING_INTERNO))
+
+        # Progreso de instalación, oculto hasta que empieza una instalación
+        self.marco_progreso = ctk.CTkFrame(marco_jugar, fg_color="transparent")
+
+        self.barra_progreso = ctk.CTkProgressBar(self.marco_progreso, width=150, progress_color=COLOR_ACENTO)
+        self.barra_progreso.pack(side="left", padx=PADDING_INTERNO)
+
+        self.boton_cancelar_instalacion = ctk.CTkButton(
+            self.marco_progreso,
+            text="Cancel",
+            width=70,
+            fg_color="#D32F2F",
+            hover_color="#B71C1C",
+        )
+
+        self.boton_cancelar_instalacion.pack(side="left", padx=PADDING_INTERNO)
+
+        self.elementos_ui["install_progress_frame"] = self.marco_progreso
+        self.elementos_ui["install_progress_bar"] = self.barra_progreso
+        self.elementos_ui["install_cancel_button"] = self.boton_cancelar_instalacion
+
         self.boton_jugar = ctk.CTkButton(
             marco_jugar,
             text="Launch Game",
@@ -582,13 +1002,11 @@ class LanzadorMcl(ctk.CTk):
             font=FUENTE_BOTON_LANZAR,
             fg_color=COLOR_ACENTO,
             hover_color=COLOR_ACENTO_HOVER,
+            state="disabled",
         )
 
         self.boton_jugar.place(relx=0.5, rely=0.5, anchor="center")
-
-    def _poblar_datos_iniciales(self):
-        if self.ultimo_usuario: self.campo_usuario.insert(0, self.ultimo_usuario)
-        funciones.update_version_list(self.elementos_ui, self.TODAS_LAS_VERSIONES, self.IDS_INSTALADAS)
+        self.elementos_ui["launch_button"] = self.boton_jugar
 
     def _vincular_eventos(self):
         self.checkbox_snapshots.configure(command=lambda: funciones.update_version_list(self.elementos_ui, self.TODAS_LAS_VERSIONES, self.IDS_INSTALADAS))
@@ -600,6 +1018,64 @@ class LanzadorMcl(ctk.CTk):
             self.ventana_ajustes = PaginaAjustes(self, self.ruta_icono)
         self.ventana_ajustes.focus()
 
+    def _abrir_ventana_log(self):
+        if self.ventana_log is None or not self.ventana_log.winfo_exists():
+            self.ventana_log = VentanaLog(self, self.ruta_icono)
+        self.ventana_log.focus()
+
+    def _agregar_lineas_log(self, lineas):
+        self.lineas_log.extend(lineas)
+
+        if self.ventana_log is not None and self.ventana_log.winfo_exists():
+            self.ventana_log.agregar_lineas(lineas)
+
+    def _mostrar_instancias(self, lista):
+        for widget in self.marco_instancias.winfo_children():
+            widget.destroy()
+
+        if not lista:
+            self.marco_instancias.pack_forget()
+            return
+
+        ctk.CTkLabel(
+            self.marco_instancias,
+            text=f"Running Instances ({len(lista)})",
+            font=FUENTE_ENCABEZADO,
+            anchor="w",
+        ).pack(fill="x", padx=PADDING_WIDGET_X, pady=(PADDING_INTERNO, 0))
+
+        for instancia in lista:
+            fila = ctk.CTkFrame(self.marco_instancias, fg_color="transparent")
+            fila.pack(fill="x", padx=PADDING_WIDGET_X, pady=(0, PADDING_INTERNO))
+
+            ctk.CTkLabel(
+                fila,
+                text=f"{instancia.version_id}  (PID {instancia.pid})",
+                font=FUENTE_UI,
+                anchor="w",
+            ).pack(side="left", fill="x", expand=True)
+
+            ctk.CTkButton(
+                fila,
+                text="Kill",
+                width=70,
+                fg_color="#D32F2F",
+                hover_color="#B71C1C",
+                command=lambda pid=instancia.pid: self._matar_instancia(pid),
+            ).pack(side="right")
+
+        if not self.marco_instancias.winfo_manager():
+            self.marco_instancias.pack(
+                fill="x",
+                padx=PADDING_SECCION,
+                pady=(0, PADDING_SECCION),
+                before=self.marco_sugerencias_ia,
+            )
+
+    def _matar_instancia(self, pid):
+        if self.instancias.kill(pid):
+            self._establecer_estado(f"Stopping instance {pid}...", "orange")
+
     def _obtener_sugerencias_ia(self):
         prompt = self.campo_entrada_ia.get()
         if not prompt.strip():
@@ -607,56 +1083,79 @@ class LanzadorMcl(ctk.CTk):
         if not self.api_key_guardada:
             self._establecer_estado("API Key not set. \n Please add it in Settings.", "orange"); return
         
-        self._establecer_estado("AI is thinking...", "cyan")
+        pedidos = funciones.build_batch_prompts(prompt, self.campo_versiones_ia.get())
+
         self.boton_ia.configure(state="disabled")
-        for widget in self.marco_sugerencias_ia.winfo_children(): widget.destroy()
-        
-        threading.Thread(target=funciones.call_ia_api_in_thread, args=(prompt, self.api_key_guardada, self.cola_ia), daemon=True).start()
+        self.marco_sugerencias_ia.clear()
 
-    def _procesar_cola_ia(self):
-        try:
-            tipo_mensaje, datos = self.cola_ia.get_nowait()
-            if tipo_mensaje == "SUCCESS":
-                self._poblar_sugerencias(datos)
-                self._establecer_estado("Suggestions loaded!", "green")
-            elif tipo_mensaje == "ERROR":
-                self._establecer_estado(f"AI Error: {datos}", "red")
-                ctk.CTkLabel(self.marco_sugerencias_ia, text=f"An error occurred:\n{datos}", font=FUENTE_UI, text_color="gray50").pack(pady=20)
-            self.boton_ia.configure(state="normal")
-        except queue.Empty: pass
-        finally: self.after(100, self._procesar_cola_ia)
+        if len(pedidos) > 1:
+            self._establecer_estado(f"AI is thinking... \n ({len(pedidos)} requests)", "cyan", persistente=True)
+            threading.Thread(target=funciones.call_ia_batch_in_thread, args=(pedidos, self.api_key_guardada, self._recibir_resultado_ia, self._recibir_sugerencia_ia), daemon=True).start()
+            return
+
+        self._establecer_estado("AI is thinking...", "cyan", persistente=True)
+        threading.Thread(target=funciones.call_ia_api_in_thread, args=(pedidos[0] if pedidos else prompt, self.api_key_guardada, self._recibir_resultado_ia, self._recibir_sugerencia_ia), daemon=True).start()
+
+    def _buscar_en_catalogo(self):
+        texto = self.campo_entrada_ia.get()
+        if not texto.strip():
+            self._establecer_estado("Please describe the \n mods you want.", "orange"); return
+        catalogo = funciones.get_mod_catalog()
+        if catalogo is None:
+            self._establecer_estado("The mod catalog is unavailable.", "red"); return
+        if not catalogo.count():
+            self._establecer_estado("The mod catalog is empty. \n Import one in Settings.", "orange"); return
+
+        # Sin red y en milisegundos: se puede hacer directamente en el hilo de la UI
+        version_id = funciones.strip_installed_label(self.elementos_ui["version_variable"].get())
+        resultados = funciones.search_mod_catalog(texto, version_id)
+
+        if not resultados:
+            self.marco_sugerencias_ia.set_message("No mods in the catalog match that search.")
+            self._establecer_estado("No catalog results.", "orange")
+            return
+
+        self.marco_sugerencias_ia.set_items(resultados)
+        self._establecer_estado(f"{len(resultados)} mods found in the catalog.", "green")
+
+    def _recibir_resultado_ia(self, tipo_mensaje, datos):
+        """Se llama desde el hilo de la IA; el resultado se muestra en el hilo de la UI."""
+        self.despachador.post(self._mostrar_resultado_ia, tipo_mensaje, datos)
+
+    def _recibir_sugerencia_ia(self, mod):
+        """Se llama desde el hilo de la IA por cada sugerencia que termina de llegar."""
+        self.despachador.post(self._agregar_sugerencia, mod)
+
+    def _mostrar_resultado_ia(self, tipo_mensaje, datos):
+        if tipo_mensaje == "SUCCESS":
+            self._poblar_sugerencias(datos)
+            self._establecer_estado("Suggestions loaded!", "green")
+        elif tipo_mensaje == "ERROR":
+            self._establecer_estado(f"AI Error: {datos}", "red")
+            self.marco_sugerencias_ia.set_message(f"An error occurred:\n{datos}")
+        self.boton_ia.configure(state="normal")
 
     def _poblar_sugerencias(self, mods_sugeridos):
         if not mods_sugeridos:
-            ctk.CTkLabel(self.marco_sugerencias_ia, text="AI didn't find any suggestions.", font=FUENTE_UI, text_color="gray50").pack(pady=20)
+            self.marco_sugerencias_ia.set_message("AI didn't find any suggestions.")
             return
-            
-        for mod in mods_sugeridos:
-            card = ctk.CTkFrame(self.marco_sugerencias_ia)
-            card.pack(fill="x", padx=PADDING_INTERNO, pady=PADDING_INTERNO)
-            
-            ctk.CTkLabel(card, text=mod.get("name", "Unnamed Mod"), font=(FUENTE_UI[0], FUENTE_UI[1], "bold"), anchor="w").pack(fill="x", padx=PADDING_INTERNO, pady=(PADDING_INTERNO, 0))
-            ctk.CTkLabel(card, text=mod.get("description", "No description."), wraplength=450, justify="left", anchor="w").pack(fill="x", padx=PADDING_INTERNO)
-            
-            bottom_frame = ctk.CTkFrame(card, fg_color="transparent")
-            bottom_frame.pack(fill="x", padx=PADDING_INTERNO, pady=PADDING_INTERNO)
-            bottom_frame.columnconfigure(2, weight=1)
-
-            ctk.CTkLabel(bottom_frame, text=f"Loader: {mod.get('loader', 'N/A')}", font=(FUENTE_UI[0], 12), text_color="gray").grid(row=0, column=0, sticky="w", padx=(0, PADDING_WIDGET_X))
-            ctk.CTkLabel(bottom_frame, text=f"Version: {mod.get('version', 'N/A')}", font=(FUENTE_UI[0], 12), text_color="gray").grid(row=0, column=1, sticky="w")
-
-            mod_url = mod.get("url")
-            button = ctk.CTkButton(bottom_frame, text="Go to Page" if mod_url else "No URL", state="normal" if mod_url else "disabled", fg_color=COLOR_ACENTO if mod_url else "gray50", hover_color=COLOR_ACENTO_HOVER, command=lambda url=mod_url: webbrowser.open(url))
-            button.grid(row=0, column=3, sticky="e")
+
+        # Las que llegaron por streaming ya están en el panel; set_items no reconfigura las tarjetas que no cambian
+        self.marco_sugerencias_ia.set_items(mods_sugeridos)
+
+    def _agregar_sugerencia(self, mod):
+        self.marco_sugerencias_ia.append(mod)
 
     def _restaurar_estado_defecto(self):
         self.etiqueta_estado.configure(text="Status: Ready", text_color="white")
         self.estado_job_id = None
 
-    def _establecer_estado(self, texto, color="white"):
+    def _establecer_estado(self, texto, color="white", persistente=False):
+        """Muestra un estado que vuelve a "Ready" a los 5 s, salvo los persistentes (tareas en curso)."""
         if self.estado_job_id: self.after_cancel(self.estado_job_id)
+        self.estado_job_id = None
         self.etiqueta_estado.configure(text=f"Status: {texto}", text_color=color)
-        if texto != "AI is thinking...":
+        if not persistente:
             self.estado_job_id = self.after(5000, self._restaurar_estado_defecto)
 
     def _abrir_directorio_versiones(self):
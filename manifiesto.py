@@ -0,0 +1,173 @@
+import os
+import json
+import time
+import threading
+import urllib.request
+import urllib.error
+from datetime import datetime
+
+MANIFEST_URL = "https://launchermeta.mojang.com/mc/game/version_manifest_v2.json"
+MANIFEST_CACHE_FILE = "version_manifest_cache.json"
+
+# Tiempo (en segundos) que el manifiesto se considera fresco sin volver a preguntar al servidor
+DEFAULT_TTL = 6 * 60 * 60
+DEFAULT_TIMEOUT = 10
+
+
+def parse_version_list(manifest):
+    """Convierte el manifiesto crudo al mismo formato que devuelve get_version_list()."""
+    versions = []
+
+    for v in manifest.get("versions", []):
+        try:
+            release_time = datetime.fromisoformat(v["releaseTime"])
+        except (KeyError, ValueError):
+            release_time = datetime.fromtimestamp(0)
+
+        versions.append({
+            "id": v["id"],
+            "type": v["type"],
+            "releaseTime": release_time,
+            "complianceLevel": v.get("complianceLevel", 0),
+        })
+
+    return versions
+
+
+class ManifestCache:
+    """Caché persistente del manifiesto de versiones con revalidación ETag/Last-Modified."""
+    def __init__(self, cache_dir, url=MANIFEST_URL, ttl=DEFAULT_TTL, timeout=DEFAULT_TIMEOUT):
+        self.url = url
+        self.ttl = ttl
+        self.timeout = timeout
+        self.cache_path = os.path.join(cache_dir, MANIFEST_CACHE_FILE)
+
+        self._lock = threading.Lock()
+        self._refresh_thread = None
+
+    def read_entry(self):
+        """Lee la entrada guardada en disco, devuelve None si no existe o está corrupta."""
+        if not os.path.exists(self.cache_path):
+            return None
+
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+
+        except (json.JSONDecodeError, IOError):
+            return None
+
+        if not isinstance(entry, dict) or "manifest" not in entry:
+            return None
+
+        return entry
+
+    def write_entry(self, entry):
+        """Guarda la entrada de forma atómica (archivo temporal + replace)."""
+        tmp_path = self.cache_path + ".tmp"
+
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+
+            os.replace(tmp_path, self.cache_path)
+
+        except OSError as e:
+            print(f"Error al guardar el caché del manifiesto: {e}")
+
+    def is_fresh(self, entry):
+        return entry is not None and time.time() - entry.get("fetched_at", 0) < self.ttl
+
+    def fetch(self, entry=None):
+        """Descarga el manifiesto usando una petición condicional. Devuelve (entrada, cambió)."""
+        request = urllib.request.Request(self.url)
+
+        if entry:
+            if entry.get("etag"):
+                request.add_header("If-None-Match", entry["etag"])
+
+            if entry.get("last_modified"):
+                request.add_header("If-Modified-Since", entry["last_modified"])
+
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                manifest = json.loads(response.read().decode("utf-8"))
+
+                new_entry = {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "fetched_at": time.time(),
+                    "manifest": manifest,
+                }
+                changed = entry is None or entry.get("manifest") != manifest
+
+        except urllib.error.HTTPError as e:
+            # 304: lo que tenemos sigue siendo válido, solo renovamos la marca de tiempo
+            if e.code != 304 or entry is None:
+                raise
+
+            new_entry = dict(entry, fetched_at=time.time())
+            changed = False
+
+        with self._lock:
+            self.write_entry(new_entry)
+
+        return new_entry, changed
+
+    def _refresh_in_background(self, entry, on_update):
+        def _worker():
+            try:
+                new_entry, changed = self.fetch(entry)
+
+                if changed and on_update:
+                    on_update(parse_version_list(new_entry["manifest"]))
+
+            except Exception as e:
+                print(f"No se pudo revalidar el manifiesto: {e}")
+
+        if self._refresh_thread and self._refresh_thread.is_alive():
+            return
+
+        self._refresh_thread = threading.Thread(target=_worker, daemon=True)
+        self._refresh_thread.start()
+
+    def find_version(self, version_id):
+        """Devuelve la entrada cruda (url, sha1...) de una versión en el manifiesto guardado."""
+        entry = self.read_entry()
+
+        if entry is None:
+            return None
+
+        for v in entry["manifest"].get("versions", []):
+            if v["id"] == version_id:
+                return v
+
+        return None
+
+    def get_versions(self, stale_while_revalidate=True, on_update=None):
+        """
+        Devuelve la lista de versiones.
+
+        Si el caché está fresco no toca la red. Si está vencido y stale_while_revalidate
+        está activo, devuelve lo guardado y revalida en segundo plano (on_update recibe
+        la lista nueva solo si cambió). Si la red falla, se usa el caché aunque esté vencido.
+        """
+        entry = self.read_entry()
+
+        if self.is_fresh(entry):
+            return parse_version_list(entry["manifest"])
+
+        if entry and stale_while_revalidate:
+            self._refresh_in_background(entry, on_update)
+            return parse_version_list(entry["manifest"])
+
+        try:
+            entry, _ = self.fetch(entry)
+
+        except Exception as e:
+            if entry is None:
+                raise
+
+            print(f"Usando manifiesto en caché, el servidor no respondió: {e}")
+
+        return parse_version_list(entry["manifest"])
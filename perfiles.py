@@ -0,0 +1,66 @@
+# Perfiles de lanzamiento por versión. Se guardan en config["profiles"] = {version_id: {clave: valor}}
+# y cada perfil solo tiene las claves que el usuario fijó para esa versión.
+
+PROFILE_KEYS = ("ram_mb", "jvm_args", "java_path", "auto_tune")
+
+GLOBAL_DEFAULTS = {
+    "ram_mb": 512,
+    "jvm_args": "",
+    "java_path": "",
+    "auto_tune": True,
+}
+
+
+def global_setting(config, key):
+    """
+    Valor global de una clave de perfil.
+
+    Una configuración de antes del afinador que ya tiene su RAM elegida no se pasa sola
+    al auto-tune: sin "auto_tune" guardado, solo arranca activado si tampoco hay "ram_mb".
+    """
+    if key == "auto_tune" and key not in config:
+        return "ram_mb" not in config
+
+    return config.get(key, GLOBAL_DEFAULTS[key])
+
+
+def get_profile(config, version_id):
+    return config.get("profiles", {}).get(version_id, {})
+
+
+def resolve(config, version_id):
+    """
+    Ajustes efectivos para lanzar una versión: su perfil por encima de los globales.
+
+    Devuelve (ajustes, claves que vienen del perfil). Son dos búsquedas en diccionarios,
+    no depende de cuántos perfiles haya.
+    """
+    profile = get_profile(config, version_id)
+    settings = {key: profile.get(key, global_setting(config, key)) for key in PROFILE_KEYS}
+    return settings, set(profile)
+
+
+def set_profile(config, version_id, **overrides):
+    """
+    Guarda en config el perfil de la versión. Los valores None no se guardan.
+
+    Un valor igual al global sí se guarda: el usuario lo fijó para esta versión y no tiene
+    que cambiar si después cambia el global (ni lo puede pisar el auto-tune).
+    """
+    profile = {key: value for key, value in overrides.items() if key in PROFILE_KEYS and value is not None}
+
+    profiles = config.setdefault("profiles", {})
+
+    if profile:
+        profiles[version_id] = profile
+    else:
+        profiles.pop(version_id, None)
+
+    if not profiles:
+        config.pop("profiles", None)
+
+    return profile
+
+
+def delete_profile(config, version_id):
+    set_profile(config, version_id)
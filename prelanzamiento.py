@@ -0,0 +1,199 @@
+import os
+import json
+import time
+import hashlib
+import platform
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import descargas
+
+NATIVES_STAMP_FILE = ".mcl_natives_stamp"
+STAT_WORKERS = 16
+
+
+def _load_version_chain(version_id, minecraft_directory):
+    """Devuelve (id de la carpeta de natives, librerías) juntando la cadena de inheritsFrom."""
+    libraries = []
+    vistos = set()
+    natives_id = None
+
+    while version_id and version_id not in vistos:
+        vistos.add(version_id)
+        json_path = os.path.join(minecraft_directory, "versions", version_id, f"{version_id}.json")
+
+        with open(json_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        # Las librerías del hijo van primero; una del padre con el mismo nombre no se repite
+        nombres = {":".join(lib["name"].split(":")[:2]) for lib in libraries}
+        libraries.extend(lib for lib in data.get("libraries", []) if ":".join(lib["name"].split(":")[:2]) not in nombres)
+
+        # Los natives van en la carpeta de la versión que se lanza, no en la del padre
+        natives_id = natives_id or data.get("id", version_id)
+        version_id = data.get("inheritsFrom")
+
+    return natives_id, libraries
+
+
+def maven_path(name, minecraft_directory, classifier=None):
+    """Ruta de una librería a partir de su nombre Maven (grupo:artefacto:versión[:clasificador][@ext])."""
+    name, _, extension = name.partition("@")
+    parts = name.split(":")
+    group, artifact, version = parts[0:3]
+    extra = parts[3:] + ([classifier] if classifier else [])
+
+    filename = "-".join([artifact, version] + extra) + "." + (extension or "jar")
+    return os.path.join(minecraft_directory, "libraries", *group.split("."), artifact, version, filename)
+
+
+def _library_files(libraries, minecraft_directory):
+    """Devuelve (rutas de librerías, [(jar nativo, exclusiones)]) para el sistema actual."""
+    arch = "32" if platform.architecture()[0] == "32bit" else "64"
+    paths = []
+    natives = []
+
+    for library in libraries:
+        if not descargas.library_allowed(library):
+            continue
+
+        artifact = library.get("downloads", {}).get("artifact")
+
+        if artifact and "path" in artifact:
+            paths.append(os.path.join(minecraft_directory, "libraries", artifact["path"]))
+        elif "downloads" not in library:
+            paths.append(maven_path(library["name"], minecraft_directory))
+
+        native = library.get("natives", {}).get(descargas.os_name())
+
+        if native:
+            native = native.replace("${arch}", arch)
+            classifier = library.get("downloads", {}).get("classifiers", {}).get(native, {})
+
+            if "path" in classifier:
+                native_path = os.path.join(minecraft_directory, "libraries", classifier["path"])
+            else:
+                native_path = maven_path(library["name"], minecraft_directory, native)
+
+            paths.append(native_path)
+            natives.append((native_path, library.get("extract", {}).get("exclude", [])))
+
+    return paths, natives
+
+
+def _stat(path):
+    try:
+        st = os.stat(path)
+        return path, (st.st_size, st.st_mtime_ns)
+    except OSError:
+        return path, None
+
+
+def stat_files(paths, workers=STAT_WORKERS):
+    """Hace stat de muchos archivos en paralelo (en discos lentos o con antivirus se nota). Devuelve {ruta: (tamaño, mtime) o None}."""
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prelanzamiento") as executor:
+        return dict(executor.map(_stat, paths))
+
+
+def _natives_stamp(natives, stats):
+    h = hashlib.sha1()
+
+    for path, exclude in natives:
+        h.update(json.dumps([path, stats.get(path), exclude]).encode("utf-8"))
+
+    return h.hexdigest()
+
+
+def _extract_native(jar_path, exclude, natives_dir):
+    raiz = os.path.abspath(natives_dir)
+
+    with zipfile.ZipFile(jar_path, "r") as zf:
+        for member in zf.infolist():
+            if any(member.filename.startswith(e) for e in exclude):
+                continue
+
+            # Varios jars se extraen a la vez en la misma carpeta: ZipFile.extract crea los
+            # directorios sin exist_ok y dos hilos pueden chocar con FileExistsError
+            destino = os.path.abspath(os.path.join(raiz, member.filename))
+            carpeta = destino if member.is_dir() else os.path.dirname(destino)
+
+            if os.path.commonpath([raiz, carpeta]) == raiz:
+                os.makedirs(carpeta, exist_ok=True)
+
+                if member.is_dir():
+                    continue
+
+            zf.extract(member, natives_dir)
+
+
+def extract_natives_if_stale(natives, stats, natives_dir):
+    """Extrae los natives solo si cambió algún jar nativo desde la última extracción. Devuelve True si extrajo."""
+    if not natives:
+        return False
+
+    stamp = _natives_stamp(natives, stats)
+    stamp_path = os.path.join(natives_dir, NATIVES_STAMP_FILE)
+
+    try:
+        with open(stamp_path, "r", encoding="utf-8") as f:
+            if f.read().strip() == stamp:
+                return False
+
+    except OSError:
+        pass
+
+    os.makedirs(natives_dir, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=min(len(natives), STAT_WORKERS)) as executor:
+        futures = [
+            executor.submit(_extract_native, jar_path, exclude, natives_dir)
+            for jar_path, exclude in natives
+            if stats.get(jar_path) is not None
+        ]
+
+        for future in futures:
+            future.result()
+
+    with open(stamp_path, "w", encoding="utf-8") as f:
+        f.write(stamp)
+
+    return True
+
+
+class PhaseTimer:
+    """Acumula la duración en milisegundos de cada fase del prelanzamiento."""
+    def __init__(self):
+        self.timings = {}
+        self._inicio = time.perf_counter()
+
+    def lap(self, fase):
+        ahora = time.perf_counter()
+        self.timings[fase] = round((ahora - self._inicio) * 1000, 1)
+        self._inicio = ahora
+
+    def report(self):
+        return ", ".join(f"{fase} {ms:.1f} ms" for fase, ms in self.timings.items())
+
+
+def prepare_launch(version_id, minecraft_directory, timer=None):
+    """
+    Verifica las librerías y extrae los natives antes de lanzar.
+
+    Devuelve (rutas faltantes, timer) para que quien lanza pueda avisar y ver los tiempos.
+    """
+    timer = timer or PhaseTimer()
+
+    natives_id, libraries = _load_version_chain(version_id, minecraft_directory)
+    paths, natives = _library_files(libraries, minecraft_directory)
+    timer.lap("resolve")
+
+    stats = stat_files(paths)
+    missing = [path for path, st in stats.items() if st is None]
+    timer.lap("libraries")
+
+    # Se reutilizan los stat de la fase anterior para decidir si hay que volver a extraer
+    natives_dir = os.path.join(minecraft_directory, "versions", natives_id, "natives")
+    extract_natives_if_stale(natives, stats, natives_dir)
+    timer.lap("natives")
+
+    return missing, timer
@@ -0,0 +1,299 @@
+import os
+import re
+import sys
+import glob
+import json
+import shutil
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import afinador
+
+JAVA_CACHE_FILE = "java_runtimes.json"
+PROBE_TIMEOUT = 10
+PROBE_WORKERS = 4
+
+JAVA_EXE = "java.exe" if sys.platform == "win32" else "java"
+
+_PROPERTY = re.compile(r"^\s+([\w.]+) = (.*)$")
+# "     bool UseZGC                                   = false        {product} {default}"
+_GC_FLAG = re.compile(r"^\s*bool (Use(\w+)GC)\s")
+_GC_NAMES = {"G1": "G1", "Z": "ZGC", "Shenandoah": "Shenandoah", "Parallel": "Parallel", "Serial": "Serial"}
+# Que el flag aparezca en PrintFlagsFinal no quiere decir que el recolector esté compilado en el
+# binario (Oracle lista UseShenandoahGC igual): estos se confirman arrancando la JVM con ellos.
+_GC_CONFIRM = ("ZGC", "Shenandoah")
+# Sube cuando cambia lo que guarda probe_java, para que las entradas viejas del caché se vuelvan a probar
+PROBE_FORMAT = 3
+
+
+def _candidate_homes(minecraft_directory):
+    """Carpetas donde suele haber JDKs instalados, según el sistema."""
+    patterns = []
+
+    if minecraft_directory:
+        # Runtimes que baja el propio launcher (minecraft_launcher_lib / launcher oficial)
+        patterns.append(os.path.join(minecraft_directory, "runtime", "*", "*", "*"))
+
+    if sys.platform == "win32":
+        for base in filter(None, (os.getenv("ProgramFiles"), os.getenv("ProgramFiles(x86)"))):
+            for vendor in ("Java", "Eclipse Adoptium", "Zulu", "Microsoft", "BellSoft", "Amazon Corretto", "Semeru"):
+                patterns.append(os.path.join(base, vendor, "*"))
+
+        local = os.getenv("LOCALAPPDATA")
+
+        if local:
+            patterns.append(os.path.join(local, "Packages", "Microsoft.4297127D64EC6_8wekyb3d8bbwe", "LocalCache", "Local", "runtime", "*", "*", "*"))
+
+    elif sys.platform == "darwin":
+        patterns += [
+            "/Library/Java/JavaVirtualMachines/*/Contents/Home",
+            os.path.expanduser("~/Library/Java/JavaVirtualMachines/*/Contents/Home"),
+        ]
+
+    else:
+        patterns += ["/usr/lib/jvm/*", "/usr/java/*", "/opt/java/*", "/opt/jdk*", os.path.expanduser("~/.jdks/*")]
+
+    homes = [os.getenv("JAVA_HOME")] if os.getenv("JAVA_HOME") else []
+
+    for pattern in patterns:
+        homes.extend(glob.glob(pattern))
+
+    return homes
+
+
+def find_java_executables(minecraft_directory=None):
+    """Rutas reales (sin duplicados por symlinks) de los java que hay en el sistema y en el PATH."""
+    candidates = [os.path.join(home, "bin", JAVA_EXE) for home in _candidate_homes(minecraft_directory)]
+
+    on_path = shutil.which("java")
+
+    if on_path:
+        candidates.append(on_path)
+
+    found = {}
+
+    for path in candidates:
+        if os.path.isfile(path):
+            found.setdefault(os.path.realpath(path), None)
+
+    return list(found)
+
+
+def parse_java_major(version):
+    """"1.8.0_382" -> 8, "17.0.8" -> 17, "21" -> 21."""
+    parts = re.findall(r"\d+", version)
+
+    if not parts:
+        return None
+
+    major = int(parts[0])
+    return int(parts[1]) if major == 1 and len(parts) > 1 else major
+
+
+def _run_java(args):
+    kwargs = {"creationflags": subprocess.CREATE_NO_WINDOW} if sys.platform == "win32" else {}
+
+    return subprocess.run(
+        args,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        errors="replace",
+        timeout=PROBE_TIMEOUT,
+        **kwargs,
+    )
+
+
+def gc_usable(path, flags):
+    """True si la JVM arranca con esos flags (código de salida 0)."""
+    try:
+        result = _run_java([path] + flags + ["-version"])
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+    return result.returncode == 0
+
+
+def _confirm_gcs(path, listed, major):
+    """
+    Devuelve (recolectores usables, los que solo arrancan con -XX:+UnlockExperimentalVMOptions).
+
+    Se prueba con la misma lista de flags que afinador usa al lanzar: primero sin desbloquear
+    y, si falla, desbloqueando, para que el lanzamiento agregue el flag solo cuando hace falta.
+    """
+    gcs = []
+    experimental = []
+
+    for gc in sorted(listed):
+        if gc not in _GC_CONFIRM:
+            gcs.append(gc)
+        elif not isinstance(major, int):
+            continue
+        elif gc_usable(path, afinador.gc_flags(gc, major)):
+            gcs.append(gc)
+        elif gc_usable(path, afinador.gc_flags(gc, major, experimental=True)):
+            gcs.append(gc)
+            experimental.append(gc)
+
+    return gcs, experimental
+
+
+def probe_java(path):
+    """
+    Ejecuta el binario y devuelve su versión, proveedor, arquitectura y GCs.
+
+    -XshowSettings:properties va a stderr y -XX:+PrintFlagsFinal a stdout, así que
+    con un único proceso se obtiene casi todo; solo ZGC y Shenandoah se confirman
+    con un arranque aparte cada uno.
+    """
+    result = _run_java([path, "-XshowSettings:properties", "-XX:+PrintFlagsFinal", "-version"])
+
+    properties = {}
+
+    for line in result.stderr.splitlines():
+        match = _PROPERTY.match(line)
+
+        if match:
+            properties[match.group(1)] = match.group(2).strip()
+
+    listed = {_GC_NAMES[m.group(2)] for m in map(_GC_FLAG.match, result.stdout.splitlines()) if m and m.group(2) in _GC_NAMES}
+    version = properties.get("java.version", "")
+    major = parse_java_major(version)
+    gcs, experimental = _confirm_gcs(path, listed, major)
+
+    return {
+        "version": version,
+        "major": major,
+        "vendor": properties.get("java.vendor", ""),
+        "arch": properties.get("os.arch", ""),
+        "gcs": gcs,
+        "experimental_gcs": experimental,
+        "probe": PROBE_FORMAT,
+    }
+
+
+def _usable(info):
+    """Una entrada sirve si el binario arrancó y se pudo leer su versión mayor."""
+    return bool(info) and isinstance(info.get("major"), int)
+
+
+def _fingerprint(path):
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_size]
+
+
+class JavaRuntimes:
+    """Descubre instalaciones de Java y guarda lo que se averiguó de cada una (java_runtimes.json)."""
+    def __init__(self, cache_dir):
+        self.path = os.path.join(cache_dir, JAVA_CACHE_FILE)
+        self._lock = threading.Lock()
+        self.data = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+        except (json.JSONDecodeError, IOError):
+            return {}
+
+        return data if isinstance(data, dict) else {}
+
+    def _save(self):
+        tmp_path = self.path + ".tmp"
+
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.data, f)
+
+            os.replace(tmp_path, self.path)
+
+        except OSError as e:
+            print(f"Error al guardar el caché de Java: {e}")
+
+    def _probe_entry(self, path):
+        try:
+            info = probe_java(path)
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"No se pudo probar {path}: {e}")
+            info = None
+
+        return path, info
+
+    def scan(self, minecraft_directory=None):
+        """Devuelve {ruta: info} de todos los java encontrados. Solo se prueban los nuevos o modificados."""
+        paths = find_java_executables(minecraft_directory)
+        stale = []
+        runtimes = {}
+
+        with self._lock:
+            for path in paths:
+                try:
+                    fingerprint = _fingerprint(path)
+                except OSError:
+                    continue
+
+                entry = self.data.get(path)
+                info = entry.get("info") if entry else None
+
+                if entry and entry.get("fingerprint") == fingerprint and (info is None or info.get("probe") == PROBE_FORMAT):
+                    if _usable(info):
+                        runtimes[path] = info
+                else:
+                    stale.append((path, fingerprint))
+
+        if stale:
+            with ThreadPoolExecutor(max_workers=PROBE_WORKERS, thread_name_prefix="java-probe") as executor:
+                probed = list(executor.map(self._probe_entry, [path for path, _ in stale]))
+
+            with self._lock:
+                for (path, fingerprint), (_, info) in zip(stale, probed):
+                    # Un binario que no arranca también se guarda, para no volver a probarlo hasta que cambie
+                    self.data[path] = {"fingerprint": fingerprint, "info": info}
+
+                    if _usable(info):
+                        runtimes[path] = info
+
+                self._save()
+
+        return runtimes
+
+    def find_best(self, required_major, minecraft_directory=None):
+        """
+        El java más adecuado para una versión: (ruta, info) o (None, None).
+
+        Primero uno de la misma versión mayor. Si no hay y la versión pide 17 o más,
+        sirve el más cercano por encima; para Java 8 no, porque Forge viejo no arranca.
+        """
+        # scan() ya descarta las entradas sin versión mayor; esto cubre un caché editado a mano
+        runtimes = {path: info for path, info in self.scan(minecraft_directory).items() if _usable(info)}
+        is_64bit = sys.maxsize > 2 ** 32
+
+        if not isinstance(required_major, int):
+            return None, None
+
+        def rank(item):
+            path, info = item
+            return (
+                "64" in (info.get("arch") or "") or not is_64bit,
+                bool(minecraft_directory) and path.startswith(os.path.realpath(minecraft_directory)),
+                [int(n) for n in re.findall(r"\d+", info.get("version") or "")],
+            )
+
+        exact = [item for item in runtimes.items() if item[1]["major"] == required_major]
+
+        if exact:
+            return max(exact, key=rank)
+
+        if required_major >= 17:
+            newer = [item for item in runtimes.items() if item[1]["major"] > required_major]
+
+            if newer:
+                closest = min(info["major"] for _, info in newer)
+                return max((item for item in newer if item[1]["major"] == closest), key=rank)
+
+        return None, None
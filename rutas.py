@@ -0,0 +1,38 @@
+import os
+import sys
+
+# Rutas base del launcher. Este módulo no importa nada pesado a propósito: main.py lo usa
+# antes de cargar el resto (por ejemplo, para leer si el informe de imports está activado).
+
+APP_NAME = "MCLauncher"
+
+
+def get_app_data_dir():
+    """Obtiene la ruta al directorio de datos de la aplicación de forma multiplataforma."""
+    if sys.platform == "win32":
+        app_data_path = os.getenv("APPDATA")
+    elif sys.platform == "darwin":
+        app_data_path = os.path.join(os.path.expanduser("~"), "Library", "Application Support")
+    else:
+        app_data_path = os.path.join(os.path.expanduser("~"), ".config")
+
+    launcher_data_dir = os.path.join(app_data_path, APP_NAME)
+    os.makedirs(launcher_data_dir, exist_ok=True)
+
+    return launcher_data_dir
+
+
+def get_config_file():
+    return os.path.join(get_app_data_dir(), "config.json")
+
+
+def get_minecraft_directory():
+    """El .minecraft por defecto, igual que minecraft_launcher_lib.utils.get_minecraft_directory pero sin importarlo."""
+    home = os.path.expanduser("~")
+
+    if sys.platform == "win32":
+        return os.path.join(os.getenv("APPDATA", os.path.join(home, "AppData", "Roaming")), ".minecraft")
+    elif sys.platform == "darwin":
+        return os.path.join(home, "Library", "Application Support", "minecraft")
+
+    return os.path.join(home, ".minecraft")
@@ -0,0 +1,538 @@
+import os
+import re
+import json
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+AI_CACHE_FILE = "ai_suggestions_cache.json"
+DEFAULT_MODEL = "gemini-pro"
+CACHE_TTL = 24 * 60 * 60
+CACHE_MAX_ENTRIES = 200
+
+# Pedidos en lote: hilos simultáneos y ritmo de llamadas a la API (ráfaga inicial + pedidos por segundo)
+BATCH_WORKERS = 5
+RATE_BURST = 5
+RATE_PER_SECOND = 1.0
+
+SYSTEM_PROMPT = (
+    "You are a helpful assistant for a Minecraft launcher. "
+    "You must respond ONLY with a valid JSON array of objects. "
+    "Each object must have five keys: 'name', 'description', 'url', 'loader', and 'version'."
+)
+
+
+def normalize_prompt(prompt):
+    """Minúsculas, espacios colapsados y sin puntuación final: "Mods  de rendimiento!" == "mods de rendimiento"."""
+    return re.sub(r"\s+", " ", prompt).strip().lower().rstrip(".!?")
+
+
+def parse_suggestions(text):
+    """Convierte la respuesta del modelo (a veces envuelta en ```json) en la lista de mods."""
+    cleaned = text.strip().replace("```json", "").replace("```", "").strip()
+    return json.loads(cleaned)
+
+
+def _solo_mods(data):
+    """
+    Los objetos de la respuesta parseada, o None si no trae ninguno (p. ej. ["Sodium", "Lithium"]).
+
+    Todo lo que sigue (caché, catálogo, tarjetas) espera diccionarios; un array vacío sí vale.
+    """
+    data = data if isinstance(data, list) else [data]
+    mods = [item for item in data if isinstance(item, dict)]
+    return mods if mods or not data else None
+
+
+def _dedup_keys(mod):
+    """Claves por las que dos sugerencias son el mismo mod: el nombre sin símbolos y la URL sin esquema."""
+    keys = []
+    name = re.sub(r"[^a-z0-9]+", "", str(mod.get("name") or "").lower())
+    url = re.sub(r"^https?://(www\.)?", "", str(mod.get("url") or "").strip().lower()).rstrip("/")
+
+    if name:
+        keys.append("name:" + name)
+
+    if url:
+        keys.append("url:" + url)
+
+    return keys
+
+
+class SuggestionMerger:
+    """
+    Junta las listas de varios pedidos en una sola, sin repetidos (por nombre o URL).
+
+    Si el mismo mod aparece para varias versiones, queda una sola entrada con todas ellas
+    en "version". Se puede usar desde varios hilos a la vez.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._por_clave = {}
+        self.items = []
+
+    def add(self, mod):
+        """Devuelve la entrada nueva si el mod no estaba, o None si se fusionó con uno anterior."""
+        if not isinstance(mod, dict):
+            return None
+
+        keys = _dedup_keys(mod)
+
+        with self._lock:
+            existente = next((self._por_clave[k] for k in keys if k in self._por_clave), None)
+
+            if existente is None:
+                existente = dict(mod)
+                self.items.append(existente)
+                nuevo = existente
+            else:
+                nuevo = None
+                version = mod.get("version")
+                versiones = [v.strip() for v in str(existente.get("version") or "").split(",") if v.strip()]
+
+                if version and version not in versiones:
+                    existente["version"] = ", ".join(versiones + [version])
+
+                for campo in ("url", "description", "loader"):
+                    if not existente.get(campo) and mod.get(campo):
+                        existente[campo] = mod[campo]
+
+            for k in _dedup_keys(existente) + keys:
+                self._por_clave.setdefault(k, existente)
+
+            return nuevo
+
+
+class RateLimiter:
+    """Token bucket: permite una ráfaga de burst pedidos y después rate por segundo."""
+    def __init__(self, rate=RATE_PER_SECOND, burst=RATE_BURST):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._ultimo = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                ahora = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (ahora - self._ultimo) * self.rate)
+                self._ultimo = ahora
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                espera = (1 - self._tokens) / self.rate
+
+            time.sleep(espera)
+
+
+class JsonArrayStream:
+    """
+    Parser incremental de un array JSON de objetos que llega por pedazos.
+
+    feed() devuelve los objetos que se completaron con ese pedazo. Se ignora lo que venga
+    antes del "[" (```json, texto suelto), un objeto que no parsea se salta, y close()
+    intenta rescatar objetos sanos de una cola rota.
+    """
+    def __init__(self):
+        self._buf = ""
+        self._pos = 0
+        self._inicio = None
+        self._depth = 0
+        self._en_string = False
+        self._escape = False
+        self.saw_array = False
+        self.closed = False
+        self.skipped = 0
+
+    def feed(self, chunk):
+        if self.closed:
+            return []
+
+        self._buf += chunk
+        buf = self._buf
+        i = self._pos
+        items = []
+
+        while i < len(buf):
+            c = buf[i]
+
+            if not self.saw_array:
+                # Solo un "[" seguido de "{" o "]" abre el array: "Mods for [1.20.1]:" no cuenta
+                if c == "[":
+                    j = i + 1
+
+                    while j < len(buf) and buf[j].isspace():
+                        j += 1
+
+                    if j == len(buf):
+                        # Todavía no llegó lo que sigue: se decide con el próximo pedazo
+                        break
+
+                    self.saw_array = buf[j] in "{]"
+
+            elif self._en_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._en_string = False
+
+            elif c == '"':
+                self._en_string = True
+
+            elif c == "{":
+                if self._depth == 0:
+                    self._inicio = i
+
+                self._depth += 1
+
+            elif c == "}" and self._depth > 0:
+                self._depth -= 1
+
+                if self._depth == 0:
+                    self._emit(buf[self._inicio:i + 1], items)
+                    self._inicio = None
+
+            elif c == "]" and self._depth == 0:
+                self.closed = True
+                break
+
+            i += 1
+
+        # Solo se guarda lo que todavía puede formar parte de un objeto
+        corte = self._inicio if self._inicio is not None else i
+        self._buf = buf[corte:]
+        self._pos = i - corte
+
+        if self._inicio is not None:
+            self._inicio = 0
+
+        return items
+
+    def _emit(self, text, items):
+        try:
+            obj = json.loads(text)
+        except json.JSONDecodeError:
+            self.skipped += 1
+            return
+
+        if isinstance(obj, dict):
+            items.append(obj)
+
+    @property
+    def truncated(self):
+        """True si el texto terminó sin cerrar el array o con un objeto a medias."""
+        return self.saw_array and not self.closed
+
+    def close(self):
+        """Fin del stream: intenta rescatar objetos completos de un objeto sin cerrar (p. ej. llave de más)."""
+        tail = self._buf if self._inicio is not None else ""
+        self._buf = ""
+
+        for j in range(1, len(tail)):
+            # Solo llaves que empiezan un elemento del array (después de una coma), no objetos anidados
+            if tail[j] != "{" or tail[:j].rstrip()[-1:] != ",":
+                continue
+
+            rescatados = JsonArrayStream().feed("[" + tail[j:])
+
+            if rescatados:
+                return rescatados
+
+        return []
+
+
+class GeminiBackend:
+    """Cliente de Gemini que se configura una sola vez por API key y reutiliza el modelo."""
+    def __init__(self, genai, model_name=DEFAULT_MODEL):
+        self.genai = genai
+        self.model_name = model_name
+        self._api_key = None
+        self._model = None
+        self._lock = threading.Lock()
+
+    def _get_model(self, api_key):
+        with self._lock:
+            if self._model is None or api_key != self._api_key:
+                self.genai.configure(api_key=api_key)
+                self._model = self.genai.GenerativeModel(self.model_name)
+                self._api_key = api_key
+
+            return self._model
+
+    def generate(self, prompt, api_key):
+        response = self._get_model(api_key).generate_content(SYSTEM_PROMPT + "\n\nUser request: " + prompt)
+        return response.text
+
+    def generate_stream(self, prompt, api_key):
+        """Igual que generate(), pero va devolviendo el texto a medida que el modelo lo genera."""
+        response = self._get_model(api_key).generate_content(SYSTEM_PROMPT + "\n\nUser request: " + prompt, stream=True)
+
+        for chunk in response:
+            try:
+                yield chunk.text
+            except ValueError:
+                # Pedazo sin texto (p. ej. solo metadatos de seguridad)
+                continue
+
+
+class SuggestionCache:
+    """Respuestas ya parseadas por clave (modelo + prompt normalizado), con TTL y desalojo LRU."""
+    def __init__(self, cache_dir, ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES):
+        self.path = os.path.join(cache_dir, AI_CACHE_FILE)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.entries = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+
+        except (json.JSONDecodeError, IOError):
+            return {}
+
+        return entries if isinstance(entries, dict) else {}
+
+    def _save(self):
+        tmp_path = self.path + ".tmp"
+
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f)
+
+            os.replace(tmp_path, self.path)
+
+        except OSError as e:
+            print(f"Error al guardar el caché de sugerencias: {e}")
+
+    @staticmethod
+    def make_key(model_name, prompt):
+        return hashlib.sha1(f"{model_name}\n{normalize_prompt(prompt)}".encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        with self._lock:
+            entry = self.entries.get(key)
+
+            if entry is None:
+                return None
+
+            if time.time() - entry["created"] > self.ttl:
+                del self.entries[key]
+                return None
+
+            # El orden de uso solo vive en memoria; se persiste con el siguiente put()
+            entry["used"] = time.time()
+            return entry["result"]
+
+    def put(self, key, result):
+        with self._lock:
+            ahora = time.time()
+            self.entries[key] = {"created": ahora, "used": ahora, "result": result}
+
+            while len(self.entries) > self.max_entries:
+                oldest = min(self.entries, key=lambda k: self.entries[k]["used"])
+                del self.entries[oldest]
+
+            self._save()
+
+
+class _EnVuelo:
+    def __init__(self):
+        self.listo = threading.Event()
+        self.resultado = (None, None)
+
+
+class SuggestionService:
+    """
+    Sugerencias de mods con caché y sin pedidos duplicados.
+
+    backend es cualquier objeto con model_name y generate(prompt, api_key) -> texto
+    (y opcionalmente generate_stream), así que en pruebas se puede pasar uno falso en
+    lugar de GeminiBackend.
+    """
+    def __init__(self, cache, backend, limiter=None):
+        self.cache = cache
+        self.backend = backend
+        # Solo frena las llamadas reales a la API; el caché y los pedidos compartidos no cuentan
+        self.limiter = limiter
+        self._en_vuelo = {}
+        self._lock = threading.Lock()
+
+    def suggest(self, prompt, api_key, on_item=None):
+        """
+        Devuelve (lista de mods, None) o (None, mensaje de error).
+
+        Con on_item(mod) la respuesta se pide en streaming y cada mod se entrega apenas
+        se completa su objeto (también los que salen del caché o de un pedido compartido).
+        """
+        key = self.cache.make_key(self.backend.model_name, prompt)
+        cached = self.cache.get(key)
+
+        if cached is not None:
+            self._replay(cached, on_item)
+            return cached, None
+
+        with self._lock:
+            pedido = self._en_vuelo.get(key)
+            propio = pedido is None
+
+            if propio:
+                pedido = self._en_vuelo[key] = _EnVuelo()
+
+        # Si el mismo pedido ya está en curso, se espera su resultado en lugar de repetir la llamada
+        if not propio:
+            pedido.listo.wait()
+            self._replay(pedido.resultado[0], on_item)
+            return pedido.resultado
+
+        terminado = False
+
+        try:
+            if self.limiter is not None and api_key:
+                self.limiter.acquire()
+
+            if on_item is not None:
+                pedido.resultado, completo = self._call_stream(prompt, api_key, on_item)
+            else:
+                pedido.resultado, completo = self._call(prompt, api_key), True
+
+            terminado = True
+
+            # Una respuesta sin ningún mod no se guarda: lo más probable es que el modelo o el parser fallaran
+            if pedido.resultado[0] and completo:
+                self.cache.put(key, pedido.resultado[0])
+
+        finally:
+            # Si el dueño se cayó, los que esperaban reciben un error y no un éxito vacío
+            if not terminado:
+                pedido.resultado = (None, "The AI request failed.")
+
+            with self._lock:
+                del self._en_vuelo[key]
+
+            pedido.listo.set()
+
+        return pedido.resultado
+
+    def suggest_batch(self, prompts, api_key, on_item=None, workers=BATCH_WORKERS):
+        """
+        Hace varios pedidos a la vez (como mucho workers hilos) y junta los resultados.
+
+        Devuelve (lista sin repetidos, None), o (None, error) si fallaron todos. on_item(mod)
+        recibe cada mod nuevo apenas llega, sin los repetidos entre pedidos.
+        """
+        merger = SuggestionMerger()
+
+        def _item(mod):
+            nuevo = merger.add(mod)
+
+            # Una copia: la entrada del merger puede cambiar después (más versiones) y la UI compara tarjetas por valor
+            if nuevo is not None and on_item is not None:
+                on_item(dict(nuevo))
+
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(prompts))), thread_name_prefix="ia-lote") as executor:
+            futuros = [executor.submit(self.suggest, prompt, api_key, _item if on_item is not None else None) for prompt in prompts]
+            resultados = [futuro.result() for futuro in futuros]
+
+        errores = [error for _, error in resultados if error]
+
+        if len(errores) == len(resultados):
+            return None, errores[0] if errores else "No prompts to send."
+
+        for prompt, (_, error) in zip(prompts, resultados):
+            if error:
+                print(f"Falló el pedido en lote '{prompt}': {error}")
+
+        # Sin streaming, el orden final sigue el de los pedidos; con streaming ya se fusionaron al llegar
+        if on_item is None:
+            for mods, _ in resultados:
+                for mod in mods or []:
+                    merger.add(mod)
+
+        return merger.items, None
+
+    @staticmethod
+    def _replay(items, on_item):
+        if on_item is not None and items:
+            for item in items:
+                on_item(item)
+
+    def _call_stream(self, prompt, api_key, on_item):
+        """Devuelve ((mods, error), completo). Una respuesta cortada no se guarda en el caché."""
+        if not api_key:
+            return (None, "Google API Key not found."), False
+
+        generate_stream = getattr(self.backend, "generate_stream", None)
+        parser = JsonArrayStream()
+        items = []
+        texto = []
+
+        def _entregar(nuevos):
+            for item in nuevos:
+                items.append(item)
+                on_item(item)
+
+        try:
+            chunks = generate_stream(prompt, api_key) if generate_stream else [self.backend.generate(prompt, api_key)]
+
+            for chunk in chunks:
+                texto.append(chunk)
+                _entregar(parser.feed(chunk))
+
+        except Exception as e:
+            if not items:
+                mensaje = "The provided API Key is invalid." if "API_KEY_INVALID" in str(e) else str(e)
+                return (None, mensaje), False
+
+            print(f"El stream de la IA se cortó después de {len(items)} sugerencias: {e}")
+            return (items, None), False
+
+        if not parser.saw_array:
+            # No vino un array: se intenta como antes con el texto entero
+            try:
+                resultado = _solo_mods(parse_suggestions("".join(texto)))
+            except json.JSONDecodeError:
+                resultado = None
+
+            if resultado is None:
+                return (None, "AI returned an invalid format."), False
+
+            self._replay(resultado, on_item)
+            return (resultado, None), True
+
+        if parser.truncated:
+            _entregar(parser.close())
+
+        completo = not parser.truncated and parser.skipped == 0
+        return (items, None), completo
+
+    def _call(self, prompt, api_key):
+        if not api_key:
+            return None, "Google API Key not found."
+
+        try:
+            mods = _solo_mods(parse_suggestions(self.backend.generate(prompt, api_key)))
+
+        except json.JSONDecodeError:
+            mods = None
+
+        except Exception as e:
+            if "API_KEY_INVALID" in str(e):
+                return None, "The provided API Key is invalid."
+
+            return None, str(e)
+
+        if mods is None:
+            return None, "AI returned an invalid format."
+
+        return mods, None
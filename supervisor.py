@@ -0,0 +1,174 @@
+import os
+import gzip
+import shutil
+import threading
+import subprocess
+from collections import deque
+
+LOG_BUFFER_LINES = 2000
+# Como mucho esta cantidad de lotes por segundo hacia la UI, sin importar cuánto escriba el juego
+UI_FPS = 10
+# Si la UI no alcanza a consumir, se descartan las líneas pendientes más viejas
+MAX_PENDING_LINES = 1000
+
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUPS = 5
+
+
+class RotatingGzipLog:
+    """Archivo de log que rota al pasar max_bytes; los archivos viejos se comprimen con gzip."""
+    def __init__(self, path, max_bytes=LOG_MAX_BYTES, backups=LOG_BACKUPS):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+        self._size = self._file.tell()
+
+    def write_line(self, line):
+        data = line + "\n"
+
+        with self._lock:
+            self._file.write(data)
+            self._size += len(data)
+
+            if self._size >= self.max_bytes:
+                self._rotate()
+
+    def _rotate(self):
+        self._file.close()
+
+        # log.4.gz -> log.5.gz, ..., log -> log.1.gz
+        for i in range(self.backups - 1, 0, -1):
+            src = f"{self.path}.{i}.gz"
+
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{i + 1}.gz")
+
+        with open(self.path, "rb") as f_in, gzip.open(f"{self.path}.1.gz", "wb") as f_out:
+            shutil.copyfileobj(f_in, f_out)
+
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._size = 0
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class GameProcess:
+    """Supervisa el proceso del juego: lee stdout/stderr sin bloquear y entrega las líneas por lotes."""
+    def __init__(self, command, cwd, log_path, on_lines=None, fps=UI_FPS, max_lines=LOG_BUFFER_LINES, on_line=None):
+        """
+        on_lines(lista de líneas) se llama desde un hilo propio, a lo sumo fps veces por segundo,
+        y puede perder líneas si la UI no alcanza a consumirlas.
+
+        on_line(línea) se llama desde los hilos lectores con cada línea, antes de ese buffer, así
+        que no pierde ninguna: es para lo que no puede saltearse nada (telemetría, diagnóstico).
+        """
+        self.command = command
+        self.cwd = cwd
+        self.log_path = log_path
+        self.on_lines = on_lines
+        self.on_line = on_line
+        self.intervalo = 1 / fps
+
+        # Memoria constante: las últimas max_lines líneas y un tope de pendientes para la UI
+        self.lines = deque(maxlen=max_lines)
+        self._pending = deque(maxlen=MAX_PENDING_LINES)
+        self._lock = threading.Lock()
+        self._finished = threading.Event()
+
+        self.process = None
+        self.returncode = None
+        # True si lo cerró el usuario desde el launcher (no cuenta como crash)
+        self.killed = False
+        self._readers = []
+        self._log = None
+
+    @property
+    def pid(self):
+        return self.process.pid if self.process else None
+
+    def start(self):
+        self._log = RotatingGzipLog(self.log_path)
+
+        self.process = subprocess.Popen(
+            self.command,
+            cwd=self.cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            stdin=subprocess.DEVNULL,
+        )
+
+        for stream, prefix in ((self.process.stdout, ""), (self.process.stderr, "[stderr] ")):
+            reader = threading.Thread(target=self._read_stream, args=(stream, prefix), daemon=True)
+            reader.start()
+            self._readers.append(reader)
+
+        threading.Thread(target=self._flush_loop, daemon=True).start()
+
+    def _read_stream(self, stream, prefix):
+        for raw in iter(stream.readline, b""):
+            line = prefix + raw.decode("utf-8", errors="replace").rstrip("\r\n")
+
+            self._log.write_line(line)
+
+            if self.on_line is not None:
+                try:
+                    self.on_line(line)
+                except Exception as e:
+                    # Un consumidor roto no puede frenar la lectura: el juego se bloquearía con el pipe lleno
+                    print(f"Error procesando una línea del juego: {e}")
+
+            with self._lock:
+                self.lines.append(line)
+                self._pending.append(line)
+
+        stream.close()
+
+    def _take_pending(self):
+        with self._lock:
+            batch = list(self._pending)
+            self._pending.clear()
+
+        return batch
+
+    def _flush_loop(self):
+        while not self._finished.wait(self.intervalo):
+            batch = self._take_pending()
+
+            if batch and self.on_lines:
+                self.on_lines(batch)
+
+    def wait(self):
+        """Espera a que el juego termine y a que se lean todas sus líneas. Devuelve el código de salida."""
+        self.returncode = self.process.wait()
+
+        for reader in self._readers:
+            reader.join()
+
+        self._finished.set()
+
+        batch = self._take_pending()
+
+        if batch and self.on_lines:
+            self.on_lines(batch)
+
+        self._log.close()
+
+        return self.returncode
+
+    def kill(self):
+        if self.process and self.process.poll() is None:
+            self.killed = True
+            self.process.kill()
+
+    def tail(self, n=None):
+        """Copia de las últimas n líneas del buffer (todas si n es None)."""
+        with self._lock:
+            lines = list(self.lines)
+
+        return lines if n is None else lines[-n:]
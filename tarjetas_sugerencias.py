@@ -0,0 +1,188 @@
+import webbrowser
+
+import customtkinter as ctk
+
+from tema import COLOR_ACENTO, COLOR_ACENTO_HOVER, FUENTE_UI, PADDING_INTERNO, PADDING_WIDGET_X
+
+TARJETAS_VISIBLES = 10
+
+
+class TarjetaSugerencia(ctk.CTkFrame):
+    """Tarjeta de un mod. Se crea una sola vez y después solo se reconfigura con mostrar()."""
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+
+        self.mod = None
+        self._url = None
+
+        self.etiqueta_nombre = ctk.CTkLabel(self, text="", font=(FUENTE_UI[0], FUENTE_UI[1], "bold"), anchor="w")
+        self.etiqueta_nombre.pack(fill="x", padx=PADDING_INTERNO, pady=(PADDING_INTERNO, 0))
+
+        self.etiqueta_descripcion = ctk.CTkLabel(self, text="", wraplength=450, justify="left", anchor="w")
+        self.etiqueta_descripcion.pack(fill="x", padx=PADDING_INTERNO)
+
+        inferior = ctk.CTkFrame(self, fg_color="transparent")
+        inferior.pack(fill="x", padx=PADDING_INTERNO, pady=PADDING_INTERNO)
+        inferior.columnconfigure(2, weight=1)
+
+        self.etiqueta_loader = ctk.CTkLabel(inferior, text="", font=(FUENTE_UI[0], 12), text_color="gray")
+        self.etiqueta_loader.grid(row=0, column=0, sticky="w", padx=(0, PADDING_WIDGET_X))
+
+        self.etiqueta_version = ctk.CTkLabel(inferior, text="", font=(FUENTE_UI[0], 12), text_color="gray")
+        self.etiqueta_version.grid(row=0, column=1, sticky="w")
+
+        # Solo las sugerencias de la IA pasan por el catálogo; una no verificada puede ser inventada
+        self.etiqueta_catalogo = ctk.CTkLabel(inferior, text="", font=(FUENTE_UI[0], 12))
+        self.etiqueta_catalogo.grid(row=0, column=2, sticky="w", padx=PADDING_WIDGET_X)
+
+        self.boton = ctk.CTkButton(inferior, text="", hover_color=COLOR_ACENTO_HOVER, command=self._abrir_url)
+        self.boton.grid(row=0, column=3, sticky="e")
+
+    def mostrar(self, mod):
+        """Pone los datos de mod en la tarjeta. Si es el mismo mod que ya muestra, no toca nada."""
+        if mod == self.mod:
+            return False
+
+        self.mod = mod
+        self._url = mod.get("url")
+
+        self.etiqueta_nombre.configure(text=mod.get("name", "Unnamed Mod"))
+        self.etiqueta_descripcion.configure(text=mod.get("description", "No description."))
+        self.etiqueta_loader.configure(text=f"Loader: {mod.get('loader', 'N/A')}")
+        self.etiqueta_version.configure(text=f"Version: {mod.get('version', 'N/A')}")
+
+        if "verified" in mod:
+            self.etiqueta_catalogo.configure(
+                text="In catalog" if mod["verified"] else "Not in catalog",
+                text_color="green" if mod["verified"] else "orange",
+            )
+        else:
+            self.etiqueta_catalogo.configure(text="")
+
+        self.boton.configure(
+            text="Go to Page" if self._url else "No URL",
+            state="normal" if self._url else "disabled",
+            fg_color=COLOR_ACENTO if self._url else "gray50",
+        )
+
+        return True
+
+    def _abrir_url(self):
+        if self._url:
+            webbrowser.open(self._url)
+
+
+class PanelSugerencias(ctk.CTkScrollableFrame):
+    """
+    Lista de sugerencias con un pool de tarjetas que se reciclan entre búsquedas.
+
+    Nunca hay más de tarjetas_visibles tarjetas: el resto de los resultados se dibuja
+    recién cuando el usuario pasa de página, reutilizando las mismas tarjetas.
+    """
+    def __init__(self, master, tarjetas_visibles=TARJETAS_VISIBLES, **kwargs):
+        super().__init__(master, **kwargs)
+
+        self.tarjetas_visibles = tarjetas_visibles
+        self.items = []
+        self.offset = 0
+        # Las tarjetas se crean a medida que hacen falta, hasta el tope, y después solo se reconfiguran
+        self.tarjetas = []
+
+        self.columnconfigure(0, weight=1)
+
+        self.etiqueta_mensaje = ctk.CTkLabel(self, text="", font=FUENTE_UI, text_color="gray50")
+
+        self.marco_paginas = ctk.CTkFrame(self, fg_color="transparent")
+        self.marco_paginas.columnconfigure(1, weight=1)
+
+        self.boton_anterior = ctk.CTkButton(
+            self.marco_paginas, text="< Previous", width=100, command=lambda: self.cambiar_pagina(-1),
+            fg_color=COLOR_ACENTO, hover_color=COLOR_ACENTO_HOVER,
+        )
+        self.boton_anterior.grid(row=0, column=0, sticky="w")
+
+        self.etiqueta_pagina = ctk.CTkLabel(self.marco_paginas, text="", font=(FUENTE_UI[0], 12), text_color="gray")
+        self.etiqueta_pagina.grid(row=0, column=1)
+
+        self.boton_siguiente = ctk.CTkButton(
+            self.marco_paginas, text="Next >", width=100, command=lambda: self.cambiar_pagina(1),
+            fg_color=COLOR_ACENTO, hover_color=COLOR_ACENTO_HOVER,
+        )
+        self.boton_siguiente.grid(row=0, column=2, sticky="e")
+
+    def clear(self):
+        self.items = []
+        self.offset = 0
+        self.etiqueta_mensaje.grid_remove()
+        self._render()
+
+    def set_message(self, texto, pady=20):
+        """Oculta las tarjetas y muestra solo un mensaje (error, lista vacía, instrucciones...)."""
+        self.clear()
+        self.etiqueta_mensaje.configure(text=texto)
+        self.etiqueta_mensaje.grid(row=0, column=0, pady=pady)
+
+    def set_items(self, mods):
+        """Reemplaza los resultados y vuelve a la primera página."""
+        self.items = list(mods)
+        self.offset = 0
+        self.etiqueta_mensaje.grid_remove()
+        return self._render()
+
+    def append(self, mod):
+        """Agrega un resultado (p. ej. uno que llegó por streaming). Solo se dibuja si cae en la página actual."""
+        self.items.append(mod)
+        self.etiqueta_mensaje.grid_remove()
+        indice = len(self.items) - 1
+
+        if indice - self.offset < self.tarjetas_visibles:
+            self._mostrar_en(indice - self.offset, mod)
+
+        self._actualizar_paginas()
+
+    def cambiar_pagina(self, paginas):
+        max_offset = max(0, (len(self.items) - 1) // self.tarjetas_visibles * self.tarjetas_visibles)
+        self.offset = min(max(0, self.offset + paginas * self.tarjetas_visibles), max_offset)
+        self._render()
+        self._parent_canvas.yview_moveto(0)
+
+    def _tarjeta(self, posicion):
+        while len(self.tarjetas) <= posicion:
+            tarjeta = TarjetaSugerencia(self)
+            tarjeta.grid(row=len(self.tarjetas) + 1, column=0, sticky="ew", padx=PADDING_INTERNO, pady=PADDING_INTERNO)
+            self.tarjetas.append(tarjeta)
+
+        return self.tarjetas[posicion]
+
+    def _mostrar_en(self, posicion, mod):
+        tarjeta = self._tarjeta(posicion)
+        cambio = tarjeta.mostrar(mod)
+        tarjeta.grid()
+        return cambio
+
+    def _render(self):
+        """Sincroniza el pool con la página actual. Devuelve cuántas tarjetas se reconfiguraron."""
+        pagina = self.items[self.offset:self.offset + self.tarjetas_visibles]
+        reconfiguradas = 0
+
+        for posicion, mod in enumerate(pagina):
+            reconfiguradas += self._mostrar_en(posicion, mod)
+
+        for tarjeta in self.tarjetas[len(pagina):]:
+            tarjeta.grid_remove()
+
+        self._actualizar_paginas()
+        return reconfiguradas
+
+    def _actualizar_paginas(self):
+        total = len(self.items)
+
+        if total <= self.tarjetas_visibles:
+            self.marco_paginas.grid_remove()
+            return
+
+        fin = min(self.offset + self.tarjetas_visibles, total)
+        self.etiqueta_pagina.configure(text=f"{self.offset + 1}-{fin} of {total}")
+        self.boton_anterior.configure(state="normal" if self.offset > 0 else "disabled")
+        self.boton_siguiente.configure(state="normal" if fin < total else "disabled")
+        self.marco_paginas.grid(row=self.tarjetas_visibles + 1, column=0, sticky="ew", padx=PADDING_INTERNO, pady=PADDING_INTERNO)
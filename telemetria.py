@@ -0,0 +1,249 @@
+import os
+import re
+import math
+import json
+import time
+import threading
+
+TELEMETRY_DIR_NAME = "telemetry"
+SUMMARY_FILE = "telemetry_summary.json"
+SAMPLE_INTERVAL = 2.0
+# Pausas de GC recientes que se guardan por versión para calcular los percentiles
+MAX_PAUSES_PER_VERSION = 5000
+MAX_SESSIONS_PER_VERSION = 50
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+_CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+# Logging unificado (Java 9+): "[1.234s][info][gc] GC(3) Pause Young (Normal) (G1 Evacuation Pause) 24M->4M(256M) 3.456ms"
+_GC_UNIFIED = re.compile(r"GC\(\d+\) Pause .*?(\d+)M->(\d+)M\(\d+M\) ([\d.]+)ms")
+# -verbose:gc de Java 8: "[GC (Allocation Failure)  33280K->5000K(125952K), 0.0123456 secs]"
+_GC_LEGACY = re.compile(r"\[(?:Full )?GC.*?(\d+)K->(\d+)K\(\d+K\), ([\d.]+) secs\]")
+
+
+def proc_available():
+    return os.path.isdir("/proc/self")
+
+
+def read_proc_sample(pid):
+    """Devuelve (rss en KB, tiempo de CPU en ms, hilos) leyendo /proc, o None si el proceso ya no existe."""
+    try:
+        with open(f"/proc/{pid}/stat", "r") as f:
+            stat = f.read()
+
+        with open(f"/proc/{pid}/statm", "r") as f:
+            rss_pages = int(f.read().split()[1])
+
+    except (OSError, IndexError, ValueError):
+        return None
+
+    # El nombre del proceso va entre paréntesis y puede tener espacios: se parte después del último ')'
+    fields = stat[stat.rindex(")") + 2:].split()
+    utime, stime, threads = int(fields[11]), int(fields[12]), int(fields[17])
+
+    return rss_pages * _PAGE_SIZE // 1024, (utime + stime) * 1000 // _CLK_TCK, threads
+
+
+def parse_gc_line(line):
+    """Devuelve (pausa en ms, MB antes, MB después) si la línea es una pausa de GC, o None."""
+    if "GC" not in line:
+        return None
+
+    match = _GC_UNIFIED.search(line)
+
+    if match:
+        return float(match.group(3)), int(match.group(1)), int(match.group(2))
+
+    match = _GC_LEGACY.search(line)
+
+    if match:
+        return float(match.group(3)) * 1000, int(match.group(1)) // 1024, int(match.group(2)) // 1024
+
+    return None
+
+
+def percentile(values, p):
+    """Percentil por rango más cercano; values ya ordenados."""
+    if not values:
+        return None
+
+    index = max(0, min(len(values) - 1, math.ceil(p / 100 * len(values)) - 1))
+    return values[index]
+
+
+class SessionRecorder:
+    """
+    Telemetría de una sesión del juego.
+
+    Un hilo muestrea RSS, tiempo de CPU e hilos del proceso cada intervalo y las
+    pausas de GC se sacan de la salida del juego. Todo se escribe en un CSV de la
+    sesión: filas "S,t,rss_kb,cpu_ms,hilos" y "G,t,pausa_ms,mb_antes,mb_despues".
+    """
+    def __init__(self, pid, version_id, telemetry_dir, interval=SAMPLE_INTERVAL):
+        self.pid = pid
+        self.version_id = version_id
+        self.interval = interval
+        self.inicio = time.time()
+
+        session_dir = os.path.join(telemetry_dir, version_id)
+        os.makedirs(session_dir, exist_ok=True)
+        self.path = os.path.join(session_dir, time.strftime("%Y%m%d-%H%M%S", time.localtime(self.inicio)) + f"-{pid}.csv")
+
+        self.peak_rss_kb = 0
+        self.cpu_ms = 0
+        self.max_threads = 0
+        self.peak_heap_mb = 0
+        # Ocupación después de cada GC: lo que sigue vivo, que no depende del -Xmx elegido
+        self.live_heap_mb = 0
+        self.pauses = []
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._thread = None
+
+    def start(self):
+        if proc_available():
+            self._thread = threading.Thread(target=self._sample_loop, daemon=True)
+            self._thread.start()
+
+    def _elapsed(self):
+        return round(time.time() - self.inicio, 2)
+
+    def _sample_loop(self):
+        while not self._stop.wait(self.interval):
+            sample = read_proc_sample(self.pid)
+
+            if sample is None:
+                break
+
+            rss_kb, cpu_ms, threads = sample
+
+            with self._lock:
+                self.peak_rss_kb = max(self.peak_rss_kb, rss_kb)
+                self.cpu_ms = cpu_ms
+                self.max_threads = max(self.max_threads, threads)
+                self._file.write(f"S,{self._elapsed()},{rss_kb},{cpu_ms},{threads}\n")
+
+    def feed_lines(self, lines):
+        """Recibe las líneas de salida del juego y registra las pausas de GC que encuentre."""
+        for line in lines:
+            pause = parse_gc_line(line)
+
+            if pause is None:
+                continue
+
+            with self._lock:
+                self.pauses.append(pause[0])
+                # La ocupación del heap justo antes de una pausa es lo más cerca que se tiene del pico real
+                self.peak_heap_mb = max(self.peak_heap_mb, pause[1])
+                self.live_heap_mb = max(self.live_heap_mb, pause[2])
+                self._file.write(f"G,{self._elapsed()},{pause[0]},{pause[1]},{pause[2]}\n")
+
+    def stop(self):
+        """Cierra la sesión y devuelve su resumen."""
+        self._stop.set()
+
+        if self._thread is not None:
+            self._thread.join()
+
+        with self._lock:
+            self._file.close()
+
+            return {
+                "start": self.inicio,
+                "duration_s": round(time.time() - self.inicio, 1),
+                "peak_rss_mb": self.peak_rss_kb // 1024,
+                "peak_heap_mb": self.peak_heap_mb,
+                "live_heap_mb": self.live_heap_mb,
+                "cpu_s": round(self.cpu_ms / 1000, 1),
+                "max_threads": self.max_threads,
+                "gc_pauses": len(self.pauses),
+                "file": os.path.basename(self.path),
+            }, list(self.pauses)
+
+
+class TelemetryStore:
+    """Sesiones grabadas por versión y el resumen acumulado (telemetry_summary.json)."""
+    def __init__(self, app_data_dir):
+        self.dir = os.path.join(app_data_dir, TELEMETRY_DIR_NAME)
+        self.path = os.path.join(app_data_dir, SUMMARY_FILE)
+        self._lock = threading.Lock()
+        self.data = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+        except (json.JSONDecodeError, IOError):
+            return {}
+
+        return data if isinstance(data, dict) else {}
+
+    def _save(self):
+        tmp_path = self.path + ".tmp"
+
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.data, f)
+
+            os.replace(tmp_path, self.path)
+
+        except OSError as e:
+            print(f"Error al guardar la telemetría: {e}")
+
+    def start_session(self, pid, version_id, interval=SAMPLE_INTERVAL):
+        recorder = SessionRecorder(pid, version_id, self.dir, interval)
+        recorder.start()
+        return recorder
+
+    def finish_session(self, recorder):
+        session, pauses = recorder.stop()
+
+        with self._lock:
+            entry = self.data.setdefault(recorder.version_id, {"sessions": [], "pauses": []})
+            sessions = entry["sessions"] + [session]
+            entry["sessions"] = sessions[-MAX_SESSIONS_PER_VERSION:]
+            entry["pauses"] = (entry["pauses"] + pauses)[-MAX_PAUSES_PER_VERSION:]
+            self._save()
+
+        # El CSV de cada sesión que sale del resumen se borra con ella
+        for old in sessions[:-MAX_SESSIONS_PER_VERSION]:
+            if old.get("file"):
+                try:
+                    os.remove(os.path.join(self.dir, recorder.version_id, old["file"]))
+                except OSError:
+                    pass
+
+        return session
+
+    def summary(self, version_id):
+        """Memoria pico y percentiles de pausas de GC de una versión, o None si no hay sesiones."""
+        with self._lock:
+            entry = self.data.get(version_id)
+
+            if not entry or not entry["sessions"]:
+                return None
+
+            # Sin /proc (Windows, macOS) no hay muestras de memoria, solo pausas de GC
+            peaks = sorted(s["peak_rss_mb"] for s in entry["sessions"] if s["peak_rss_mb"])
+            heaps = sorted(s.get("peak_heap_mb", 0) for s in entry["sessions"] if s.get("peak_heap_mb"))
+            lives = sorted(s.get("live_heap_mb", 0) for s in entry["sessions"] if s.get("live_heap_mb"))
+            pauses = sorted(entry["pauses"])
+
+        return {
+            "sessions": len(entry["sessions"]),
+            "peak_rss_mb": peaks[-1] if peaks else None,
+            "peak_rss_p50_mb": percentile(peaks, 50),
+            "peak_heap_mb": heaps[-1] if heaps else None,
+            "live_heap_mb": lives[-1] if lives else None,
+            "gc_pauses": len(pauses),
+            "gc_p50_ms": percentile(pauses, 50),
+            "gc_p95_ms": percentile(pauses, 95),
+            "gc_p99_ms": percentile(pauses, 99),
+            "gc_max_ms": pauses[-1] if pauses else None,
+        }
@@ -0,0 +1,17 @@
+# Constantes de la UI (colores, espaciados y fuentes), compartidas por main.py y los widgets propios
+COLOR_ACENTO = "#4caf50"
+COLOR_ACENTO_HOVER = "#45a049"
+COLOR_FONDO_PRINCIPAL = "#3b3b3b"
+
+PADDING_EXTERIOR = 20
+PADDING_SECCION = 8
+PADDING_WIDGET_X = 10
+PADDING_WIDGET_Y = 10
+PADDING_INTERNO = 5
+
+FUENTE_UI = ("Jetbrains Mono", 14)
+FUENTE_TITULO = ("Monocraft", 20)
+FUENTE_ESTADO = ("Monocraft", 16)
+FUENTE_BOTON_LANZAR = ("Monocraft", 20)
+FUENTE_ENCABEZADO = ("Monocraft", 16)
+FUENTE_LOG = ("Jetbrains Mono", 12)
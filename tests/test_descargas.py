@@ -0,0 +1,110 @@
+import os
+import json
+import hashlib
+import threading
+import functools
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+import pytest
+
+pytest.importorskip("requests")
+
+import descargas
+
+
+class _HandlerSilencioso(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def servidor(tmp_path):
+    """Servidor HTTP local que sirve los archivos de tmp_path/remoto."""
+    raiz = tmp_path / "remoto"
+    raiz.mkdir()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(_HandlerSilencioso, directory=str(raiz)))
+    hilo = threading.Thread(target=server.serve_forever, daemon=True)
+    hilo.start()
+
+    yield raiz, f"http://127.0.0.1:{server.server_address[1]}"
+
+    server.shutdown()
+    server.server_close()
+
+
+def _jobs(raiz, url, destino, cantidad=5):
+    jobs = []
+
+    for i in range(cantidad):
+        contenido = f"archivo {i}".encode() * 100
+        (raiz / f"f{i}.bin").write_bytes(contenido)
+        jobs.append(descargas.DownloadJob(
+            f"{url}/f{i}.bin",
+            str(destino / "sub" / f"f{i}.bin"),
+            hashlib.sha1(contenido).hexdigest(),
+            len(contenido),
+        ))
+
+    return jobs
+
+
+def test_download_all_con_diario(servidor, tmp_path):
+    raiz, url = servidor
+    mc_dir = tmp_path / "minecraft"
+    jobs = _jobs(raiz, url, mc_dir)
+
+    journal = descargas.DownloadJournal(str(tmp_path / "journal.json"))
+    sesion = descargas.DownloadJournal.session_key("1.20.1", str(mc_dir))
+    journal.begin_install("1.20.1", str(mc_dir))
+
+    downloader = descargas.ParallelDownloader(workers=3, journal=journal, journal_session=sesion)
+
+    try:
+        downloader.download_all(jobs)
+    finally:
+        downloader.close()
+
+    for job in jobs:
+        assert descargas.is_file_valid(job.path, job.sha1, job.size)
+
+    # El diario quedó guardado en disco y agrupado por la instalación
+    with open(tmp_path / "journal.json", encoding="utf-8") as f:
+        guardado = json.load(f)
+
+    assert set(guardado["verified"][sesion]) == {os.path.abspath(job.path) for job in jobs}
+    assert all(journal.is_verified(job, sesion) for job in jobs)
+
+    # Después de la descarga el diario sigue usable para cerrar la instalación
+    journal.finish_install("1.20.1", str(mc_dir))
+    assert journal.incomplete_installs(str(mc_dir)) == set()
+    assert sesion not in journal.verified
+
+
+def test_download_all_salta_lo_verificado(servidor, tmp_path):
+    raiz, url = servidor
+    mc_dir = tmp_path / "minecraft"
+    jobs = _jobs(raiz, url, mc_dir, cantidad=3)
+
+    journal = descargas.DownloadJournal(str(tmp_path / "journal.json"))
+    sesion = descargas.DownloadJournal.session_key("1.20.1", str(mc_dir))
+    journal.begin_install("1.20.1", str(mc_dir))
+
+    primero = descargas.ParallelDownloader(workers=2, journal=journal, journal_session=sesion)
+
+    try:
+        primero.download_all(jobs)
+    finally:
+        primero.close()
+
+    # Si el servidor ya no tiene los archivos, solo el diario puede evitar que se vuelvan a pedir
+    for archivo in raiz.iterdir():
+        archivo.unlink()
+
+    reanudado = descargas.DownloadJournal(str(tmp_path / "journal.json"))
+    segundo = descargas.ParallelDownloader(workers=2, retries=0, journal=reanudado, journal_session=sesion)
+
+    try:
+        assert not any(segundo.download(job) for job in jobs)
+    finally:
+        segundo.close()
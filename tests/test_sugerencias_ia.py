@@ -0,0 +1,166 @@
+import json
+import threading
+
+import pytest
+
+import sugerencias_ia
+
+MODS = [
+    {"name": "Sodium", "description": "Rendering", "url": "https://modrinth.com/mod/sodium", "loader": "Fabric", "version": "1.20.1"},
+    {"name": "Lithium", "description": "Server logic", "url": "https://modrinth.com/mod/lithium", "loader": "Fabric", "version": "1.20.1"},
+]
+
+
+class BackendFalso:
+    """Backend sin red: devuelve respuesta y cuenta las llamadas. Con bloqueo, espera hasta que se libere."""
+    model_name = "falso"
+
+    def __init__(self, respuesta, bloqueo=None):
+        self.respuesta = respuesta
+        self.bloqueo = bloqueo
+        self.llamadas = 0
+        self.entro = threading.Event()
+
+    def generate(self, prompt, api_key):
+        self.llamadas += 1
+        self.entro.set()
+
+        if self.bloqueo is not None:
+            self.bloqueo.wait(5)
+
+        return self.respuesta
+
+
+class EventoAvisa(threading.Event):
+    """Event que avisa cuando alguien empieza a esperarlo."""
+    def __init__(self):
+        super().__init__()
+        self.esperando = threading.Event()
+
+    def wait(self, timeout=None):
+        self.esperando.set()
+        return super().wait(timeout)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return sugerencias_ia.SuggestionCache(str(tmp_path))
+
+
+def _en_hilo(fn, *args):
+    resultado = {}
+    hilo = threading.Thread(target=lambda: resultado.setdefault("valor", fn(*args)))
+    hilo.start()
+    return hilo, resultado
+
+
+def _esperar_pedido_compartido(service, prompt):
+    """Cambia el evento del pedido en curso por uno que avisa cuando otro hilo se pone a esperarlo."""
+    key = service.cache.make_key(service.backend.model_name, prompt)
+
+    with service._lock:
+        pedido = service._en_vuelo[key]
+        pedido.listo = EventoAvisa()
+
+    return pedido.listo.esperando
+
+
+def test_pedidos_iguales_se_comparten(cache):
+    liberar = threading.Event()
+    backend = BackendFalso(json.dumps(MODS), bloqueo=liberar)
+    service = sugerencias_ia.SuggestionService(cache, backend)
+
+    dueno, r_dueno = _en_hilo(service.suggest, "performance mods", "clave")
+    assert backend.entro.wait(5)
+
+    esperando = _esperar_pedido_compartido(service, "performance mods")
+    otro, r_otro = _en_hilo(service.suggest, "  Performance   mods!", "clave")
+    assert esperando.wait(5)
+
+    liberar.set()
+    dueno.join(5)
+    otro.join(5)
+
+    assert backend.llamadas == 1
+    assert r_dueno["valor"] == r_otro["valor"] == (MODS, None)
+
+
+def test_si_el_dueno_falla_los_que_esperan_reciben_error(cache):
+    liberar = threading.Event()
+
+    class LimitadorRoto:
+        entro = threading.Event()
+
+        def acquire(self):
+            self.entro.set()
+            liberar.wait(5)
+            raise RuntimeError("limitador roto")
+
+    limitador = LimitadorRoto()
+    service = sugerencias_ia.SuggestionService(cache, BackendFalso(json.dumps(MODS)), limiter=limitador)
+
+    fallo = []
+
+    def _dueno():
+        try:
+            service.suggest("mods", "clave")
+        except RuntimeError as e:
+            fallo.append(e)
+
+    dueno = threading.Thread(target=_dueno)
+    dueno.start()
+    assert limitador.entro.wait(5)
+
+    esperando = _esperar_pedido_compartido(service, "mods")
+    otro, r_otro = _en_hilo(service.suggest, "mods", "clave")
+    assert esperando.wait(5)
+
+    liberar.set()
+    dueno.join(5)
+    otro.join(5)
+
+    assert fallo
+    mods, error = r_otro["valor"]
+    assert mods is None
+    assert error
+
+
+def test_el_cache_vence_con_el_ttl(tmp_path):
+    cache = sugerencias_ia.SuggestionCache(str(tmp_path), ttl=60)
+    backend = BackendFalso(json.dumps(MODS))
+    service = sugerencias_ia.SuggestionService(cache, backend)
+
+    assert service.suggest("mods", "clave") == (MODS, None)
+    assert service.suggest("mods", "clave") == (MODS, None)
+    assert backend.llamadas == 1
+
+    # Pasado el TTL se vuelve a pedir
+    for entry in cache.entries.values():
+        entry["created"] -= 120
+
+    assert service.suggest("mods", "clave") == (MODS, None)
+    assert backend.llamadas == 2
+
+
+def test_una_respuesta_vacia_no_se_guarda(cache):
+    backend = BackendFalso("[]")
+    service = sugerencias_ia.SuggestionService(cache, backend)
+
+    assert service.suggest("mods", "clave") == ([], None)
+    assert service.suggest("mods", "clave") == ([], None)
+    assert backend.llamadas == 2
+    assert cache.entries == {}
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_una_respuesta_sin_objetos_es_un_error(cache, streaming):
+    backend = BackendFalso('["Sodium", "Lithium"]')
+    service = sugerencias_ia.SuggestionService(cache, backend)
+    recibidos = []
+
+    mods, error = service.suggest("mods", "clave", recibidos.append if streaming else None)
+
+    assert mods is None
+    assert error == "AI returned an invalid format."
+    assert recibidos == []
+    assert cache.entries == {}